@@ -0,0 +1,90 @@
+"""Time digest rendering: the original string concatenation vs compiled templates
+
+Renders the HTML digest for 10, 1k and 10k articles with the original
+`html_content +=` loop, with a cold fragment cache and with a warm one,
+and renders the plain-text part from a warm cache.
+
+Usage: python benchmarks/bench_digest.py [--sizes 10,1000,10000] [--output results.json]
+"""
+import argparse
+from datetime import datetime
+
+from common import load_scraper_module, measure, write_results
+
+
+def legacy_generate_email_content(articles):
+    """The original renderer, quadratic in the number of articles"""
+    html_content = f"""
+        <html>
+        <body>
+            <div class="header">
+                <h1>African Startup Daily Digest</h1>
+                <p><strong>Date:</strong> {datetime.now().strftime('%B %d, %Y')}</p>
+            </div>
+            <div style="padding: 20px;">
+                <p><strong>Found {len(articles)} new startup launches today!</strong></p>
+        """
+    for article in articles:
+        html_content += f"""
+                <div class="article">
+                    <h3>{article.title}</h3>
+                    <p><span class="source">{article.source}</span> <span class="date">{article.date}</span></p>
+                    <div class="description">{article.description}</div>
+                    <a href="{article.url}" class="read-more" target="_blank">Read Full Story</a>
+                </div>
+            """
+    html_content += """
+            </div>
+        </body>
+        </html>
+        """
+    return html_content
+
+
+def make_articles(ss, count):
+    return [
+        ss.StartupNews(
+            title=f'Startup {i} launches a new payments app in Lagos',
+            url=f'https://news.example/2026/10/startup-{i}-launches-app',
+            description=('Startup %d today unveiled a product aimed at small merchants & informal traders. ' % i) * 3,
+            source='Techcabal',
+            date='2026-10-17T08:00:00+00:00',
+            matched_signal='launch'
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10,1000,10000')
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    scraper = ss.AfricanStartupScraper()
+    results = {}
+    for size in [int(s) for s in args.sizes.split(',')]:
+        articles = make_articles(ss, size)
+        repeat = 5 if size <= 1000 else 3
+
+        def cold():
+            scraper.digest_renderer = ss.DigestRenderer(cache_size=size)
+            return scraper.generate_email_content(articles)
+
+        scraper.digest_renderer = ss.DigestRenderer(cache_size=size)
+        digest = scraper.build_digest(articles)
+        html_content, text_content = digest.build()
+        results[str(size)] = {
+            'legacy_concat': measure(lambda: legacy_generate_email_content(articles), repeat),
+            'template_cold': measure(cold, repeat),
+            'template_warm': measure(digest.html, repeat),
+            'text_part': measure(digest.text, repeat),
+            'html_bytes': len(html_content.encode()),
+            'text_bytes': len(text_content.encode())
+        }
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
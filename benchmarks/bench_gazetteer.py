@@ -0,0 +1,118 @@
+"""Load time and batch throughput of the startup gazetteer index
+
+Extends the shipped gazetteer with synthetic company names up to --names
+entries, then times compiling the index, loading the compiled index from
+disk, and tagging batches of synthetic articles whose descriptions grow
+from one to several paragraphs, so the cost per megabyte shows whether
+tagging stays linear in text length. A naive baseline that checks every
+name against every article runs on a small sample for comparison.
+
+Usage: python benchmarks/bench_gazetteer.py [--names 5000] [--articles 5000] [--repeat 5] [--output results.json]
+"""
+import argparse
+import os
+import random
+import time
+
+from common import load_scraper_module, measure, write_results
+from fixtures import CITIES, COUNTRIES, HEADLINE_TEMPLATES, PRODUCTS, SECTORS
+
+SYLLABLES = ['ka', 'zu', 'lo', 'mi', 'ra', 'ten', 'bo', 'sa', 'ny', 'we', 'pa', 'di', 'ko', 'fu', 'ya', 'ngo']
+SUFFIXES = ['', '', ' Pay', ' Health', ' Labs', ' Africa', ' Logistics', ' Farms', ' Learn', ' Energy']
+CATEGORIES = ['Fintech', 'Healthtech', 'Agritech', 'Edtech', 'Logistics', 'E-commerce', 'Energy', 'Mobility']
+FILLER = ('The company said the new product will reach customers in {city} and other cities over the '
+          'coming months, as investors in {country} return to early-stage deals. ')
+
+
+def synthetic_gazetteer(rng, count):
+    """Gazetteer lines for count made-up companies, some with aliases"""
+    lines = []
+    for i in range(count):
+        name = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).title() + rng.choice(SUFFIXES)
+        aliases = f'{name} Ltd' if i % 4 == 0 else ''
+        lines.append(f'{name}\t{rng.choice(CATEGORIES)}\t{aliases}')
+    return lines
+
+
+def synthetic_articles(ss, rng, names, count, paragraphs):
+    """Articles with headlines naming known and unknown companies"""
+    articles = []
+    for i in range(count):
+        name = rng.choice(names) if i % 3 else 'Someco'
+        values = {'name': name, 'product': rng.choice(PRODUCTS), 'city': rng.choice(CITIES),
+                  'country': rng.choice(COUNTRIES), 'sector': rng.choice(SECTORS)}
+        articles.append(ss.StartupNews(
+            title=rng.choice(HEADLINE_TEMPLATES).format(**values),
+            url=f'https://news.example/{i}',
+            description=FILLER.format(**values) * paragraphs,
+            source='Bench',
+            date='2026-01-01'
+        ))
+    return articles
+
+
+def naive_extract(names, article):
+    """Check every known name against the article text"""
+    text = f'{article.title} {article.description}'.lower()
+    return [name for name in names if name.lower() in text]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--names', type=int, default=5000)
+    parser.add_argument('--articles', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    rng = random.Random(25)
+    with open(ss.GAZETTEER_PATH, encoding='utf-8') as f:
+        shipped = f.read().splitlines()
+    known = len(ss.read_gazetteer('\n'.join(shipped)))
+    path = os.path.abspath('gazetteer.tsv')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(shipped + synthetic_gazetteer(rng, max(0, args.names - known))) + '\n')
+    index_path = os.path.abspath('gazetteer_index.bin')
+
+    start = time.perf_counter()
+    gazetteer = ss.StartupGazetteer.load(path, index_path)
+    compile_s = time.perf_counter() - start
+    load = measure(lambda: ss.StartupGazetteer.load(path, index_path), args.repeat)
+    names = [name.rstrip('?') for name, _, _ in ss.read_gazetteer(open(path, encoding='utf-8').read())]
+    results = {
+        'names': gazetteer.startups,
+        'index_bytes': os.path.getsize(index_path),
+        'compile_s': compile_s,
+        'load_ms': load['median_s'] * 1000,
+        'batches': {}
+    }
+    for paragraphs in (1, 4, 16):
+        articles = synthetic_articles(ss, rng, names, args.articles, paragraphs)
+        text_mb = sum(len(article.title) + len(article.description) for article in articles) / 1e6
+
+        def annotate():
+            for article in articles:
+                article.startup_name = article.category = ''
+            return gazetteer.annotate(articles)
+
+        timing = measure(annotate, args.repeat)
+        sample = articles[:200]
+        start = time.perf_counter()
+        for article in sample:
+            naive_extract(names, article)
+        naive_s = (time.perf_counter() - start) / len(sample) * len(articles)
+        results['batches'][f'{paragraphs}_paragraphs'] = {
+            'articles': len(articles),
+            'text_mb': text_mb,
+            'named': annotate(),
+            'seconds': timing['median_s'],
+            'us_per_article': timing['median_s'] / len(articles) * 1e6,
+            'mb_per_s': text_mb / timing['median_s'],
+            'naive_seconds_estimated': naive_s
+        }
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
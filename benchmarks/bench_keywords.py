@@ -0,0 +1,87 @@
+"""Benchmark the launch signal classifier against the reference regex
+
+Usage: python benchmarks/bench_keywords.py [--output results.json]
+
+Equivalence with the regex is covered by tests/test_launch_signals.py;
+here each corpus only asserts the same match/no-match answers.
+"""
+import argparse
+import random
+import re
+import time
+
+from common import load_scraper_module, write_results
+from fixtures import load_fixture_pages
+
+WORDS = ['the', 'startup', 'Lagos', 'fintech', 'users', 'market', 'new', 'now', 'open', 'for', 'sign',
+         'ups', 'pre', 'seed', 'join', 'joins', 'accelerator', 'launch', 'launches', 'roll', 'out',
+         'go', 'live', 'v1', 'v2.0', 'release', 'beta', 'public', 'stealth', 'mode', 'exit', 'demo',
+         'day', 'debut', 'expands', 'to', 'toward', 'app', 'apps', 'were', "we're", 'secures', 'angel',
+         'round', 'raises', 'coming', 'soon', 'available', 'innovations', 'partner', 'x', '-', '_']
+SEPARATORS = [' ', ' ', ' ', '', '  ', '\n', '\t', '-', ', ', '. ', ' \n ', ' ']
+
+
+def random_text(rng, max_words=30):
+    """Assemble text from signal fragments with awkward spacing and casing"""
+    parts = []
+    for _ in range(rng.randint(0, max_words)):
+        word = rng.choice(WORDS)
+        roll = rng.random()
+        if roll < 0.1:
+            word = word.upper()
+        elif roll < 0.2:
+            word = word.title()
+        parts.append(word)
+        parts.append(rng.choice(SEPARATORS))
+    return ''.join(parts)
+
+
+def fixture_texts(ss):
+    """Title/description texts as the parser would see them"""
+    scraper = ss.AfricanStartupScraper()
+    texts = []
+    for name, page in load_fixture_pages(scraper.sources).items():
+        soup = ss.build_soup(page)
+        for article in soup.select('article'):
+            texts.append(article.get_text(' ', strip=True)[:400])
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    reference = re.compile(ss.LAUNCH_SIGNALS_PATTERN, re.VERBOSE | re.IGNORECASE)
+    engine = ss.LaunchSignalClassifier()
+    rng = random.Random(1234)
+
+    filler = 'Nigerian regulators are watching the sector closely as users and investors return. '
+    corpora = {
+        'fixtures': fixture_texts(ss),
+        'random_short': [random_text(rng, 12) for _ in range(5000)],
+        'no_signal_300': [filler * 4] * 2000,
+        'long_join_2k': ['Kuda joins ' + 'the market for users and investors ' * 60] * 200,
+    }
+    results = {}
+    for name, texts in corpora.items():
+        start = time.perf_counter()
+        expected = [bool(reference.search(text)) for text in texts]
+        regex_s = time.perf_counter() - start
+        start = time.perf_counter()
+        found = engine.classify_batch(texts)
+        engine_s = time.perf_counter() - start
+        assert expected == [signal is not None for signal in found]
+        results[name] = {
+            'texts': len(texts),
+            'regex_us_per_text': regex_s / len(texts) * 1e6,
+            'engine_us_per_text': engine_s / len(texts) * 1e6,
+            'speedup': regex_s / engine_s,
+            'matched': sum(expected)
+        }
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Compare the old readlines() /logs tail with the reverse-seek reader
+
+Usage: python benchmarks/bench_log_tail.py [--sizes-mb 1,10,100] [--lines 50] [--output results.json]
+"""
+import argparse
+import json
+import os
+import time
+
+from common import load_scraper_module, write_results
+
+
+def write_log(path, size_bytes):
+    """Write JSON log lines until the file reaches size_bytes"""
+    entry = {'ts': '2026-10-17T09:00:00.000', 'level': 'INFO', 'source': 'techcabal', 'thread': 'scrape_0'}
+    written = 0
+    with open(path, 'w') as f:
+        i = 0
+        while written < size_bytes:
+            entry['message'] = f'Found {i % 15} new articles from techcabal'
+            entry['level'] = 'WARNING' if i % 100 == 0 else 'INFO'
+            line = json.dumps(entry) + '\n'
+            f.write(line)
+            written += len(line)
+            i += 1
+
+
+def legacy_tail(path, count):
+    with open(path, 'r') as f:
+        return f.readlines()[-count:]
+
+
+def best_of(func, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes-mb', default='1,10,100')
+    parser.add_argument('--lines', type=int, default=50)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    results = {}
+    for size_mb in [int(size) for size in args.sizes_mb.split(',')]:
+        write_log(ss.LOG_PATH, size_mb * 1024 * 1024)
+        assert len(ss.read_log_tail(args.lines)) == args.lines
+        results[f'{size_mb}MB'] = {
+            'readlines_s': best_of(lambda: legacy_tail(ss.LOG_PATH, args.lines)),
+            'reverse_tail_s': best_of(lambda: ss.read_log_tail(args.lines)),
+            'reverse_tail_warnings_s': best_of(lambda: ss.read_log_tail(args.lines, ss.logging.WARNING))
+        }
+    os.remove(ss.LOG_PATH)
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
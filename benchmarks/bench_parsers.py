@@ -0,0 +1,42 @@
+"""Parse time and peak memory per HTML parser backend on fixture pages
+
+Usage: python benchmarks/bench_parsers.py [--repeat 3] [--output results.json]
+"""
+import argparse
+
+from bs4.builder import builder_registry
+
+from common import load_scraper_module, measure, write_results
+from fixtures import load_fixture_pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    scraper = ss.AfricanStartupScraper()
+    pages = load_fixture_pages(scraper.sources)
+    results = {'pages': len(pages), 'page_bytes': sum(len(p) for p in pages.values()), 'backends': {}}
+
+    for backend in ss.PARSER_BACKENDS:
+        if backend == 'lxml' and not builder_registry.lookup('lxml'):
+            results['backends'][backend] = 'lxml not installed'
+            continue
+
+        def parse_all():
+            return [
+                scraper.parse_generic_wordpress(ss.build_soup(page, backend), name)
+                for name, page in pages.items()
+            ]
+
+        stats = measure(parse_all, repeat=args.repeat)
+        stats['articles'] = sum(len(articles) for articles in parse_all())
+        results['backends'][backend] = stats
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""Offline end-to-end benchmark of the scrape pipeline
+
+Serves fixture pages for every source from a local HTTP stand-in server,
+captures the digest with a fake SMTP sink, and times each stage on its own
+(fetch, soup, parse, classify, dedup, render, send) as well as a full
+daily_scrape_and_send run. Results are written as JSON so runs from
+different commits can be compared.
+
+Usage: python benchmarks/bench_pipeline.py [--repeat 3] [--parse-workers N] [--output run.json] [--compare baseline.json]
+"""
+import argparse
+import json
+import platform
+import smtplib
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from common import REPO_ROOT, load_scraper_module, write_results
+from fixtures import load_fixture_pages
+
+
+class FixtureServer:
+    """Local HTTP stand-in serving one fixture page per source at /<source>/,
+    optionally after a delay standing in for network latency: seconds, or a
+    function of the source name returning them"""
+    def __init__(self, pages, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                name = self.path.strip('/').split('/')[0]
+                page = server.pages.get(name) if self.path.rstrip('/') == f'/{name}' else None
+                if page is None:
+                    self.send_error(404)
+                    return
+                delay = server.delay(name) if callable(server.delay) else server.delay
+                if delay:
+                    time.sleep(delay)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, source_name):
+        return f'http://127.0.0.1:{self.port}/{source_name}/'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeSMTP:
+    """smtplib.SMTP stand-in that records messages instead of sending them"""
+    sent = []
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        FakeSMTP.sent.append(len(msg.as_bytes()))
+
+
+def timed(func, repeat):
+    """Run func repeat times, returning (min seconds, last result)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print per-stage ratios against a previous results file"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"Compared with {baseline.get('commit')}:")
+    for stage, seconds in results['stages'].items():
+        before = baseline.get('stages', {}).get(stage)
+        if before:
+            print(f'  {stage:<12} {before:.4f}s -> {seconds:.4f}s ({seconds / before:.2f}x)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output')
+    parser.add_argument('--compare')
+    parser.add_argument('--parse-workers', type=int, default=0)
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    smtplib.SMTP = FakeSMTP
+    scraper = ss.AfricanStartupScraper(per_host_delay=0, parse_workers=args.parse_workers)
+    pages = load_fixture_pages(scraper.sources)
+    email_config = dict(ss.EMAIL_CONFIG, smtp_server='localhost', smtp_port=2525)
+
+    with FixtureServer(pages) as server:
+        for source_name, source_config in scraper.sources.items():
+            source_config['url'] = server.url(source_name)
+            source_config['feed'] = None
+        urls = {name: config['url'] for name, config in scraper.sources.items()}
+
+        stages = {}
+        stages['fetch'], responses = timed(
+            lambda: {name: scraper.fetch_response(url).content for name, url in urls.items()}, args.repeat)
+        stages['soup'], soups = timed(
+            lambda: {name: ss.build_soup(body, scraper.parser_backend) for name, body in responses.items()},
+            args.repeat)
+        stages['parse'], parsed = timed(
+            lambda: {name: scraper.parse_generic_wordpress(soup, name) for name, soup in soups.items()},
+            args.repeat)
+        articles = [article for name in urls for article in parsed[name]]
+        texts = [
+            article.get_text(' ', strip=True)[:400]
+            for soup in soups.values() for article in soup.select('article')
+        ]
+        stages['classify'], _ = timed(lambda: [scraper.contains_launch_keywords(t) for t in texts], args.repeat)
+        stages['dedup'], _ = timed(lambda: scraper.store.filter_sent([a.url for a in articles]), args.repeat)
+        stages['render'], html = timed(lambda: scraper.generate_email_content(articles), args.repeat)
+        stages['send'], _ = timed(lambda: scraper.send_email(articles, email_config), args.repeat)
+
+        def end_to_end():
+            with scraper.store.lock, scraper.store.conn:
+                scraper.store.conn.execute('DELETE FROM sent_articles')
+                scraper.store.conn.execute('DELETE FROM source_watermarks')
+            scraper.store.load_seen_index()
+            scraper.store.load_near_duplicate_index()
+            scraper.watermarks.clear()
+            scraper._parsed_pages.clear()
+            return scraper.daily_scrape_and_send(email_config)
+
+        stages['end_to_end'], found = timed(end_to_end, args.repeat)
+
+    results = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'parse_workers': args.parse_workers,
+        'sources': len(pages),
+        'page_bytes': sum(len(page) for page in pages.values()),
+        'articles': len(articles),
+        'classified_texts': len(texts),
+        'digest_bytes': len(html),
+        'end_to_end_articles': found,
+        'emails_captured': len(FakeSMTP.sent),
+        'http_requests': server.requests,
+        'stages': stages
+    }
+    write_results(results, args.output)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
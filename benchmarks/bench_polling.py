@@ -0,0 +1,144 @@
+"""Simulate fixed daily polling against the adaptive PollScheduler
+
+Sources publish as Poisson processes at a spread of rates (a few busy
+sites, most steady or quiet, some dead), with a share of items being
+launches. Fixed daily polling and a fixed interval spending as many
+fetches as adaptive are the baselines. Each strategy is run over the same
+publication timeline with a simulated clock and reports fetches spent,
+items that scrolled off the front page before being seen, and how long
+launches waited to be found.
+
+Usage: python benchmarks/bench_polling.py [--days 28] [--seed 1] [--output results.json]
+"""
+import argparse
+import random
+
+from common import load_scraper_module, write_results
+
+# (items per hour, share of items that are launches, number of such sources)
+SOURCE_PROFILES = [
+    (8.0, 0.3, 2),
+    (1.0, 0.5, 6),
+    (0.2, 0.5, 10),
+    (0.02, 0.2, 5),
+    (0.0, 0.0, 3),
+]
+
+
+def build_timeline(days, rng):
+    """Publication times in seconds, with a launch flag, for each source"""
+    horizon = days * 86400
+    sources = {}
+    for rate, launch_share, count in SOURCE_PROFILES:
+        for n in range(count):
+            items = []
+            now = 0.0
+            while rate:
+                now += rng.expovariate(rate / 3600)
+                if now >= horizon:
+                    break
+                items.append((now, rng.random() < launch_share))
+            sources[f'{rate:g}/h-{n}'] = items
+    return sources
+
+
+def simulate(timeline, due, record, days, page_size):
+    """Drive a polling strategy over the timeline with a one-minute tick"""
+    horizon = days * 86400
+    cursor = {name: 0 for name in timeline}
+    fetches = missed = 0
+    delays = []
+    now = 0.0
+    while now < horizon:
+        for name in due(now):
+            items = timeline[name]
+            start = cursor[name]
+            end = start
+            while end < len(items) and items[end][0] <= now:
+                end += 1
+            fresh = items[start:end]
+            # Only the newest page_size items are on the front page
+            seen, lost = fresh[-page_size:], fresh[:-page_size]
+            missed += len(lost)
+            delays.extend(now - published for published, launch in seen if launch)
+            cursor[name] = end
+            fetches += 1
+            record(name, len(seen), sum(1 for _, launch in seen if launch), now)
+        now += 60
+    delays.sort()
+    return {
+        'fetches': fetches,
+        'fetches_per_day': fetches / days,
+        'items_missed': missed,
+        'launches_found': len(delays),
+        'median_delay_h': delays[len(delays) // 2] / 3600 if delays else None,
+        'p95_delay_h': delays[int(len(delays) * 0.95)] / 3600 if delays else None
+    }
+
+
+def fixed_daily(timeline):
+    """Poll every source once a day at 09:00, as the scheduler used to"""
+    next_run = {'at': 9 * 3600}
+
+    def due(now):
+        if now < next_run['at']:
+            return []
+        next_run['at'] += 86400
+        return list(timeline)
+
+    return due, lambda *args: None
+
+
+def fixed_interval(timeline, interval):
+    """Poll every source on the same fixed interval"""
+    next_run = {'at': 0.0}
+
+    def due(now):
+        if now < next_run['at']:
+            return []
+        next_run['at'] += interval
+        return list(timeline)
+
+    return due, lambda *args: None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=28)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    timeline = build_timeline(args.days, random.Random(args.seed))
+    page_size = ss.MAX_ARTICLES_PER_PAGE * max(1, ss.MAX_PAGES)
+    total_launches = sum(launch for items in timeline.values() for _, launch in items)
+
+    results = {
+        'days': args.days,
+        'sources': len(timeline),
+        'items_published': sum(len(items) for items in timeline.values()),
+        'launches_published': total_launches,
+        'strategies': {}
+    }
+    results['strategies']['fixed_daily'] = simulate(timeline, *fixed_daily(timeline), args.days, page_size)
+    random.seed(args.seed)
+    scheduler = ss.PollScheduler({}, list(timeline))
+    results['strategies']['adaptive'] = simulate(
+        timeline, scheduler.due, scheduler.record, args.days, page_size
+    )
+    # A uniform interval spending the same number of fetches as adaptive
+    adaptive_fetches = results['strategies']['adaptive']['fetches']
+    interval = args.days * 86400 * len(timeline) / max(1, adaptive_fetches)
+    results['strategies']['fixed_equal_budget'] = simulate(
+        timeline, *fixed_interval(timeline, interval), args.days, page_size
+    )
+    results['strategies']['fixed_equal_budget']['interval_h'] = interval / 3600
+    results['adaptive_intervals_h'] = {
+        name: round(state.interval / 3600, 2) for name, state in scheduler.states.items()
+    }
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Throughput of replaying the raw response archive
+
+Builds an archive of synthetic listing pages, as the streaming fetch path
+would have kept them, for every source over a number of days with several
+polls a day, then replays it through the current parser and classifier
+with each requested number of worker processes. Reports archive size,
+write rate and replay rate in responses and page megabytes per second.
+
+Usage: python benchmarks/bench_replay.py [--days 30] [--polls 4] [--workers 1 2 4] [--output results.json]
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+
+from common import load_scraper_module, write_results
+from fixtures import synthetic_page
+
+
+def build_archive(ss, days, polls, start):
+    """Archive a trimmed synthetic page per source and poll; returns (pages, page bytes)"""
+    store = ss.ArticleStore(seen_index=False)
+    archive = ss.ResponseArchive(ss.RESPONSE_ARCHIVE_DIR, store)
+    count = size = 0
+    for day in range(days):
+        for poll in range(polls):
+            fetched_at = (start + timedelta(days=day, hours=6 * poll)).timestamp()
+            for name, url in ss.NEWS_SOURCES.items():
+                # A new front page each day
+                trimmer = ss.PageTrimmer()
+                page = trimmer.feed(synthetic_page(f'{name}-{day}', url)) + trimmer.close()
+                archive.append(name, url, 'html', page, 'text/html; charset=UTF-8', fetched_at)
+                count += 1
+                size += len(page)
+    return count, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--polls', type=int, default=4)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    os.environ['SCRAPER_RESPONSE_ARCHIVE'] = 'response_archive'
+    ss = load_scraper_module()
+    start = datetime.combine(datetime.now().date(), datetime.min.time()) - timedelta(days=args.days)
+    began = time.perf_counter()
+    responses, page_bytes = build_archive(ss, args.days, args.polls, start)
+    write_seconds = time.perf_counter() - began
+    archive_bytes = sum(
+        os.path.getsize(os.path.join(ss.RESPONSE_ARCHIVE_DIR, name)) for name in os.listdir(ss.RESPONSE_ARCHIVE_DIR)
+    )
+    results = {
+        'cpus': os.cpu_count(),
+        'responses': responses,
+        'page_mb': page_bytes / 1e6,
+        'archive_mb': archive_bytes / 1e6,
+        'write_responses_per_s': responses / write_seconds,
+        'replay': {}
+    }
+    for workers in args.workers:
+        replayed = ss.replay_archive(start, start + timedelta(days=args.days), workers)
+        results['replay'][str(workers)] = {
+            'seconds': replayed['seconds'],
+            'responses_per_s': replayed['responses'] / replayed['seconds'],
+            'page_mb_per_s': page_bytes / 1e6 / replayed['seconds'],
+            'articles': sum(day['articles'] for day in replayed['days'].values())
+        }
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Time archive searches and keyset paging against a large archive
+
+Usage: python benchmarks/bench_search.py [--rows 300000] [--pages 20] [--output results.json]
+"""
+import argparse
+import os
+import random
+import time
+
+from common import load_scraper_module, write_results
+
+COMPANIES = ['Paystack', 'Flutterwave', 'Kuda', 'Andela', 'M-Kopa', 'Twiga Foods', 'Chipper Cash', 'Moniepoint',
+             'Wave', 'Helium Health', 'Lipa Later', 'Sendy', 'Jumia', 'OPay', 'Cellulant', 'Yoco']
+ACTIONS = ['launches', 'unveils', 'rolls out', 'raises', 'expands to', 'partners with', 'acquires', 'debuts']
+PRODUCTS = ['payments app', 'savings product', 'logistics API', 'marketplace', 'wallet', 'lending platform',
+            'card', 'health records tool', 'B2B ordering app', 'remittance corridor']
+PLACES = ['Lagos', 'Nairobi', 'Accra', 'Cairo', 'Kigali', 'Dakar', 'Johannesburg', 'Kampala']
+SOURCES = ['Techcabal', 'Techpoint Africa', 'Disrupt Africa', 'Wamda', 'Ventureburn', 'Weetracker']
+
+
+def populate(ss, path, rows):
+    """Fill a fresh archive with synthetic headlines"""
+    store = ss.ArticleStore(path, seen_index=False)
+    rng = random.Random(7)
+    batch = []
+    for i in range(rows):
+        company, action = rng.choice(COMPANIES), rng.choice(ACTIONS)
+        product, place = rng.choice(PRODUCTS), rng.choice(PLACES)
+        batch.append(ss.StartupNews(
+            title=f'{company} {action} {product} in {place}',
+            url=f'https://news.example/{i}',
+            description=f'{company} said the {product} will serve customers in {place} and beyond. Story {i}.',
+            source=rng.choice(SOURCES),
+            date='2026-01-01',
+            matched_signal='launch' if action in ('launches', 'unveils', 'rolls out', 'debuts') else ''
+        ))
+        if len(batch) == 10_000:
+            store.archive(batch)
+            batch = []
+    store.archive(batch)
+    return store
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    path = os.path.abspath('bench_search.db')
+    populate_s, store = timed(lambda: populate(ss, path, args.rows))
+    query = '"paystack" "wallet"'
+
+    results = {'rows': args.rows, 'populate_s': populate_s, 'queries': {}}
+    for name, kwargs in (
+        ('ranked', {'query': query}),
+        ('ranked_matched_source', {'query': query, 'source': 'Wamda', 'matched_only': True}),
+        ('rare_term', {'query': '"story" "12345"'}),
+        ('newest', {}),
+        ('newest_by_source', {'source': 'Wamda'}),
+    ):
+        first_s, rows = timed(lambda: store.search_archive(**kwargs))
+        # Walk pages with the keyset cursor, the way /search clients do
+        after, page_times = None, []
+        for _ in range(args.pages):
+            elapsed, rows = timed(lambda: store.search_archive(after=after, **kwargs))
+            page_times.append(elapsed)
+            if len(rows) < ss.SEARCH_PAGE_SIZE:
+                break
+            after = (rows[-1]['rank'], rows[-1]['id'])
+        results['queries'][name] = {
+            'first_page_s': first_s,
+            'pages_walked': len(page_times),
+            'max_page_s': max(page_times),
+            'median_page_s': sorted(page_times)[len(page_times) // 2]
+        }
+    store.conn.close()
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Compare dedup lookups: per-call connection vs pooled query vs Bloom-fronted index
+
+Usage: python benchmarks/bench_seen_index.py [--sizes 10000,100000,1000000] [--output results.json]
+"""
+import argparse
+import os
+import sqlite3
+import time
+import tracemalloc
+
+from common import load_scraper_module, write_results
+
+
+def legacy_is_article_sent(path, url):
+    """The original per-call lookup that opens a fresh connection"""
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    cursor.execute('SELECT COUNT(*) FROM sent_articles WHERE url = ?', (url,))
+    count = cursor.fetchone()[0]
+    conn.close()
+    return count > 0
+
+
+def populate(scraper_module, path, size):
+    """Fill a fresh database with size sent urls"""
+    store = scraper_module.ArticleStore(path, seen_index=False)
+    batch = []
+    for i in range(size):
+        batch.append(scraper_module.StartupNews(
+            title=f'Article {i}', url=f'https://example.africa/{i % 97}/story-{i}/',
+            description='', source='Bench', date='2026-01-01'
+        ))
+        if len(batch) == 10_000:
+            store.mark_sent(batch)
+            batch = []
+    if batch:
+        store.mark_sent(batch)
+    store.conn.close()
+
+
+def throughput(lookup, urls):
+    """Lookups per second for a callable taking the full url list"""
+    start = time.perf_counter()
+    lookup(urls)
+    return len(urls) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    parser.add_argument('--lookups', type=int, default=5000)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    results = {}
+    for size in [int(s) for s in args.sizes.split(',')]:
+        path = os.path.abspath(f'bench_{size}.db')
+        populate(ss, path, size)
+        # 90% never-seen urls, the common case for a scrape run
+        urls = [
+            f'https://example.africa/{i % 97}/story-{i}/' if i % 10 == 0
+            else f'https://example.africa/new/{size}-{i}/'
+            for i in range(args.lookups)
+        ]
+
+        pooled = ss.ArticleStore(path, seen_index=False)
+        start = time.perf_counter()
+        indexed = ss.ArticleStore(path, seen_index=True)
+        load_s = time.perf_counter() - start
+        tracemalloc.start()
+        indexed.load_seen_index()
+        _, index_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        legacy_urls = urls[:min(len(urls), 2000)]
+        results[str(size)] = {
+            'legacy_per_call_lookups_per_s': throughput(
+                lambda us: [legacy_is_article_sent(path, u) for u in us], legacy_urls),
+            'pooled_batch_lookups_per_s': throughput(pooled.filter_sent, urls),
+            'bloom_batch_lookups_per_s': throughput(indexed.filter_sent, urls),
+            'bloom_single_lookups_per_s': throughput(
+                lambda us: [indexed.filter_sent([u]) for u in us], urls),
+            'bloom_load_s': load_s,
+            'bloom_bits_bytes': len(indexed.seen_index.bits),
+            'bloom_load_peak_bytes': index_peak,
+            'bloom_false_positive_rate': sum(
+                u in indexed.seen_index for u in urls if '/new/' in u) / sum('/new/' in u for u in urls)
+        }
+        assert pooled.filter_sent(urls) == indexed.filter_sent(urls)
+        pooled.conn.close()
+        indexed.conn.close()
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
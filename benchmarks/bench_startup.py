@@ -0,0 +1,130 @@
+"""Measure cold start of the web process: import time and boot to first response
+
+Each run starts a fresh interpreter in an empty scratch directory, so no
+database, cache or log file exists yet. boot_to_dashboard is the time from
+spawning `startup_scraper.py --mode cloud` to the first 200 from /, and
+first_status the latency of the first /status call after that.
+
+Usage: python benchmarks/bench_startup.py [--repeat 5] [--ref HEAD~1] [--output results.json]
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+from common import REPO_ROOT, write_results
+
+HEAVY_MODULES = ['requests', 'bs4', 'smtplib', 'email.mime.multipart', 'multiprocessing', 'sqlite3']
+
+IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import startup_scraper
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(','.join(m for m in {modules!r} if m in sys.modules))
+"""
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def checkout(ref, workdir):
+    """Write startup_scraper.py as of a git ref into workdir"""
+    source = subprocess.check_output(['git', 'show', f'{ref}:startup_scraper.py'], cwd=REPO_ROOT)
+    with open(os.path.join(workdir, 'startup_scraper.py'), 'wb') as f:
+        f.write(source)
+    return workdir
+
+
+def time_import(code_dir):
+    """Import the module in a fresh interpreter; returns (seconds, heavy modules loaded)"""
+    with tempfile.TemporaryDirectory(prefix='scraper-startup-') as workdir:
+        env = dict(os.environ, PYTHONPATH=code_dir)
+        out = subprocess.check_output(
+            [sys.executable, '-c', IMPORT_SNIPPET.format(modules=HEAVY_MODULES)],
+            cwd=workdir, env=env, text=True, stderr=subprocess.DEVNULL)
+    # Older versions print during import; the timing is on the last two lines
+    seconds, loaded = out.splitlines()[-2:]
+    return float(seconds), [m for m in loaded.split(',') if m]
+
+
+def get(url, timeout=5.0):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        response.read()
+        return response.status
+
+
+def time_boot(code_dir, timeout=30.0):
+    """Launch the cloud web process and time the first / and /status responses"""
+    with tempfile.TemporaryDirectory(prefix='scraper-startup-') as workdir:
+        port = free_port()
+        env = dict(os.environ, PORT=str(port))
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, os.path.join(code_dir, 'startup_scraper.py'), '--mode', 'cloud', '--port', str(port)],
+            cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            base = f'http://127.0.0.1:{port}'
+            while True:
+                if proc.poll() is not None:
+                    raise RuntimeError(f'web process exited with {proc.returncode}')
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError('web process did not answer in time')
+                try:
+                    if get(base + '/', timeout=1.0) == 200:
+                        break
+                except (urllib.error.URLError, ConnectionError):
+                    time.sleep(0.005)
+            boot = time.perf_counter() - start
+            status_start = time.perf_counter()
+            get(base + '/status')
+            status = time.perf_counter() - status_start
+            db_created = os.path.exists(os.path.join(workdir, 'sent_articles.db'))
+        finally:
+            proc.terminate()
+            proc.wait()
+    return boot, status, db_created
+
+
+def summarize(values):
+    values = sorted(values)
+    return {'min_s': values[0], 'median_s': values[len(values) // 2]}
+
+
+def run(code_dir, repeat):
+    imports = [time_import(code_dir) for _ in range(repeat)]
+    boots = [time_boot(code_dir) for _ in range(repeat)]
+    return {
+        'import': summarize([seconds for seconds, _ in imports]),
+        'heavy_modules_after_import': imports[-1][1],
+        'boot_to_dashboard': summarize([boot for boot, _, _ in boots]),
+        'first_status': summarize([status for _, status, _ in boots]),
+        'database_created_by_status': boots[-1][2]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--ref', help='also measure startup_scraper.py from this git ref')
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    results = {'current': run(REPO_ROOT, args.repeat)}
+    if args.ref:
+        with tempfile.TemporaryDirectory(prefix='scraper-ref-') as ref_dir:
+            results[args.ref] = run(checkout(args.ref, ref_dir), args.repeat)
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Peak memory and time per source of whole-page versus streaming fetches
+
+Serves oversized listing pages (synthetic homepages with more entries than
+the parser reads and large inline scripts, as many news sites embed) from
+the local fixture server. Each page is fetched and parsed once with the
+whole response read into memory, and once streamed with script/style
+stripping and early stop. Reports per-source time, peak
+traced memory, bytes kept and skipped, and checks both modes extract the
+same articles.
+
+Usage: python benchmarks/bench_streaming.py [--articles 60] [--script-kb 1536] [--repeat 3] [--output results.json]
+"""
+import argparse
+
+from bench_pipeline import FixtureServer
+from common import load_scraper_module, measure, write_results
+from fixtures import synthetic_page
+
+
+def oversized_page(source_name, base_url, articles, script_kb):
+    """A synthetic homepage with inline scripts ahead of and after the listing:
+    an embedded state blob and a bundled footer script, half of script_kb each"""
+    page = synthetic_page(source_name, base_url, articles)
+    state = b'<script>window.__INITIAL_STATE__={"k":"' + b'x' * (script_kb * 512) + b'"};</script>'
+    bundle = b'<script>' + b'void 0;' * (script_kb * 512 // 7) + b'</script>'
+    page = page.replace(b'<main ', state + b'<main ', 1)
+    return page.replace(b'</footer>', bundle + b'</footer>', 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=60)
+    parser.add_argument('--script-kb', type=int, default=1536)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    scraper = ss.AfricanStartupScraper(per_host_delay=0)
+    names = list(scraper.sources)[:8]
+    pages = {
+        name: oversized_page(name, scraper.sources[name]['url'], args.articles, args.script_kb)
+        for name in names
+    }
+    results = {
+        'sources': len(pages),
+        'page_bytes': sum(len(page) for page in pages.values()) // len(pages),
+        'modes': {}
+    }
+    with FixtureServer(pages) as server:
+        for mode, streaming in (('whole_page', False), ('streaming', True)):
+            ss.STREAM_FETCH = streaming
+            extracted = {}
+
+            def fetch_and_parse_all():
+                for name in names:
+                    result = scraper.fetch_response(server.url(name), name, trim=True)
+                    page = scraper.parse_html(result.content, name, scraper.sources[name])
+                    extracted[name] = [article.url for article in page.articles]
+
+            with scraper._stats_lock:
+                scraper._current_run = {'sources': {}}
+            timing = measure(fetch_and_parse_all, args.repeat)
+            with scraper._stats_lock:
+                stats, scraper._current_run = scraper._current_run['sources'], None
+            runs = args.repeat + 1
+            results['modes'][mode] = {
+                'per_source_s': timing['median_s'] / len(names),
+                'peak_bytes': timing['peak_bytes'],
+                'kept_bytes': sum(s.get('fetch_bytes', 0) for s in stats.values()) // (runs * len(names)),
+                'stripped_bytes': sum(s.get('stripped_bytes', 0) for s in stats.values()) // (runs * len(names)),
+                'unread_bytes': sum(s.get('unread_bytes', 0) for s in stats.values()) // (runs * len(names)),
+                'articles': sum(len(urls) for urls in extracted.values())
+            }
+            results['modes'][mode]['extracted'] = extracted
+    whole, streamed = results['modes']['whole_page'].pop('extracted'), results['modes']['streaming'].pop('extracted')
+    results['same_articles'] = whole == streamed
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
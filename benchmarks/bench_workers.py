@@ -0,0 +1,133 @@
+"""Run the scheduled daily digest across several worker processes
+
+Each worker is a separate process sharing one article database and one
+lease database, as gunicorn or a few containers on a host would. Sources
+are served from the local fixture server with a fixed delay standing in
+for network latency, and each worker fetches with a small pool, so the
+digest's wall time is bound by how many sources a worker has to poll.
+Reports the wall time to the digest being sent, how the shards were split
+and how many digests went out (it should always be one).
+
+Usage: python benchmarks/bench_workers.py [--workers 1 2 4] [--delay 0.3] [--fetches 2] [--output results.json]
+"""
+import argparse
+import multiprocessing
+import os
+import smtplib
+import tempfile
+import time
+
+from bench_pipeline import FixtureServer
+from common import load_scraper_module, write_results
+from fixtures import load_fixture_pages
+
+LEASE_TTL = 3
+
+
+class FileSMTP:
+    """smtplib.SMTP stand-in appending each message's subject to a file the
+    parent process reads back"""
+    path = None
+
+    def __init__(self, host, port):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        with open(FileSMTP.path, 'a') as f:
+            f.write(f"{os.getpid()}\t{msg['Subject']}\n")
+
+
+def worker(workdir, urls, fetches, ready, go, results):
+    """Build a scraper, wait for the shards to settle, then run the scheduled digest"""
+    ss = load_scraper_module(workdir)
+    FileSMTP.path = os.path.join(workdir, 'sent.tsv')
+    smtplib.SMTP = FileSMTP
+    scraper = ss.AfricanStartupScraper(max_workers=fetches, per_host_delay=0)
+    for source_name, source_config in scraper.sources.items():
+        source_config['url'] = urls[source_name]
+        source_config['feed'] = None
+    ready.wait()
+    # A few renewals let every worker see the others and rebalance
+    time.sleep(LEASE_TTL)
+    go.wait()
+    owned = sorted(scraper.coordinator.owned)
+    sources = sum(1 for name in scraper.sources if scraper.coordinator.owns(name))
+    start = time.perf_counter()
+    found = scraper.daily_scrape_and_send(dict(ss.EMAIL_CONFIG), scheduled=True)
+    results.put({
+        'pid': os.getpid(),
+        'seconds': time.perf_counter() - start,
+        'articles': found,
+        'owned_shards': owned,
+        'sources': sources
+    })
+    scraper.coordinator.stop()
+
+
+def run(workers, urls, fetches):
+    """One scheduled digest with the given number of worker processes"""
+    workdir = tempfile.mkdtemp(prefix='scraper-workers-')
+    os.environ['SCRAPER_COORDINATION_DB'] = os.path.join(workdir, 'leases.db')
+    os.environ['SCRAPER_LEASE_TTL'] = str(LEASE_TTL)
+    context = multiprocessing.get_context('spawn')
+    ready, go = context.Barrier(workers), context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(workdir, urls, fetches, ready, go, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    sent_path = os.path.join(workdir, 'sent.tsv')
+    sent = open(sent_path).read().splitlines() if os.path.exists(sent_path) else []
+    return {
+        'digest_seconds': max(report['seconds'] for report in reports),
+        'emails_sent': len(sent),
+        'articles_in_digest': sum(report['articles'] for report in reports),
+        'shards_per_worker': sorted(len(report['owned_shards']) for report in reports),
+        # Sources hash unevenly into shards, so the busiest worker sets the pace
+        'sources_per_worker': sorted(report['sources'] for report in reports)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--delay', type=float, default=0.3)
+    parser.add_argument('--fetches', type=int, default=2)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    ss = load_scraper_module()
+    pages = load_fixture_pages({name: {'url': url} for name, url in ss.NEWS_SOURCES.items()})
+    results = {
+        'sources': len(pages),
+        'shards': ss.SOURCE_SHARDS,
+        'delay_s': args.delay,
+        'fetches_per_worker': args.fetches,
+        'runs': {}
+    }
+    with FixtureServer(pages, delay=args.delay) as server:
+        urls = {name: server.url(name) for name in pages}
+        for workers in args.workers:
+            results['runs'][str(workers)] = run(workers, urls, args.fetches)
+    write_results(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
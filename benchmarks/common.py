@@ -0,0 +1,52 @@
+"""Shared helpers for the offline benchmark scripts"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_scraper_module(workdir: Optional[str] = None, log_level: int = logging.WARNING):
+    """Import startup_scraper from a scratch directory so benchmarks never touch
+    the real database, cache or log file"""
+    workdir = workdir or tempfile.mkdtemp(prefix='scraper-bench-')
+    os.chdir(workdir)
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    import startup_scraper
+    # Per-article INFO logging would dominate the timings
+    logging.getLogger().setLevel(log_level)
+    return startup_scraper
+
+
+def measure(func: Callable, repeat: int = 5) -> Dict:
+    """Time func over several runs and record its peak traced memory"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    timings.sort()
+    return {
+        'min_s': timings[0],
+        'median_s': timings[len(timings) // 2],
+        'peak_bytes': peak
+    }
+
+
+def write_results(results: Dict, path: Optional[str]):
+    """Print results and optionally save them as JSON"""
+    text = json.dumps(results, indent=2, sort_keys=True)
+    print(text)
+    if path:
+        with open(path, 'w') as f:
+            f.write(text + '\n')
@@ -0,0 +1,101 @@
+"""Fixture pages for offline benchmarks
+
+record_fixtures.py records live homepages into benchmarks/fixtures/<source>.html;
+none are committed. benchmarks/fixtures/synthetic/ holds hand-built pages for
+a few sources in the markup of common WordPress themes (Genesis, Newspaper,
+block themes, JNews). They are not recordings of the live sites. Sources with
+neither get a deterministic synthetic WordPress-style homepage of realistic
+size and structure.
+"""
+import os
+import random
+from typing import Dict, Iterable
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SYNTHETIC_DIR = os.path.join(FIXTURE_DIR, 'synthetic')
+
+HEADLINE_TEMPLATES = [
+    '{name} launches {product} for small businesses in {city}',
+    '{name} raises $2m seed round to expand across {country}',
+    '{name} unveils new platform for cross-border payments',
+    'Why {country} regulators are watching {name} closely',
+    '{name} expands to {city} after strong first year',
+    'Opinion: what the {name} shutdown tells us about {sector}',
+    '{name} emerges from stealth with AI-powered {product}',
+    'Weekly roundup: {sector} deals across {country}',
+    '{name} partners with telcos to bring {product} to rural users',
+    '{name} joins Google for Startups accelerator in {city}'
+]
+NAMES = ['Paystack', 'Flutterwave', 'Moniepoint', 'Kuda', 'Andela', 'Chipper Cash', 'Wave', 'M-Kopa',
+         'Twiga Foods', 'Helium Health', 'Kobo360', 'Sendy', 'Lipa Later', 'Bamboo', 'Eden Life']
+PRODUCTS = ['app', 'wallet', 'credit line', 'logistics API', 'marketplace', 'savings product']
+CITIES = ['Lagos', 'Nairobi', 'Accra', 'Cairo', 'Kigali', 'Cape Town', 'Abidjan']
+COUNTRIES = ['Nigeria', 'Kenya', 'Ghana', 'Egypt', 'Rwanda', 'South Africa']
+SECTORS = ['fintech', 'healthtech', 'agritech', 'edtech', 'logistics']
+MENU_ITEM_TYPES = ['menu-item-type-post_type menu-item-object-page',
+                   'menu-item-type-taxonomy menu-item-object-category',
+                   'menu-item-type-custom menu-item-object-custom']
+
+
+def synthetic_page(source_name: str, base_url: str, articles: int = 24) -> bytes:
+    """Generate a deterministic WordPress-like homepage for a source"""
+    rng = random.Random(source_name)
+    filler = ' '.join(rng.choice(['the', 'startup', 'market', 'users', 'growth', 'funding', 'Africa',
+                                  'product', 'investors', 'team', 'platform', 'customers'])
+                      for _ in range(400))
+    parts = [
+        '<!DOCTYPE html><html lang="en-US"><head><meta charset="UTF-8">',
+        f'<title>{source_name} - African tech news</title>',
+        '<style>' + ''.join(f'.c{i}{{margin:{i}px;padding:{i % 7}px}}' for i in range(1500)) + '</style>',
+        '<script>' + ''.join(f'var w{i}=function(a){{return a*{i}}};' for i in range(1500)) + '</script>',
+        '</head><body class="home blog wp-theme"><header class="site-header"><nav><ul>',
+        # A WordPress menu: pages, categories and custom links, as real themes render them
+        ''.join(f'<li id="menu-item-{100 + i}" class="menu-item {MENU_ITEM_TYPES[i % 3]} menu-item-{100 + i}">'
+                f'<a href="{base_url}/category/{SECTORS[i % len(SECTORS)]}/{i}/">{SECTORS[i % len(SECTORS)]}</a></li>'
+                for i in range(35)),
+        '</ul></nav></header><main id="main" class="site-main">'
+    ]
+    for i in range(articles):
+        fields = {
+            'name': rng.choice(NAMES), 'product': rng.choice(PRODUCTS), 'city': rng.choice(CITIES),
+            'country': rng.choice(COUNTRIES), 'sector': rng.choice(SECTORS)
+        }
+        title = rng.choice(HEADLINE_TEMPLATES).format(**fields)
+        slug = '-'.join(title.lower().replace('$', '').replace(':', '').split())[:80]
+        day = 28 - (i % 28)
+        excerpt = ' '.join(filler.split()[i:i + 60])
+        parts.append(
+            f'<article id="post-{1000 + i}" class="post-{1000 + i} post type-post status-publish">'
+            f'<div class="post-thumbnail"><img src="{base_url}/wp-content/uploads/{i}.jpg" alt=""></div>'
+            f'<header class="entry-header"><h2 class="entry-title"><a href="{base_url}/2026/10/{day:02d}/{slug}/">'
+            f'{title}</a></h2><div class="entry-meta"><time class="entry-date published" '
+            f'datetime="2026-10-{day:02d}T08:00:00+00:00">October {day}, 2026</time>'
+            f'<span class="cat-links"><a href="{base_url}/category/{fields["sector"]}/">{fields["sector"]}</a></span>'
+            f'</div></header><div class="entry-summary"><p>{fields["name"]} {excerpt}</p></div></article>'
+        )
+    parts.append('</main><aside class="widget-area">')
+    parts.append(''.join(f'<section class="widget"><h3>Trending {i}</h3><ul>'
+                         + ''.join(f'<li><a href="{base_url}/trending/{i}-{j}/">{filler[j * 7:j * 7 + 40]}</a></li>'
+                                   for j in range(10))
+                         + '</ul></section>' for i in range(8)))
+    parts.append('</aside><footer class="site-footer"><script>'
+                 + ''.join(f'console.log({i});' for i in range(800)) + '</script></footer></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def fixture_path(source_name: str) -> str:
+    return os.path.join(FIXTURE_DIR, f'{source_name}.html')
+
+
+def load_fixture_pages(sources: Dict[str, Dict], names: Iterable[str] = None) -> Dict[str, bytes]:
+    """Return recorded pages where available, synthetic ones otherwise"""
+    pages = {}
+    for source_name in names or sources:
+        for path in (fixture_path(source_name), os.path.join(SYNTHETIC_DIR, f'{source_name}.html')):
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    pages[source_name] = f.read()
+                break
+        else:
+            pages[source_name] = synthetic_page(source_name, sources[source_name]['url'])
+    return pages
@@ -0,0 +1,28 @@
+"""Record live homepages of the configured sources as benchmark fixtures
+
+Usage: python benchmarks/record_fixtures.py [source ...]
+"""
+import os
+import sys
+
+from common import load_scraper_module
+from fixtures import FIXTURE_DIR, fixture_path
+
+
+def main():
+    ss = load_scraper_module()
+    scraper = ss.AfricanStartupScraper()
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for source_name in sys.argv[1:] or scraper.sources:
+        url = scraper.sources[source_name]['url']
+        response = scraper.session.get(url, timeout=30)
+        if response.ok:
+            with open(fixture_path(source_name), 'wb') as f:
+                f.write(response.content)
+            print(f'{source_name}: {len(response.content)} bytes')
+        else:
+            print(f'{source_name}: HTTP {response.status_code}, skipped')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,500 +1,3789 @@
-import requests
-from bs4 import BeautifulSoup
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import schedule
 import time
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import queue
+from datetime import datetime, timedelta, timezone
 import json
 import re
-from typing import List, Dict, Optional
+import math
+import operator
+import random
+import heapq
+import zlib
+import mmap
+import marshal
+from array import array
+import html
+from io import BytesIO
+from xml.etree import ElementTree
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional, Tuple, Callable, Iterator, TYPE_CHECKING
+from collections import Counter, OrderedDict, deque
+import uuid
+import socket
+from bisect import bisect_left, bisect_right
 import os
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, asdict, astuple, replace
 import sqlite3
 import threading
-from flask import Flask, request, jsonify, render_template_string
+from functools import cached_property, lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+from flask import Flask, Response, request, jsonify, render_template_string
 import argparse
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('startup_scraper.log'),
-        logging.StreamHandler()
+# requests, bs4, smtplib and the email package are imported where they are
+# first used so the web process can answer requests before paying for them
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    import requests
+    from bs4 import BeautifulSoup
+
+# Log file rotation. By default the file is rotated externally (logrotate
+# or the host's log shipper) and every process only appends to it, which
+# is safe with several workers on one file; a size here rotates it in
+# process instead, for single-process deployments. /logs reads up to
+# LOG_BACKUP_COUNT numbered backups either way
+LOG_PATH = os.getenv('SCRAPER_LOG_FILE', 'startup_scraper.log')
+LOG_MAX_BYTES = int(os.getenv('SCRAPER_LOG_MAX_BYTES', '0'))
+LOG_BACKUP_COUNT = int(os.getenv('SCRAPER_LOG_BACKUPS', '5'))
+
+# Source being scraped by the current thread, attached to its log records
+_log_context = threading.local()
+
+class SourceContextFilter(logging.Filter):
+    """Tag records with the news source the logging thread is working on"""
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'source'):
+            record.source = getattr(_log_context, 'source', None)
+        return True
+
+def log_entry(record: logging.LogRecord) -> Dict:
+    """Structured form of a log record"""
+    entry = {
+        'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+        'level': record.levelname,
+        'message': record.getMessage(),
+        'source': getattr(record, 'source', None),
+        'thread': record.threadName
+    }
+    if record.exc_info:
+        entry['exc'] = logging.Formatter().formatException(record.exc_info)
+    return entry
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per line"""
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(log_entry(record), ensure_ascii=False)
+
+def log_entry_matches(entry: Dict, min_level: int = logging.NOTSET, source: Optional[str] = None) -> bool:
+    """Apply /logs level and source filters; legacy lines rank as NOTSET"""
+    level = logging.getLevelName(entry.get('level') or 'NOTSET')
+    if min_level and (level if isinstance(level, int) else logging.NOTSET) < min_level:
+        return False
+    return not source or entry.get('source') == source
+
+class LogBroadcaster(logging.Handler):
+    """Fan log records out to live subscribers such as /logs/stream"""
+    def __init__(self, queue_size: int = 1000):
+        super().__init__()
+        self.queue_size = queue_size
+        self._subscribers: Dict[queue.Queue, Tuple[int, Optional[str]]] = {}
+        self._subscribers_lock = threading.Lock()
+
+    def subscribe(self, min_level: int = logging.NOTSET, source: Optional[str] = None) -> queue.Queue:
+        subscription = queue.Queue(maxsize=self.queue_size)
+        with self._subscribers_lock:
+            self._subscribers[subscription] = (min_level, source)
+        return subscription
+
+    def unsubscribe(self, subscription: queue.Queue):
+        with self._subscribers_lock:
+            self._subscribers.pop(subscription, None)
+
+    def emit(self, record: logging.LogRecord):
+        if not self._subscribers:
+            return
+        entry = log_entry(record)
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers.items())
+        for subscription, (min_level, source) in subscribers:
+            if log_entry_matches(entry, min_level, source):
+                try:
+                    subscription.put_nowait(entry)
+                except queue.Full:
+                    pass
+
+LOG_BROADCAST = LogBroadcaster()
+
+def iter_lines_reversed(path: str, block_size: int = 8192) -> Iterator[str]:
+    """Yield a file's lines last to first, reading backwards in blocks"""
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b''
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            lines = (f.read(step) + remainder).split(b'\n')
+            # The first piece may be the tail of a line that starts earlier
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line.decode('utf-8', errors='replace')
+        if remainder:
+            yield remainder.decode('utf-8', errors='replace')
+
+def read_log_tail(count: int, min_level: int = logging.NOTSET, source: Optional[str] = None) -> List[Dict]:
+    """Return the last count matching log entries, oldest first"""
+    entries = []
+    paths = [LOG_PATH] + [f"{LOG_PATH}.{number}" for number in range(1, LOG_BACKUP_COUNT + 1)]
+    for path in paths:
+        if len(entries) >= count or not os.path.exists(path):
+            break
+        for line in iter_lines_reversed(path):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Plain-text lines written before logs were structured
+                entry = {'ts': None, 'level': None, 'message': line, 'source': None}
+            if log_entry_matches(entry, min_level, source):
+                entries.append(entry)
+                if len(entries) >= count:
+                    break
+    entries.reverse()
+    return entries
+
+def in_worker_process() -> bool:
+    """True in a multiprocessing child, such as a spawned parse or replay worker"""
+    # Only a process that uses multiprocessing has it imported
+    multiprocessing = sys.modules.get('multiprocessing')
+    return multiprocessing is not None and multiprocessing.parent_process() is not None
+
+def configure_logging():
+    """JSON lines in the log file, plain text on the console"""
+    if LOG_MAX_BYTES:
+        file_handler = logging.handlers.RotatingFileHandler(
+            LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        )
+    else:
+        # Appends only, and reopens the file once a rotation has moved it
+        file_handler = logging.handlers.WatchedFileHandler(LOG_PATH, encoding='utf-8')
+    file_handler.setFormatter(JsonLineFormatter())
+    for handler in (file_handler, LOG_BROADCAST):
+        handler.addFilter(SourceContextFilter())
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            file_handler,
+            logging.StreamHandler(),
+            LOG_BROADCAST
+        ]
+    )
+
+# Spawned workers import this module too; with in-process rotation a
+# second rotating handler on the same file would rotate it out from under
+# the main process, so workers only log to the console
+if in_worker_process():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+else:
+    configure_logging()
+
+# Fetch engine tuning
+MAX_CONCURRENT_FETCHES = int(os.getenv('SCRAPER_MAX_CONCURRENCY', '8'))
+PER_HOST_DELAY = float(os.getenv('SCRAPER_PER_HOST_DELAY', '1.0'))
+
+# HTML parser backend: 'html.parser', 'lxml', or 'strainer' (only builds
+# the tree for candidate article containers)
+HTML_PARSER_BACKEND = os.getenv('SCRAPER_HTML_PARSER', 'html.parser')
+PARSER_BACKENDS = ('html.parser', 'lxml', 'strainer')
+
+# Worker processes for HTML parsing and classification; 0 parses in the
+# fetching thread
+PARSE_WORKERS = int(os.getenv('SCRAPER_PARSE_WORKERS', '0'))
+
+# Selector cascades tried by parse_generic_wordpress, in priority order
+ARTICLE_SELECTORS = [
+    'article',
+    '.post',
+    '.entry',
+    '.content-item',
+    '.post-item',
+    '.article-item',
+    '.blog-post',
+    '[class*="post"]',
+    '[class*="article"]'
+]
+TITLE_SELECTORS = ['h1', 'h2', 'h3', '.entry-title', '.post-title', '.article-title', '.title']
+DESCRIPTION_SELECTORS = ['.entry-content', '.post-content', '.excerpt', '.summary', '.description', 'p']
+DATE_SELECTORS = ['time', '.date', '.post-date', '.entry-date', '[datetime]']
+MAX_ARTICLES_PER_PAGE = 15
+
+# Structured feed fast path: sources without a feed are re-probed weekly
+FEED_REDISCOVERY_DAYS = 7
+WP_JSON_POSTS_PATH = f'/wp-json/wp/v2/posts?per_page={MAX_ARTICLES_PER_PAGE}&_fields=link,title,excerpt,date_gmt'
+
+# Expanded comprehensive launch signals regex pattern. This is the reference
+# definition; matching is done by LaunchSignalClassifier, which must agree with it.
+LAUNCH_SIGNALS_PATTERN = r"""
+    \b(
+        # core launch verbs
+        launch(?:es|ed|ing)? |
+        ship(?:s|ped|ping)? |
+        release(?:s|d|ing)? |
+        roll(?:s|ed)?\s*out |
+        debut(?:s|ed|ing)? |
+        unveil(?:s|ed|ing)? |
+        introduce(?:s|d|ing)? |
+        # "go live" family
+        go(?:es)?\s*live |
+        we'?re\s+live |
+        now\s*live |
+        now\s+available |
+        # beta / early-access
+        public\s+beta |
+        private\s+beta |
+        early\s+access |
+        soft\s+launch |
+        MVP\s+live |
+        v(?:\d+\.)?\d+\s*release |        # v1.0, v2.3.1, etc.
+        # stealth exits
+        out\s+of\s+stealth |
+        emerges?\s+from\s+stealth |
+        exits?\s+stealth\s*mode |
+        breaks?\s+cover |
+        # wait-list / sign-up
+        waitlist\s+open |
+        sign[-\s]*ups?\s+open |
+        open\s*for\s*signups? |
+        # funding-tied cues
+        secures?\s+pre[-\s]*seed |
+        raises?\s+angel\s+round |
+        funded\s+to\s+launch |
+        # accelerator / demo-day
+        joins?\s+.*\baccelerator\b |
+        graduates?\s+from\s+accelerator |
+        demo\s*day\s*debut |
+        # market / product expansion
+        enters?\s+new\s+market |
+        expands?\s+to |
+        opens?\s+operations\s+in |
+        adds?\s+new\s+platform |
+        launches?\s+in |
+        # additional signals
+        new\s+product |
+        new\s+service |
+        new\s+platform |
+        new\s+app |
+        new\s+feature |
+        announce(?:s|d|ing)? |
+        reveal(?:s|ed|ing)? |
+        present(?:s|ed|ing)? |
+        showcase(?:s|d|ing)? |
+        expansion |
+        milestone |
+        breakthrough |
+        innovation |
+        partnership |
+        collaboration |
+        integration |
+        upgrade(?:s|d|ing)? |
+        enhancement(?:s)? |
+        improvement(?:s)? |
+        beta\s+test |
+        pilot\s+program |
+        pre[-\s]*launch |
+        coming\s+soon |
+        available\s+now
+    )\b
+    """
+
+# The literal branches of LAUNCH_SIGNALS_PATTERN grouped by signal.
+# In phrases ' ' stands for \s+ and '_' for \s*.
+LAUNCH_SIGNAL_PHRASES = {
+    'launch': ['launch', 'launches', 'launched', 'launching', 'launch in', 'launches in'],
+    'ship': ['ship', 'ships', 'shipped', 'shipping'],
+    'release': ['release', 'releases', 'released', 'releaseing'],
+    'roll out': ['roll_out', 'rolls_out', 'rolled_out'],
+    'debut': ['debut', 'debuts', 'debuted', 'debuting'],
+    'unveil': ['unveil', 'unveils', 'unveiled', 'unveiling'],
+    'introduce': ['introduce', 'introduces', 'introduced', 'introduceing'],
+    'go live': ['go_live', 'goes_live', "we're live", 'were live', 'now_live', 'mvp live'],
+    'now available': ['now available', 'available now'],
+    'beta': ['public beta', 'private beta', 'beta test'],
+    'early access': ['early access'],
+    'soft launch': ['soft launch'],
+    'out of stealth': ['out of stealth', 'emerge from stealth', 'emerges from stealth',
+                       'exit stealth_mode', 'exits stealth_mode', 'break cover', 'breaks cover'],
+    'sign-ups open': ['waitlist open', 'open_for_signup', 'open_for_signups'],
+    'funding': ['raise angel round', 'raises angel round', 'funded to launch'],
+    'accelerator': ['graduate from accelerator', 'graduates from accelerator'],
+    'demo day': ['demo_day_debut'],
+    'expansion': ['enter new market', 'enters new market', 'expand to', 'expands to',
+                  'open operations in', 'opens operations in', 'expansion'],
+    'new offering': ['add new platform', 'adds new platform', 'new product', 'new service',
+                     'new platform', 'new app', 'new feature'],
+    'announce': ['announce', 'announces', 'announced', 'announceing'],
+    'reveal': ['reveal', 'reveals', 'revealed', 'revealing'],
+    'present': ['present', 'presents', 'presented', 'presenting'],
+    'showcase': ['showcase', 'showcases', 'showcased', 'showcaseing'],
+    'milestone': ['milestone'],
+    'breakthrough': ['breakthrough'],
+    'innovation': ['innovation'],
+    'partnership': ['partnership', 'collaboration', 'integration'],
+    'upgrade': ['upgrade', 'upgrades', 'upgraded', 'upgradeing', 'enhancement', 'enhancements',
+                'improvement', 'improvements'],
+    'pilot program': ['pilot program'],
+    'coming soon': ['coming soon']
+}
+
+# Branches of LAUNCH_SIGNALS_PATTERN that are not plain phrases, with the
+# substrings that must all be present before the regex is worth running
+LAUNCH_SIGNAL_PATTERNS = {
+    'release': (r'v(?:\d+\.)?\d+\s*release', ('release',)),
+    'sign-ups open': (r'sign[-\s]*ups?\s+open', ('sign', 'open')),
+    'funding': (r'secures?\s+pre[-\s]*seed', ('secure', 'seed')),
+    'pre-launch': (r'pre[-\s]*launch', ('pre', 'launch'))
+}
+
+# Per-source watermarks: recently seen item urls to remember, consecutive
+# seen items that mark the end of new content (a feed scan stops there; an
+# HTML listing, whose sticky and featured posts break date order, is read
+# in full and only stops paginating when it ends in such a run), and
+# listing pages to walk on busy days
+WATERMARK_SIZE = int(os.getenv('SCRAPER_WATERMARK_SIZE', '100'))
+WATERMARK_OVERLAP = int(os.getenv('SCRAPER_WATERMARK_OVERLAP', '2'))
+MAX_PAGES = int(os.getenv('SCRAPER_MAX_PAGES', '1'))
+
+# Adaptive polling: between digests each source is re-scraped on its own
+# interval, sized to find about POLL_TARGET_ITEMS new listing items, and
+# what it finds waits in the pending queue for the daily digest
+ADAPTIVE_POLLING = os.getenv('SCRAPER_ADAPTIVE_POLLING', '1') == '1'
+POLL_DEFAULT_INTERVAL = float(os.getenv('SCRAPER_POLL_DEFAULT_INTERVAL', str(6 * 3600)))
+POLL_MIN_INTERVAL = float(os.getenv('SCRAPER_POLL_MIN_INTERVAL', str(30 * 60)))
+POLL_MAX_INTERVAL = float(os.getenv('SCRAPER_POLL_MAX_INTERVAL', str(48 * 3600)))
+POLL_TARGET_ITEMS = float(os.getenv('SCRAPER_POLL_TARGET_ITEMS', '3'))
+POLL_SMOOTHING = 0.3  # weight of the latest poll in the rate averages
+POLL_JITTER = 0.1  # intervals vary by up to this fraction either way
+POLL_CHECK_SECONDS = 60
+
+# Source health. Fetch timeouts follow each source's recent p95 latency,
+# and after BREAKER_THRESHOLD failed scrapes in a row a source's circuit
+# opens: it is skipped, then probed after a backoff that doubles with each
+# failed probe
+FETCH_TIMEOUT = float(os.getenv('SCRAPER_FETCH_TIMEOUT', '15'))
+FETCH_TIMEOUT_MIN = float(os.getenv('SCRAPER_FETCH_TIMEOUT_MIN', '3'))
+TIMEOUT_P95_MULTIPLIER = 3
+LATENCY_WINDOW = 50  # recent successful fetch times kept per source
+LATENCY_MIN_SAMPLES = 5
+BREAKER_THRESHOLD = int(os.getenv('SCRAPER_BREAKER_THRESHOLD', '3'))
+BREAKER_BASE_BACKOFF = float(os.getenv('SCRAPER_BREAKER_BACKOFF', str(30 * 60)))
+BREAKER_MAX_BACKOFF = 24 * 3600
+
+# Query parameters that only track where a click came from; utm_* are
+# dropped as well
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'igshid', 'ref', 'ref_src'})
+
+# Near-duplicate detection: MinHash signatures over pairs of consecutive
+# content words in the title and description, split into bands for LSH;
+# 32 bands of 2 rows find pairs above 0.4 similarity almost surely. Stories
+# about different known startups never match, and the stricter threshold
+# applies when either startup is unknown. Texts with fewer word pairs than
+# NEAR_DUP_MIN_SHINGLES, such as bare headlines, are never duplicates
+NEAR_DUP_THRESHOLD = float(os.getenv('SCRAPER_NEAR_DUP_THRESHOLD', '0.4'))
+NEAR_DUP_UNNAMED_THRESHOLD = float(os.getenv('SCRAPER_NEAR_DUP_UNNAMED_THRESHOLD', '0.8'))
+NEAR_DUP_MIN_SHINGLES = 8
+NEAR_DUP_DAYS = int(os.getenv('SCRAPER_NEAR_DUP_DAYS', '14'))
+MINHASH_BANDS = 32
+MINHASH_ROWS = 2
+
+# /logs defaults and limits, and the /logs/stream keepalive interval
+LOG_TAIL_LINES = 50
+LOG_TAIL_MAX_LINES = 1000
+LOG_STREAM_HEARTBEAT = 15
+
+# Rendered digest entries kept for reuse across renders, keyed by their fields
+DIGEST_FRAGMENT_CACHE_SIZE = int(os.getenv('SCRAPER_DIGEST_CACHE', '10000'))
+
+# Archive search results per page, and the most a caller may ask for
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
+# Optional webhook that receives each new article as JSON while a run streams
+WEBHOOK_URL = os.getenv('SCRAPER_WEBHOOK_URL')
+
+# Background scrape jobs kept for /jobs
+JOB_HISTORY_SIZE = int(os.getenv('SCRAPER_JOB_HISTORY', '50'))
+
+# Multi-worker coordination. Workers sharing a lease database split the
+# sources into shards and leave the daily digest to one of them; without
+# one every process works alone
+COORDINATION_DATABASE = os.getenv('SCRAPER_COORDINATION_DB')
+SOURCE_SHARDS = int(os.getenv('SCRAPER_SHARDS', '8'))
+LEASE_TTL = float(os.getenv('SCRAPER_LEASE_TTL', '60'))
+# How long the digest sender waits for other workers to poll their shards
+DIGEST_WAIT = float(os.getenv('SCRAPER_DIGEST_WAIT', '600'))
+DIGEST_LEASE_TTL = 36 * 3600
+
+# Article database
+DATABASE_PATH = os.getenv('SCRAPER_DATABASE', 'sent_articles.db')
+
+# Conditional-GET response cache
+HTTP_CACHE_PATH = os.getenv('SCRAPER_HTTP_CACHE', 'http_cache.db')
+HTTP_CACHE_MAX_BYTES = int(os.getenv('SCRAPER_HTTP_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+
+# Streaming fetch: responses are read in chunks up to STREAM_MAX_BYTES, and
+# HTML listings lose their <script>/<style> elements on the way in and stop
+# being read once STREAM_ARTICLE_LIMIT article containers have gone by.
+# The limit leaves slack over MAX_ARTICLES_PER_PAGE for containers that are
+# not listing entries
+STREAM_FETCH = os.getenv('SCRAPER_STREAM_FETCH', '1') == '1'
+STREAM_MAX_BYTES = int(os.getenv('SCRAPER_STREAM_MAX_BYTES', str(2 * 1024 * 1024)))
+STREAM_ARTICLE_LIMIT = int(os.getenv('SCRAPER_STREAM_ARTICLE_LIMIT', '30'))
+STREAM_CHUNK_SIZE = 16 * 1024
+# Listing entries counted towards STREAM_ARTICLE_LIMIT, in the parser's
+# priority order. Unlike its last-resort [class*=...] selectors these match
+# whole class tokens, so menu items like "menu-item-type-post_type" never count
+TRIM_CONTAINER_SELECTORS = ['article', '.post', '.type-post', '.entry', '.content-item', '.post-item',
+                            '.article-item', '.blog-post']
+
+# Raw response archive: when set, every fetched page goes into a per-day
+# WARC file under this directory so past days can be replayed through the
+# current parser and classifier (--mode replay). Off by default: archived
+# pages are read in full, past the trimmer's early stop, and the archive
+# is never pruned
+RESPONSE_ARCHIVE_DIR = os.getenv('SCRAPER_RESPONSE_ARCHIVE', '')
+RESPONSE_ARCHIVE_COMPRESSION = 6
+REPLAY_BATCH_SIZE = 200  # archived responses per replay task
+
+# Startup gazetteer: known startups and their aliases (see the data file for
+# its format) plus the sector keywords below, compiled into a word trie that
+# is cached in GAZETTEER_INDEX_PATH and rebuilt whenever either changes
+GAZETTEER_PATH = os.getenv(
+    'SCRAPER_GAZETTEER', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_gazetteer.tsv')
+)
+GAZETTEER_INDEX_PATH = os.getenv('SCRAPER_GAZETTEER_INDEX', 'gazetteer_index.bin')
+GAZETTEER_FORMAT = 2  # bumped whenever the compiled index layout changes
+
+# Sector keywords, case-insensitive. An article's category is its startup's
+# when the gazetteer knows it, otherwise the sector mentioned most
+SECTOR_KEYWORDS = {
+    'Fintech': ['fintech', 'payments', 'payment platform', 'digital bank', 'neobank', 'lending', 'remittance',
+                'remittances', 'mobile money', 'cryptocurrency', 'crypto exchange', 'stablecoin', 'buy now pay later',
+                'BNPL', 'digital wallet', 'microfinance'],
+    'Healthtech': ['healthtech', 'health tech', 'telemedicine', 'telehealth', 'e-pharmacy', 'pharmacy', 'pharmacies',
+                   'healthcare', 'diagnostics', 'clinics'],
+    'Agritech': ['agritech', 'agtech', 'agriculture', 'agricultural', 'farmers', 'farming', 'agribusiness'],
+    'Edtech': ['edtech', 'e-learning', 'learning platform', 'online learning', 'tutoring', 'students'],
+    'Logistics': ['logistics', 'last-mile', 'last mile', 'delivery', 'deliveries', 'shipping', 'freight', 'trucking',
+                  'haulage', 'courier', 'supply chain', 'fulfilment', 'fulfillment'],
+    'Mobility': ['mobility', 'ride-hailing', 'ride hailing', 'electric vehicles', 'electric vehicle', 'e-mobility',
+                 'electric motorcycles', 'vehicle financing', 'public transport'],
+    'E-commerce': ['e-commerce', 'ecommerce', 'online marketplace', 'b2b commerce', 'social commerce', 'online store',
+                   'retailers', 'informal retail'],
+    'Energy': ['solar', 'off-grid', 'clean energy', 'renewable energy', 'mini-grid', 'mini-grids', 'electricity',
+               'pay-as-you-go solar'],
+    'Insurtech': ['insurtech', 'insurance', 'microinsurance'],
+    'Proptech': ['proptech', 'real estate', 'property', 'housing', 'rentals'],
+    'HR tech': ['hr tech', 'hrtech', 'recruitment', 'payroll', 'remote talent', 'hiring platform'],
+    'AI': ['artificial intelligence', 'machine learning', 'generative AI', 'AI-powered', 'large language model']
+}
+
+@dataclass
+class StartupNews:
+    title: str
+    url: str
+    description: str
+    source: str
+    date: str
+    startup_name: str = ""
+    category: str = ""
+    matched_signal: str = ""
+    duplicate_of: str = ""  # url of the run's first story on the same launch
+
+@dataclass
+class FetchResult:
+    url: str
+    content: bytes
+    status_code: int
+    not_modified: bool = False
+
+@dataclass
+class ParsedPage:
+    articles: List[StartupNews]
+    item_urls: List[str] = field(default_factory=list)  # unseen items, matched or not
+    newest: Optional[str] = None  # latest feed item date on the page
+    reached_watermark: bool = False
+    unmatched: List[StartupNews] = field(default_factory=list)  # kept for the archive only
+
+def _is_article_container(name: str, attrs: Dict) -> bool:
+    """Match the elements parse_generic_wordpress can select as articles"""
+    if name == 'article':
+        return True
+    classes = attrs.get('class') or ''
+    if isinstance(classes, list):
+        classes = ' '.join(classes)
+    if 'post' in classes or 'article' in classes:
+        return True
+    tokens = classes.split()
+    return 'entry' in tokens or 'content-item' in tokens
+
+_SKIPPED_ELEMENT_RE = re.compile(rb'<(script|style)\b', re.IGNORECASE)
+_SKIPPED_ELEMENT_END_RE = {
+    b'script': re.compile(rb'</script\s*>', re.IGNORECASE),
+    b'style': re.compile(rb'</style\s*>', re.IGNORECASE)
+}
+_TAG_RE = re.compile(rb'<(/?)([a-zA-Z][a-zA-Z0-9-]*)([^>]*)>')
+_CLASS_ATTR_RE = re.compile(rb'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''', re.IGNORECASE)
+_TITLE_TAGS = frozenset({b'h1', b'h2', b'h3'})
+_TITLE_CLASS_RE = re.compile(rb'''\bclass\s*=\s*["']?[^"'>]*\b(?:(?:entry|post|article)-)?title\b''', re.IGNORECASE)
+_SIMPLE_SELECTOR_RE = re.compile(r'''^(?:([a-zA-Z][a-zA-Z0-9-]*)|\.([\w-]+)|\[class\*=["']?([^"'\]]+)["']?\])$''')
+
+def container_rules(selectors: List[str]) -> List[Tuple[str, str, str]]:
+    """(tag, class token, class substring) rules for simple selectors, else empty"""
+    rules = []
+    for selector in selectors:
+        match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+        if match is None:
+            return []
+        tag, token, substring = match.groups()
+        rules.append(((tag or '').lower(), token or '', substring or ''))
+    return rules
+
+class PageTrimmer:
+    """Incremental filter that strips scripts and styles from a streamed HTML page"""
+    def __init__(self, limit: int = STREAM_ARTICLE_LIMIT, selectors: List[str] = TRIM_CONTAINER_SELECTORS):
+        self.limit = limit
+        self.rules = container_rules(selectors)
+        self.containers = 0
+        self._rank: Optional[int] = None  # index of the best selector matched so far
+        self.stripped_bytes = 0
+        self._carry = b''
+        self._skip_end: Optional[re.Pattern] = None  # closing tag of the element being dropped
+        self._open: Optional[bytes] = None  # tag name of the open outermost container
+        self._depth = 0
+        self._title = self._link = False  # seen inside the open container
+
+    @property
+    def done(self) -> bool:
+        return self.containers >= self.limit
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Filter the next chunk, returning the bytes to keep"""
+        buffer = self._carry + chunk
+        self._carry = b''
+        kept = []
+        position = 0
+        while position < len(buffer):
+            if self._skip_end is not None:
+                match = self._skip_end.search(buffer, position)
+                if match is None:
+                    # Hold back enough to match a closing tag split across chunks
+                    keep_from = max(position, len(buffer) - 16)
+                    self.stripped_bytes += keep_from - position
+                    self._carry = buffer[keep_from:]
+                    break
+                self.stripped_bytes += match.end() - position
+                position = match.end()
+                self._skip_end = None
+                continue
+            match = _SKIPPED_ELEMENT_RE.search(buffer, position)
+            if match:
+                end = match.start()
+            else:
+                end = len(buffer)
+                # A tag cut off at the end of the chunk waits for the next one
+                tag_start = buffer.rfind(b'<', position)
+                if tag_start != -1 and buffer.find(b'>', tag_start) == -1:
+                    end = tag_start
+            self._scan(buffer[position:end])
+            kept.append(buffer[position:end])
+            if match is None:
+                self._carry = buffer[end:]
+                break
+            self._skip_end = _SKIPPED_ELEMENT_END_RE[match.group(1).lower()]
+            position = match.start()
+        return b''.join(kept)
+
+    def close(self) -> bytes:
+        """Whatever was held back once the stream has ended"""
+        carry, self._carry = self._carry, b''
+        if self._skip_end is not None:
+            self.stripped_bytes += len(carry)
+            return b''
+        return carry
+
+    def _scan(self, data: bytes):
+        for match in _TAG_RE.finditer(data):
+            closing, name = match.group(1), match.group(2).lower()
+            if self._open is not None:
+                if name == self._open and not match.group(3).endswith(b'/'):
+                    self._depth += -1 if closing else 1
+                    if not self._depth:
+                        self._open = None
+                        self.containers += self._title and self._link
+                elif not closing:
+                    if name in _TITLE_TAGS or _TITLE_CLASS_RE.search(match.group(3)):
+                        self._title = True
+                    if name == b'a' and b'href' in match.group(3).lower():
+                        self._link = True
+                continue
+            if closing:
+                continue
+            rank = self._match(name.decode('ascii'), match.group(3))
+            if rank is None:
+                continue
+            # The parser selects by the best selector that matches anything,
+            # so only those count; a better one starts the count again
+            if self._rank is None or rank < self._rank:
+                self._rank, self.containers = rank, 0
+            if rank == self._rank:
+                self._open = name
+                self._depth = 1
+                self._title = self._link = False
+
+    def _match(self, name: str, attrs: bytes) -> Optional[int]:
+        """Index of the first rule an opening tag matches, or None"""
+        classes = tokens = None
+        for rank, (tag, token, substring) in enumerate(self.rules):
+            if tag:
+                if name == tag:
+                    return rank
+                continue
+            if classes is None:
+                found = _CLASS_ATTR_RE.search(attrs)
+                # class="" leaves every group empty or None
+                classes = next(filter(None, found.groups()), b'').decode('utf-8', 'replace') if found else ''
+                tokens = classes.split()
+            if (token and token in tokens) or (substring and substring in classes):
+                return rank
+        return None
+
+@lru_cache(maxsize=None)
+def article_strainer():
+    """SoupStrainer keeping only article containers, built on first use"""
+    from bs4 import SoupStrainer
+    return SoupStrainer(_is_article_container)
+
+def build_soup(content: bytes, backend: str = HTML_PARSER_BACKEND) -> 'BeautifulSoup':
+    """Parse a page with the requested backend, falling back to html.parser"""
+    from bs4 import BeautifulSoup
+    from bs4.builder import builder_registry
+    if backend == 'html.parser':
+        return BeautifulSoup(content, 'html.parser')
+    features = 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
+    if backend == 'lxml':
+        if features != 'lxml':
+            logging.warning("lxml is not installed, falling back to html.parser")
+        return BeautifulSoup(content, features)
+    if backend == 'strainer':
+        return BeautifulSoup(content, features, parse_only=article_strainer())
+    raise ValueError(f"Unknown parser backend: {backend}")
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def strip_html(text: Optional[str]) -> str:
+    """Reduce an HTML fragment from a feed to plain text"""
+    if not text:
+        return ""
+    return _WHITESPACE_RE.sub(' ', html.unescape(_HTML_TAG_RE.sub(' ', text))).strip()
+
+def parse_xml_feed(content: bytes, limit: int = MAX_ARTICLES_PER_PAGE) -> List[Dict[str, str]]:
+    """Stream items out of an RSS 2.0 or Atom feed without keeping the tree"""
+    items = []
+    current = None
+    root_seen = False
+    for event, elem in ElementTree.iterparse(BytesIO(content), events=('start', 'end')):
+        tag = elem.tag.rsplit('}', 1)[-1]
+        if not root_seen:
+            if tag not in ('rss', 'feed', 'RDF'):
+                raise ValueError(f"Not an RSS/Atom document: <{tag}>")
+            root_seen = True
+        if event == 'start':
+            if tag in ('item', 'entry'):
+                current = {}
+            continue
+        if current is None:
+            continue
+        if tag in ('item', 'entry'):
+            items.append(current)
+            current = None
+            elem.clear()
+            if len(items) >= limit:
+                break
+        elif tag == 'link':
+            # Atom carries the url in href; prefer the alternate (html) link
+            href = elem.get('href')
+            if href is None:
+                current.setdefault('link', (elem.text or '').strip())
+            elif elem.get('rel', 'alternate') == 'alternate':
+                current.setdefault('link', href)
+        elif tag == 'title':
+            current.setdefault('title', elem.text or '')
+        elif tag in ('description', 'summary', 'encoded', 'content'):
+            current.setdefault('description', elem.text or '')
+        elif tag in ('pubDate', 'published', 'updated', 'date'):
+            current.setdefault('date', (elem.text or '').strip())
+    return items
+
+def parse_wp_json(content: bytes, limit: int = MAX_ARTICLES_PER_PAGE) -> List[Dict[str, str]]:
+    """Extract items from a WordPress REST API posts listing"""
+    posts = json.loads(content)
+    if not isinstance(posts, list):
+        raise ValueError("WordPress posts endpoint did not return a list")
+    return [
+        {
+            'title': post['title']['rendered'],
+            'link': post['link'],
+            'description': post.get('excerpt', {}).get('rendered', ''),
+            'date': post.get('date_gmt') or post.get('date') or ''
+        }
+        for post in posts[:limit]
     ]
+
+def parse_feed_items(content: bytes, feed_type: str) -> List[Dict[str, str]]:
+    """Items of an RSS/Atom ('rss') or WordPress REST ('wp-json') feed"""
+    if feed_type == 'wp-json':
+        return parse_wp_json(content)
+    return parse_xml_feed(content)
+
+def page_url(url: str, page: int, kind: str) -> str:
+    """Return the url of a listing's nth page using WordPress conventions"""
+    if page == 1:
+        return url
+    if kind == 'html':
+        return f"{url.rstrip('/')}/page/{page}/"
+    separator = '&' if '?' in url else '?'
+    return f"{url}{separator}{'page' if kind == 'wp-json' else 'paged'}={page}"
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds for an ISO 8601 date, treating naive times as UTC"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def canonicalize_url(url: str) -> str:
+    """Normalize an article url so tracking and cosmetic variants compare equal"""
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').rstrip('.')
+    if port and (scheme, port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{port}"
+    query = urlencode([
+        (key, value) for key, value in sorted(parse_qsl(parts.query, keep_blank_values=True))
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ])
+    return urlunsplit((scheme, host, parts.path.rstrip('/') or '/', query, ''))
+
+def normalize_feed_date(value: str) -> str:
+    """Turn RFC 822 feed dates into ISO 8601, leaving ISO dates untouched"""
+    if not value:
+        return datetime.now().strftime('%Y-%m-%d')
+    try:
+        return parsedate_to_datetime(value).isoformat()
+    except (TypeError, ValueError):
+        return value
+
+# The only non-ASCII characters that re.IGNORECASE matches against ASCII
+# letters; folding them first makes str.lower() agree with the regex
+_SIGNAL_CASE_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+_WORD_SPLIT = re.compile(r'(\W+)').split
+
+def _expand_phrase(phrase: str) -> List[List[str]]:
+    """Expand a phrase into the word sequences it can appear as in text"""
+    choices = []
+    for group in phrase.split(' '):
+        if "'" in group:
+            head, tail = group.split("'", 1)
+            choices.append([[head, "'" + tail]])
+            continue
+        parts = group.split('_')
+        options = []
+        for mask in range(2 ** (len(parts) - 1)):
+            words = [parts[0]]
+            for bit, part in enumerate(parts[1:]):
+                if mask & (1 << bit):
+                    words.append(part)
+                else:
+                    words[-1] += part
+            options.append(words)
+        choices.append(options)
+    sequences = [[]]
+    for options in choices:
+        sequences = [sequence + words for sequence in sequences for words in options]
+    return sequences
+
+class PhraseTrie:
+    """Word-level trie over launch signal phrases"""
+    LABEL = None
+
+    def __init__(self):
+        self.root: Dict = {}
+
+    def add(self, words: List[str], label: str):
+        node = self.root
+        for word in words:
+            node = node.setdefault(word, {})
+        node.setdefault(self.LABEL, label)
+
+    def find(self, parts: List[str]) -> Optional[Tuple[int, str]]:
+        """Return (part index, label) of the leftmost phrase in a token list"""
+        root = self.root
+        count = len(parts)
+        for index in range(0, count, 2):
+            node = root.get(parts[index])
+            if node is None:
+                continue
+            label = node.get(self.LABEL)
+            position = index
+            while position + 2 < count:
+                separator = parts[position + 1]
+                word = parts[position + 2]
+                node = node.get(word if separator == ' ' else separator + word)
+                if node is None:
+                    break
+                position += 2
+                label = node.get(self.LABEL, label)
+            if label:
+                return index, label
+        return None
+
+class LaunchSignalClassifier:
+    """Launch signal matcher equivalent to LAUNCH_SIGNALS_PATTERN"""
+    def __init__(self, phrases: Dict[str, List[str]] = LAUNCH_SIGNAL_PHRASES,
+                 patterns: Dict[str, Tuple[str, Tuple[str, ...]]] = LAUNCH_SIGNAL_PATTERNS):
+        self.trie = PhraseTrie()
+        for label, variants in phrases.items():
+            for variant in variants:
+                for words in _expand_phrase(variant):
+                    self.trie.add(words, label)
+        self.patterns = [
+            (label, re.compile(r'\b(?:' + pattern + r')\b').search, triggers)
+            for label, (pattern, triggers) in patterns.items()
+        ]
+        self._join = re.compile(r'\bjoins?\s+')
+        self._accelerator = re.compile(r'\baccelerator\b')
+
+    @staticmethod
+    def _fold(text: str) -> str:
+        """Lower-case text without changing its length"""
+        if not text.isascii():
+            text = text.translate(_SIGNAL_CASE_FOLD)
+        return text.lower()
+
+    @staticmethod
+    def _tokens(folded: str) -> Tuple[List[str], List[int]]:
+        """Split folded text into alternating words and separators"""
+        parts = []
+        chunk_starts = []
+        for chunk in folded.split():
+            if parts:
+                parts.append(' ')
+            chunk_starts.append(len(parts))
+            if chunk.isalnum():
+                parts.append(chunk)
+            else:
+                parts.extend(_WORD_SPLIT(chunk))
+        return parts, chunk_starts
+
+    @staticmethod
+    def _offset(folded: str, parts: List[str], chunk_starts: List[int], index: int) -> int:
+        """Map a part index back to its offset in the text"""
+        chunk = bisect_right(chunk_starts, index) - 1
+        start = end = 0
+        for chunk_text in folded.split()[:chunk + 1]:
+            start = folded.find(chunk_text, end)
+            end = start + len(chunk_text)
+        return start + sum(len(part) for part in parts[chunk_starts[chunk]:index])
+
+    def _accelerator_start(self, folded: str) -> Optional[int]:
+        """Start of the leftmost "joins ... accelerator" match, if any"""
+        positions = [match.start() for match in self._accelerator.finditer(folded)]
+        if not positions:
+            return None
+        for join in self._join.finditer(folded):
+            line_end = folded.find('\n', join.end())
+            if line_end == -1:
+                line_end = len(folded)
+            index = bisect_left(positions, join.end())
+            if index < len(positions) and positions[index] + len('accelerator') <= line_end:
+                return join.start()
+        return None
+
+    def _search(self, text: str, need_start: bool) -> Optional[Tuple[Optional[int], str]]:
+        """Find the leftmost signal"""
+        folded = self._fold(text)
+        candidates = []
+        for label, search, triggers in self.patterns:
+            if all(trigger in folded for trigger in triggers):
+                residual = search(folded)
+                if residual:
+                    candidates.append((residual.start(), label))
+        if 'accelerator' in folded and 'join' in folded:
+            start = self._accelerator_start(folded)
+            if start is not None:
+                candidates.append((start, 'accelerator'))
+        parts, chunk_starts = self._tokens(folded)
+        found = self.trie.find(parts)
+        if found:
+            if not (candidates or need_start):
+                return None, found[1]
+            candidates.append((self._offset(folded, parts, chunk_starts, found[0]), found[1]))
+        return min(candidates, key=lambda candidate: candidate[0]) if candidates else None
+
+    def match(self, text: str) -> Optional[Tuple[int, str]]:
+        """Return (start, signal) of the leftmost launch signal in text"""
+        return self._search(text, need_start=True)
+
+    def classify(self, text: str) -> Optional[str]:
+        """Return the launch signal found in text, or None"""
+        found = self._search(text, need_start=False)
+        return found[1] if found else None
+
+    def classify_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """Classify a whole batch of texts in one call"""
+        classify = self.classify
+        return [classify(text) for text in texts]
+
+_GAZETTEER_WORD = re.compile(r'\w+')
+# Ends of sentences and clauses, and quotes, after which a capital says
+# nothing about whether a word is a name
+_CLAUSE_BREAK = re.compile(r'[.!?:;](?:\s|$)|[\n"“”]')
+
+def read_gazetteer(text: str) -> List[Tuple[str, str, List[str]]]:
+    """Parse gazetteer lines into (name, category, aliases)"""
+    entries = []
+    for line in text.splitlines():
+        if not line.strip() or line.startswith('#'):
+            continue
+        name, _, rest = line.partition('\t')
+        category, _, aliases = rest.partition('\t')
+        entries.append((name.strip(), category.strip(), [alias.strip() for alias in aliases.split('|') if alias.strip()]))
+    return entries
+
+class StartupGazetteer:
+    """Startup name and sector lookup over a precompiled word trie"""
+    def __init__(self, phrases: Dict[str, int], labels: List[Tuple[str, str, bool, bool]], startups: int = 0):
+        self.phrases = phrases
+        self.labels = labels
+        self.startups = startups
+
+    @classmethod
+    def build(cls, entries: List[Tuple[str, str, List[str]]],
+              sectors: Dict[str, List[str]] = SECTOR_KEYWORDS) -> 'StartupGazetteer':
+        """Compile gazetteer entries and sector keywords into the flat trie"""
+        phrases: Dict[str, int] = {}
+        labels: List[Tuple[str, str, bool, bool]] = []
+        label_ids: Dict[Tuple[str, str, bool, bool], int] = {}
+
+        def add(phrase: str, label: Tuple[str, str, bool, bool]):
+            words = _GAZETTEER_WORD.findall(LaunchSignalClassifier._fold(phrase))
+            if not words:
+                return
+            for end in range(1, len(words)):
+                phrases.setdefault(' '.join(words[:end]), 0)
+            key = ' '.join(words)
+            current = phrases.get(key)
+            # The first startup to claim a phrase keeps it; startups beat sectors
+            if current and (not label[0] or labels[current - 1][0]):
+                return
+            if label not in label_ids:
+                labels.append(label)
+                label_ids[label] = len(labels)
+            phrases[key] = label_ids[label]
+
+        for category, keywords in sectors.items():
+            for keyword in keywords:
+                add(keyword, ('', category, False, False))
+        for name, category, aliases in entries:
+            for phrase in [name, *aliases]:
+                ambiguous = phrase.endswith('?')
+                phrase = phrase.rstrip('?')
+                add(phrase, (name.rstrip('?'), category, not phrase[:1].islower(), ambiguous))
+        return cls(phrases, labels, len(entries))
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH, index_path: Optional[str] = GAZETTEER_INDEX_PATH) -> 'StartupGazetteer':
+        """Load the compiled index, recompiling it when it is stale"""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            logging.warning(f"Startup gazetteer unavailable, only sectors will be tagged: {e}")
+            data = b''
+        sectors = json.dumps(SECTOR_KEYWORDS, sort_keys=True).encode('utf-8')
+        key = (GAZETTEER_FORMAT, zlib.crc32(sectors, zlib.crc32(data)))
+        if index_path:
+            try:
+                with open(index_path, 'rb') as f:
+                    # One read: marshal.load on a file reads it object by object
+                    stored_key, phrases, labels, startups = marshal.loads(f.read())
+                if stored_key == key:
+                    return cls(phrases, labels, startups)
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+
+        gazetteer = cls.build(read_gazetteer(data.decode('utf-8')))
+        if index_path:
+            # Workers starting together each write their own file and swap it in
+            temp_path = f'{index_path}.{os.getpid()}.tmp'
+            try:
+                with open(temp_path, 'wb') as f:
+                    marshal.dump((key, gazetteer.phrases, gazetteer.labels, gazetteer.startups), f)
+                os.replace(temp_path, index_path)
+            except OSError as e:
+                logging.warning(f"Could not save the gazetteer index: {e}")
+        logging.info(f"Compiled gazetteer index with {gazetteer.startups} startups")
+        return gazetteer
+
+    def matches(self, text: str) -> List[Tuple[Tuple[str, str, bool, bool], bool]]:
+        """Labels of the leftmost-longest phrases in text, each with whether it reads as a name"""
+        words = _GAZETTEER_WORD.findall(text)
+        if not words:
+            return []
+        starts = None
+        # Folding keeps word boundaries, so folded words line up with words
+        folded = LaunchSignalClassifier._fold(' '.join(words)).split(' ')
+        phrases, labels = self.phrases, self.labels
+        count = len(folded)
+        found = []
+        index = 0
+        while index < count:
+            key = folded[index]
+            label_id = phrases.get(key)
+            if label_id is None:
+                index += 1
+                continue
+            capitalised = not words[index][:1].islower()
+            label, end = None, index + 1
+            position = index + 1
+            while True:
+                if label_id:
+                    candidate = labels[label_id - 1]
+                    if capitalised or not candidate[2]:
+                        label, end = candidate, position
+                if position == count:
+                    break
+                key = f'{key} {folded[position]}'
+                label_id = phrases.get(key)
+                if label_id is None:
+                    break
+                position += 1
+            if label:
+                named = True
+                if label[3]:
+                    if starts is None:
+                        starts = [match.start() for match in _GAZETTEER_WORD.finditer(text)]
+                    named = self.reads_as_name(text, starts[index])
+                found.append((label, named))
+                index = end
+            else:
+                index += 1
+        return found
+
+    @staticmethod
+    def reads_as_name(text: str, start: int) -> bool:
+        """Whether the capitalised word at start is inside a sentence-case clause"""
+        begin = max((match.end() for match in _CLAUSE_BREAK.finditer(text, 0, start)), default=0)
+        after = _CLAUSE_BREAK.search(text, start)
+        if not _GAZETTEER_WORD.search(text, begin, start):
+            return False
+        clause = _GAZETTEER_WORD.findall(text, begin, after.start() if after else len(text))
+        return any(len(word) > 3 and word[:1].islower() for word in clause)
+
+    def extract(self, title: str, description: str = '') -> Tuple[str, str]:
+        """Return the (startup name, category) of an article, '' where unknown"""
+        startups: Dict[str, List] = {}
+        sectors: Counter = Counter()
+        for text, weight in ((title, 2), (description, 1)):
+            if not text:
+                continue
+            for (name, category, _, _), named in self.matches(text):
+                if name:
+                    counts = startups.setdefault(name, [0, category, False])
+                    counts[0] += weight
+                    counts[2] = counts[2] or named
+                else:
+                    sectors[category] += weight
+        startups = {name: counts for name, counts in startups.items() if counts[2]}
+        name, category = '', ''
+        if startups:
+            name, (_, category, _) = max(startups.items(), key=lambda item: item[1][0])
+        if not category and sectors:
+            category = sectors.most_common(1)[0][0]
+        return name, category
+
+    def annotate(self, articles: List['StartupNews']) -> int:
+        """Fill in the startup name and category of a batch of articles"""
+        named = 0
+        extract = self.extract
+        for article in articles:
+            if not (article.startup_name and article.category):
+                name, category = extract(article.title, article.description)
+                article.startup_name = article.startup_name or name
+                article.category = article.category or category
+            if article.startup_name:
+                named += 1
+        return named
+
+_MINHASH_PRIME = (1 << 61) - 1
+# Fixed seed: signatures are stored, so the permutations must not change
+# between processes
+_minhash_rng = random.Random(0x5EED)
+_MINHASH_PERMUTATIONS = [
+    (_minhash_rng.randrange(1, _MINHASH_PRIME), _minhash_rng.randrange(_MINHASH_PRIME))
+    for _ in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+_FINGERPRINT_STOPWORDS = frozenset(
+    'the and for with its has have from into this that are was were will new now out off over after '
+    'about their our your his her they them than then been being which who what when where how'.split()
 )
+_FINGERPRINT_WORD = re.compile(r'\w+')
+
+def minhash_signature(text: str) -> Tuple[int, ...]:
+    """MinHash signature over the consecutive content word pairs of text"""
+    words = [
+        word for word in _FINGERPRINT_WORD.findall(text.lower())
+        if len(word) > 2 and word not in _FINGERPRINT_STOPWORDS
+    ]
+    shingles = {zlib.crc32(f'{first} {second}'.encode()) for first, second in zip(words, words[1:])}
+    if len(shingles) < NEAR_DUP_MIN_SHINGLES:
+        return ()
+    return tuple(
+        min((a * shingle + b) % _MINHASH_PRIME for shingle in shingles)
+        for a, b in _MINHASH_PERMUTATIONS
+    )
+
+def article_signature(article: StartupNews) -> Tuple[int, ...]:
+    """Near-duplicate fingerprint of an article's title and description"""
+    return minhash_signature(f"{article.title} {article.description}")
+
+def signature_blob(signature: Tuple[int, ...]) -> Optional[bytes]:
+    """Stored form of a signature; None for an empty one"""
+    return array('Q', signature).tobytes() if signature else None
+
+class MinHashIndex:
+    """LSH index of MinHash signatures"""
+    def __init__(self, threshold: float = NEAR_DUP_THRESHOLD,
+                 unnamed_threshold: float = NEAR_DUP_UNNAMED_THRESHOLD):
+        self.threshold = threshold
+        self.unnamed_threshold = unnamed_threshold
+        self._buckets: Dict[Tuple[int, ...], List[str]] = {}
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._entities: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    @staticmethod
+    def _bands(signature: Tuple[int, ...]):
+        for band in range(MINHASH_BANDS):
+            yield (band,) + signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]
+
+    @staticmethod
+    def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(map(operator.eq, a, b)) / len(a)
+
+    def add(self, key: str, signature: Tuple[int, ...], entity: str = ''):
+        if not signature or key in self._signatures:
+            return
+        self._signatures[key] = signature
+        self._entities[key] = entity
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, []).append(key)
+
+    def find(self, signature: Tuple[int, ...], entity: str = '') -> Optional[Tuple[str, float]]:
+        """Return the most similar indexed key about the same startup"""
+        if not signature:
+            return None
+        candidates = set()
+        for band in self._bands(signature):
+            candidates.update(self._buckets.get(band, ()))
+        best = None
+        for key in candidates:
+            other = self._entities[key]
+            if entity and other:
+                if entity != other:
+                    continue
+                threshold = self.threshold
+            else:
+                threshold = self.unnamed_threshold
+            score = self.similarity(signature, self._signatures[key])
+            if score >= threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+
+class Watermark:
+    """Where a source's listing left off in the previous run"""
+    def __init__(self, urls: Optional[List[str]] = None, newest: Optional[str] = None):
+        self.urls = list(urls or [])
+        self.newest = newest
+        self._seen = set(self.urls)
+        self._newest_ts = parse_timestamp(newest)
+
+    def __bool__(self) -> bool:
+        return bool(self.urls)
+
+    def is_seen(self, url: str, date: Optional[str] = None) -> bool:
+        """True for remembered urls and for feed items older than the newest one seen"""
+        if url in self._seen:
+            return True
+        if self._newest_ts is not None and date:
+            timestamp = parse_timestamp(date)
+            return timestamp is not None and timestamp < self._newest_ts
+        return False
+
+    def advance(self, item_urls: List[str], newest: Optional[str] = None) -> 'Watermark':
+        """Watermark after a scan that found item_urls, most recent first"""
+        fresh = list(dict.fromkeys(item_urls))
+        fresh_set = set(fresh)
+        urls = (fresh + [url for url in self.urls if url not in fresh_set])[:WATERMARK_SIZE]
+        if self.newest and (parse_timestamp(newest) or 0) <= (self._newest_ts or 0):
+            newest = self.newest
+        return Watermark(urls, newest)
+
+@dataclass
+class SourcePollState:
+    source: str
+    interval: float = POLL_DEFAULT_INTERVAL  # seconds
+    next_due: float = 0.0  # unix time
+    last_polled: Optional[float] = None
+    item_rate: Optional[float] = None  # new listing items per hour
+    launch_rate: Optional[float] = None  # new launch articles per hour
+    polls: int = 0
+
+def smooth(average: Optional[float], value: float) -> float:
+    """Exponentially weighted moving average with POLL_SMOOTHING"""
+    return value if average is None else average + POLL_SMOOTHING * (value - average)
+
+class PollScheduler:
+    """Per-source poll times adapted to how often each source publishes"""
+    def __init__(self, states: Dict[str, SourcePollState], sources: List[str]):
+        self._lock = threading.Lock()
+        self.states = {source: states.get(source) or SourcePollState(source) for source in sources}
+        self._heap = [(state.next_due, source) for source, state in self.states.items()]
+        heapq.heapify(self._heap)
+
+    def due(self, now: Optional[float] = None, accept: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """Sources whose poll time has passed, most overdue first"""
+        now = time.time() if now is None else now
+        due, current = [], []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                next_due, source = entry
+                # Entries superseded by a later record() are dropped
+                if self.states[source].next_due != next_due:
+                    continue
+                current.append(entry)
+                if accept is None or accept(source):
+                    due.append(source)
+            # Sources stay queued until record() reschedules them, so a poll
+            # that fails before recording leaves them due
+            for entry in current:
+                heapq.heappush(self._heap, entry)
+        return due
+
+    def update(self, states: Dict[str, SourcePollState]):
+        """Replace sources' schedules with saved ones, e.g. another worker's"""
+        with self._lock:
+            for source, state in states.items():
+                self.states[source] = state
+                heapq.heappush(self._heap, (state.next_due, source))
+
+    @staticmethod
+    def next_interval(state: SourcePollState) -> float:
+        """Seconds until a source should be polled again"""
+        if state.item_rate is None:
+            return POLL_DEFAULT_INTERVAL
+        if state.item_rate <= 0:
+            return POLL_MAX_INTERVAL
+        interval = POLL_TARGET_ITEMS / state.item_rate * 3600
+        launch_share = min(1.0, (state.launch_rate or 0) / state.item_rate)
+        interval *= 2 - launch_share
+        return min(max(interval, POLL_MIN_INTERVAL), POLL_MAX_INTERVAL)
+
+    def record(self, source: str, items: Optional[int], launches: Optional[int],
+               now: Optional[float] = None) -> SourcePollState:
+        """Update a source's rates from a poll and schedule its next one"""
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self.states.setdefault(source, SourcePollState(source))
+            state.polls += 1
+            if items is not None:
+                # The first poll only sets a baseline: without a watermark
+                # every listed item looks new
+                if state.last_polled is not None:
+                    hours = max(now - state.last_polled, 60) / 3600
+                    state.item_rate = smooth(state.item_rate, items / hours)
+                    state.launch_rate = smooth(state.launch_rate, launches / hours)
+                state.last_polled = now
+            state.interval = self.next_interval(state)
+            state.next_due = now + state.interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+            heapq.heappush(self._heap, (state.next_due, source))
+            return replace(state)
+
+    def snapshot(self) -> List[Dict]:
+        """Every source's schedule, soonest first, for /status"""
+        with self._lock:
+            states = sorted(self.states.values(), key=lambda state: state.next_due)
+            return [
+                dict(
+                    asdict(state),
+                    next_due=datetime.fromtimestamp(state.next_due).isoformat(timespec='seconds'),
+                    last_polled=(datetime.fromtimestamp(state.last_polled).isoformat(timespec='seconds')
+                                 if state.last_polled else None)
+                )
+                for state in states
+            ]
+
+@dataclass
+class SourceHealth:
+    source: str
+    latencies: List[float] = field(default_factory=list)  # recent successful fetch seconds
+    error_streak: int = 0  # failed scrapes in a row
+    last_success: Optional[float] = None  # unix time
+    last_failure: Optional[float] = None  # unix time
+    last_error: Optional[str] = None
+    open_until: float = 0.0  # unix time the open circuit next lets a probe through
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of values, None when there are none"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+class SourceHealthMonitor:
+    """Per-source fetch latency, error streaks and circuit breaker"""
+    def __init__(self, states: Dict[str, SourceHealth]):
+        self._lock = threading.Lock()
+        self.states = dict(states)
+
+    @staticmethod
+    def backoff(state: SourceHealth) -> float:
+        """Seconds an open circuit stays shut before the next probe"""
+        failed_probes = max(0, state.error_streak - BREAKER_THRESHOLD)
+        return min(BREAKER_BASE_BACKOFF * 2 ** min(failed_probes, 32), BREAKER_MAX_BACKOFF)
+
+    def is_open(self, state: SourceHealth) -> bool:
+        return state.error_streak >= BREAKER_THRESHOLD
+
+    def allow(self, source: str, now: Optional[float] = None) -> bool:
+        """Whether a scrape may fetch the source"""
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self.states.get(source)
+            if state is None or not self.is_open(state):
+                return True
+            if now < state.open_until:
+                return False
+            # Keep other scrapes out while the probe is in flight
+            state.open_until = now + self.backoff(state)
+            return True
+
+    def timeout(self, source: str) -> float:
+        """Fetch timeout for the source, from its recent p95 latency"""
+        with self._lock:
+            state = self.states.get(source)
+            if state is None or state.error_streak or len(state.latencies) < LATENCY_MIN_SAMPLES:
+                return FETCH_TIMEOUT
+            p95 = percentile(state.latencies, 0.95)
+        return min(max(p95 * TIMEOUT_P95_MULTIPLIER, FETCH_TIMEOUT_MIN), FETCH_TIMEOUT)
+
+    def observe_fetch(self, source: str, seconds: float, error: Optional[str] = None):
+        """Record one fetch: its latency if it succeeded, its error if not"""
+        with self._lock:
+            state = self.states.setdefault(source, SourceHealth(source))
+            if error is None:
+                state.latencies.append(seconds)
+                del state.latencies[:-LATENCY_WINDOW]
+            else:
+                state.last_error = error
+
+    def record(self, source: str, ok: bool, now: Optional[float] = None) -> SourceHealth:
+        """Record a scrape's outcome, opening or closing the circuit"""
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self.states.setdefault(source, SourceHealth(source))
+            if ok:
+                if self.is_open(state):
+                    logging.info(f"Circuit closed for {source} after {state.error_streak} failures")
+                state.error_streak = 0
+                state.last_success = now
+                state.open_until = 0.0
+            else:
+                state.error_streak += 1
+                state.last_failure = now
+                if self.is_open(state):
+                    state.open_until = now + self.backoff(state)
+                    logging.warning(
+                        f"Circuit open for {source} after {state.error_streak} failures, "
+                        f"next probe in {self.backoff(state) / 60:.0f} min"
+                    )
+            return replace(state, latencies=list(state.latencies))
+
+    def update(self, states: Dict[str, SourceHealth]):
+        """Replace sources' health with saved state, e.g. another worker's"""
+        with self._lock:
+            self.states.update(states)
+
+    def states_for(self, sources) -> List[SourceHealth]:
+        """Copies of the given sources' health, for saving"""
+        with self._lock:
+            return [
+                replace(self.states[source], latencies=list(self.states[source].latencies))
+                for source in sources if source in self.states
+            ]
+
+    def snapshot(self) -> List[Dict]:
+        """Every tracked source's health, failing ones first, for /status"""
+        now = time.time()
+        with self._lock:
+            states = sorted(self.states.values(), key=lambda state: (-state.error_streak, state.source))
+            rows = []
+            for state in states:
+                if not self.is_open(state):
+                    circuit = 'closed'
+                else:
+                    circuit = 'open' if now < state.open_until else 'probing'
+                rows.append({
+                    'source': state.source,
+                    'circuit': circuit,
+                    'error_streak': state.error_streak,
+                    'last_error': state.last_error,
+                    'last_success': (datetime.fromtimestamp(state.last_success).isoformat(timespec='seconds')
+                                     if state.last_success else None),
+                    'next_probe': (datetime.fromtimestamp(state.open_until).isoformat(timespec='seconds')
+                                   if circuit == 'open' else None),
+                    'latency_p50_s': percentile(state.latencies, 0.5),
+                    'latency_p95_s': percentile(state.latencies, 0.95),
+                    'samples': len(state.latencies)
+                })
+        for row in rows:
+            row['timeout_s'] = self.timeout(row['source'])
+        return rows
+
+def select_with_profile(node, selectors: List[str], profile: Dict[str, str],
+                        winners: Dict[str, Counter], field: str, many: bool = False):
+    """Try the remembered selector for field first, then the full cascade"""
+    preferred = profile.get(field)
+    if preferred:
+        selectors = [preferred] + [selector for selector in selectors if selector != preferred]
+    for selector in selectors:
+        if many:
+            result = node.select(selector, limit=MAX_ARTICLES_PER_PAGE)
+        else:
+            result = node.select_one(selector)
+        if result:
+            winners[field][selector] += 1
+            return result
+    return [] if many else None
+
+def extract_wordpress_articles(soup: 'BeautifulSoup', source_name: str, source_url: str, profile: Dict[str, str],
+                               classify: Callable[[str], Optional[str]],
+                               watermark: Optional[Watermark] = None) -> Tuple[ParsedPage, int, Dict[str, Counter]]:
+    """Extract launch articles from a WordPress listing page"""
+    watermark = watermark or Watermark()
+    page = ParsedPage(articles=[])
+    seen_run = 0
+    candidates = 0
+    winners = {field: Counter() for field in ('article', 'title', 'description', 'date')}
+    try:
+        # Go straight to the selectors that won last time for this source
+        found_articles = select_with_profile(soup, ARTICLE_SELECTORS, profile, winners, 'article', many=True)
+        candidates = len(found_articles)
+        
+        for article in found_articles:
+            # Try to find title
+            title_elem = select_with_profile(article, TITLE_SELECTORS, profile, winners, 'title')
+            
+            if not title_elem:
+                continue
+            
+            title = title_elem.get_text(strip=True)
+            
+            # Try to find URL
+            url = None
+            link_elem = title_elem.find('a') or article.find('a')
+            if link_elem and link_elem.get('href'):
+                url = link_elem['href']
+                # Handle relative URLs
+                if url.startswith('/'):
+                    base_url = f"{urlparse(source_url).scheme}://{urlparse(source_url).netloc}"
+                    url = urljoin(base_url, url)
+                url = canonicalize_url(url)
+            
+            if not url:
+                continue
+            
+            # Skip the previous run's items; sticky posts mean newer ones
+            # may still follow
+            if watermark.is_seen(url):
+                seen_run += 1
+                continue
+            seen_run = 0
+            page.item_urls.append(url)
+            
+            # Try to find description
+            description = ""
+            desc_elem = select_with_profile(article, DESCRIPTION_SELECTORS, profile, winners, 'description')
+            if desc_elem:
+                description = desc_elem.get_text(strip=True)[:300] + "..."
+            
+            # Try to find date
+            date = datetime.now().strftime('%Y-%m-%d')
+            date_elem = select_with_profile(article, DATE_SELECTORS, profile, winners, 'date')
+            if date_elem:
+                date_text = date_elem.get('datetime') or date_elem.get_text(strip=True)
+                if date_text:
+                    date = date_text
+            
+            # Check if it's about product/service launch
+            signal = classify(title + " " + description)
+            (page.articles if signal else page.unmatched).append(StartupNews(
+                title=title,
+                url=url,
+                description=description,
+                source=source_name.replace('_', ' ').title(),
+                date=date,
+                matched_signal=signal or ""
+            ))
+        # Older pages only hold news if this one ends in new entries
+        page.reached_watermark = seen_run >= WATERMARK_OVERLAP
+    except Exception as e:
+        logging.error(f"Error parsing {source_name}: {e}")
+        # Don't learn from a page that failed part way through
+        winners = {}
+    
+    return page, candidates, winners
+
+# Per-process classifier for parse workers, built on first use
+_worker_classifier: Optional[LaunchSignalClassifier] = None
+# Per-process gazetteer for replay workers, loaded on first use
+_worker_gazetteer: Optional[StartupGazetteer] = None
+
+FEED_ERRORS = (ElementTree.ParseError, ValueError, KeyError, TypeError)
+
+def extract_feed_articles(content: bytes, feed_type: str, source_name: str, classify: Callable[[str], Optional[str]],
+                          watermark: Optional[Watermark] = None) -> Tuple[ParsedPage, int]:
+    """Extract launch articles from an RSS/Atom or WordPress REST feed"""
+    items = parse_feed_items(content, feed_type)
+    
+    watermark = watermark or Watermark()
+    page = ParsedPage(articles=[])
+    newest_ts = None
+    seen_run = 0
+    for item in items:
+        title = strip_html(item.get('title'))
+        url = canonicalize_url(item.get('link') or '')
+        if not title or not url:
+            continue
+        date = normalize_feed_date(item.get('date'))
+        if watermark.is_seen(url, date):
+            seen_run += 1
+            if seen_run >= WATERMARK_OVERLAP:
+                page.reached_watermark = True
+                break
+            continue
+        seen_run = 0
+        page.item_urls.append(url)
+        timestamp = parse_timestamp(date)
+        if timestamp is not None and (newest_ts is None or timestamp > newest_ts):
+            newest_ts, page.newest = timestamp, date
+        
+        description = strip_html(item.get('description'))
+        if description:
+            description = description[:300] + "..."
+        
+        # Check if it's about product/service launch
+        signal = classify(title + " " + description)
+        (page.articles if signal else page.unmatched).append(StartupNews(
+            title=title,
+            url=url,
+            description=description,
+            source=source_name.replace('_', ' ').title(),
+            date=date,
+            matched_signal=signal or ""
+        ))
+    return page, len(items)
+
+def parse_wordpress_page(content: bytes, backend: str, source_name: str, source_url: str, profile: Dict[str, str],
+                         watermark: Optional[Watermark] = None) -> Tuple[ParsedPage, int, Dict[str, Counter]]:
+    """Process pool entry point: parse and classify a page, articles as plain tuples"""
+    global _worker_classifier
+    if _worker_classifier is None:
+        _worker_classifier = LaunchSignalClassifier()
+    page, candidates, winners = extract_wordpress_articles(
+        build_soup(content, backend), source_name, source_url, profile, _worker_classifier.classify, watermark
+    )
+    page.articles = [astuple(article) for article in page.articles]
+    page.unmatched = [astuple(article) for article in page.unmatched]
+    return page, candidates, winners
+
+def replay_batch(path: str, entries: List[Tuple], backend: str,
+                 profiles: Dict[str, Dict[str, str]]) -> List[Tuple]:
+    """Process pool entry point: run archived responses through the current parsers"""
+    global _worker_classifier, _worker_gazetteer
+    if _worker_classifier is None:
+        _worker_classifier = LaunchSignalClassifier()
+    if _worker_gazetteer is None:
+        _worker_gazetteer = StartupGazetteer.load()
+    results = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as archive:
+        for fetched_at, source, url, kind, offset, length in entries:
+            _, body = read_warc_record(archive, offset, length)
+            if kind in ('rss', 'wp-json'):
+                try:
+                    page, candidates = extract_feed_articles(body, kind, source, _worker_classifier.classify)
+                except FEED_ERRORS:
+                    continue
+                articles = page.articles
+            else:
+                page, candidates, _ = parse_wordpress_page(
+                    body, backend, source, NEWS_SOURCES.get(source, url), profiles.get(source, {})
+                )
+                articles = [StartupNews(*record) for record in page.articles]
+            _worker_gazetteer.annotate(articles)
+            results.append((fetched_at, source, candidates, [astuple(article) for article in articles]))
+    return results
+
+def read_warc_record(archive, offset: int, length: int) -> Tuple[Dict[str, str], bytes]:
+    """Inflate the WARC record at offset, returning its headers and content"""
+    record = zlib.decompress(archive[offset:offset + length], 31)
+    head, _, block = record.partition(b'\r\n\r\n')
+    fields = {}
+    for line in head.decode('utf-8').split('\r\n')[1:]:
+        name, _, value = line.partition(':')
+        fields[name.strip()] = value.strip()
+    return fields, block[:int(fields.get('Content-Length', len(block)))]
+
+class ResponseArchive:
+    """Append-only WARC archive of fetched responses, for replaying past days"""
+    def __init__(self, directory: str, store: 'ArticleStore'):
+        self.directory = directory
+        self.store = store
+        self._lock = threading.Lock()
+        self._segment: Optional[str] = None
+        self._fd: Optional[int] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _open(self, segment: str) -> int:
+        if segment != self._segment:
+            if self._fd is not None:
+                os.close(self._fd)
+            # O_APPEND keeps whole records from workers sharing the directory
+            # from interleaving
+            self._fd = os.open(os.path.join(self.directory, segment), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._segment = segment
+        return self._fd
+
+    def append(self, source: str, url: str, kind: str, body: bytes, content_type: str = 'text/html',
+               fetched_at: Optional[float] = None):
+        """Archive a fetched response"""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        head = '\r\n'.join([
+            'WARC/1.0',
+            'WARC-Type: resource',
+            f'WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>',
+            f"WARC-Date: {datetime.fromtimestamp(fetched_at, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+            f'WARC-Target-URI: {url}',
+            f'Content-Type: {content_type}',
+            f'Content-Length: {len(body)}',
+            f'Scraper-Source: {source}',
+            f'Scraper-Kind: {kind}'
+        ]).encode('utf-8')
+        compressor = zlib.compressobj(RESPONSE_ARCHIVE_COMPRESSION, zlib.DEFLATED, 31)
+        record = compressor.compress(head + b'\r\n\r\n' + body + b'\r\n\r\n') + compressor.flush()
+        segment = f'{datetime.fromtimestamp(fetched_at).date().isoformat()}.warc.gz'
+        with self._lock:
+            fd = self._open(segment)
+            os.write(fd, record)
+            # With O_APPEND the write lands at the end, wherever that was
+            offset = os.lseek(fd, 0, os.SEEK_CUR) - len(record)
+        self.store.add_archive_entry(source, url, kind, fetched_at, segment, offset, len(record))
+
+    def revisit(self, source: str, url: str, kind: str, fetched_at: Optional[float] = None) -> bool:
+        """Index an unchanged response against the url's last record"""
+        last = self.store.last_archive_entry(url)
+        if last is None:
+            return False
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        self.store.add_archive_entry(source, url, kind, fetched_at, *last)
+        return True
+
+    def path(self, segment: str) -> str:
+        return os.path.join(self.directory, segment)
+
+class HostRateLimiter:
+    """Enforce a minimum delay between requests to the same host"""
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """Block until a request to the url's host is allowed"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+class ResponseCache:
+    """Persistent ETag/Last-Modified response cache with size-bounded LRU eviction"""
+    def __init__(self, path: str = HTTP_CACHE_PATH, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        # Other workers may share the file; wait out their write locks
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB,
+                size INTEGER,
+                last_used REAL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_http_cache_last_used ON http_cache (last_used)')
+        self.conn.commit()
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached url"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT etag, last_modified FROM http_cache WHERE url = ?', (url,)
+            ).fetchone()
+        headers = {}
+        if row:
+            if row[0]:
+                headers['If-None-Match'] = row[0]
+            if row[1]:
+                headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def load(self, url: str) -> Optional[bytes]:
+        """Return the cached body after a 304 and mark it recently used"""
+        with self._lock:
+            row = self.conn.execute('SELECT body FROM http_cache WHERE url = ?', (url,)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute('UPDATE http_cache SET last_used = ? WHERE url = ?', (time.time(), url))
+            self.conn.commit()
+            self.hits += 1
+            self.bytes_saved += len(row[0])
+        return row[0]
+
+    def store(self, url: str, response: 'requests.Response', body: Optional[bytes] = None, complete: bool = True):
+        """Store a fresh response if it carries cache validators and was read in full"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        body = response.content if body is None else body
+        with self._lock:
+            self.misses += 1
+            if not (etag or last_modified) or not complete or len(body) > self.max_bytes:
+                self.conn.execute('DELETE FROM http_cache WHERE url = ?', (url,))
+                self.conn.commit()
+                return
+            self.conn.execute('''
+                INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, size, last_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (url, etag, last_modified, body, len(body), time.time()))
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM http_cache').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self.conn.execute('SELECT url, size FROM http_cache ORDER BY last_used').fetchall():
+            self.conn.execute('DELETE FROM http_cache WHERE url = ?', (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters for /status"""
+        with self._lock:
+            entries, size = self.conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache'
+            ).fetchone()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'bytes_saved': self.bytes_saved,
+                'entries': entries,
+                'size_bytes': size,
+                'max_bytes': self.max_bytes
+            }
+
+class BloomFilter:
+    """Compact probabilistic set with no false negatives"""
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        """Derive bit positions by double hashing the string's per-process hash"""
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str):
+        """Add an item to the filter"""
+        bits = self.bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+class Metrics:
+    """In-process counters and histograms rendered in Prometheus text format"""
+    DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._definitions: Dict[str, Tuple[str, str, Tuple[float, ...]]] = {}
+        self._values: Dict[Tuple[str, Tuple], object] = {}
+
+    def counter(self, name: str, help_text: str):
+        self._definitions[name] = ('counter', help_text, ())
+
+    def histogram(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._definitions[name] = ('histogram', help_text, tuple(buckets))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Increment a counter"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record a histogram observation"""
+        buckets = self._definitions[name][2]
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket counts, then sum and count
+                state = self._values[key] = [0] * len(buckets) + [0.0, 0]
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    @staticmethod
+    def _escape(value) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def _format_labels(self, labels: Tuple, extra: Tuple = ()) -> str:
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{key}="{self._escape(value)}"' for key, value in pairs) + '}'
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        with self._lock:
+            values = {key: (list(value) if isinstance(value, list) else value) for key, value in self._values.items()}
+        lines = []
+        for name, (kind, help_text, buckets) in self._definitions.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for (metric, labels), value in sorted(values.items(), key=lambda item: item[0]):
+                if metric != name:
+                    continue
+                if kind == 'counter':
+                    lines.append(f'{name}{self._format_labels(labels)} {value}')
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets, value):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{self._format_labels(labels, (("le", bound),))} {cumulative}')
+                lines.append(f'{name}_bucket{self._format_labels(labels, (("le", "+Inf"),))} {value[-1]}')
+                lines.append(f'{name}_sum{self._format_labels(labels)} {value[-2]}')
+                lines.append(f'{name}_count{self._format_labels(labels)} {value[-1]}')
+        return '\n'.join(lines) + '\n'
+
+METRICS = Metrics()
+METRICS.histogram('scraper_fetch_seconds', 'Time to fetch a source page or feed')
+METRICS.counter('scraper_fetch_bytes_total', 'Response bytes received per source')
+METRICS.counter('scraper_fetch_skipped_bytes_total', 'Response bytes dropped while streaming, per source and reason')
+METRICS.counter('scraper_fetch_responses_total', 'Fetches per source and HTTP status')
+METRICS.histogram('scraper_parse_seconds', 'Time to parse a fetched page or feed')
+METRICS.counter('scraper_candidates_total', 'Candidate articles found before keyword filtering')
+METRICS.counter('scraper_matches_total', 'Candidates matching a launch signal')
+METRICS.counter('scraper_dedup_hits_total', 'Matches dropped because they were already sent')
+METRICS.counter('scraper_near_duplicates_total', 'Matches dropped as near-copies of recently sent articles')
+METRICS.counter('scraper_clustered_total', 'Matches folded into another outlet\'s digest entry')
+METRICS.counter('scraper_polls_total', 'Source polls, scheduled or as part of a digest run')
+METRICS.counter('scraper_circuit_skips_total', 'Scrapes skipped because the source\'s circuit is open')
+METRICS.histogram('scraper_email_send_seconds', 'Time to render and send the digest email')
+METRICS.histogram('scraper_run_seconds', 'Duration of a full scrape of all sources', (1, 5, 10, 30, 60, 120, 300, 600))
+
+# Digest templates. Placeholders are filled with html-escaped values;
+# literal braces in the CSS are doubled for str.format
+DIGEST_ARTICLE_TEMPLATE = """
+                <div class="article">
+                    <h3>{title}</h3>
+                    <p><span class="source">{source}</span> <span class="date">{date}</span>{startup}</p>
+                    <div class="description">{description}</div>
+                    {coverage}<a href="{url}" class="read-more" target="_blank">Read Full Story</a>
+                </div>
+            """
+
+DIGEST_COVERAGE_TEMPLATE = """<p class="coverage">Also covered by: {links}</p>
+                    """
+
+DIGEST_STARTUP_TEMPLATE = """ <span class="startup">{label}</span>"""
+
+DIGEST_HEADER_TEMPLATE = """
+        <html>
+        <head>
+            <style>
+                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+                .header {{ background-color: #2c3e50; color: white; padding: 20px; text-align: center; }}
+                .article {{ border: 1px solid #ddd; margin: 20px 0; padding: 15px; border-radius: 5px; }}
+                .article h3 {{ color: #2c3e50; margin-top: 0; }}
+                .source {{ background-color: #3498db; color: white; padding: 5px 10px; border-radius: 3px; font-size: 12px; }}
+                .date {{ color: #7f8c8d; font-size: 14px; }}
+                .description {{ margin: 10px 0; }}
+                .read-more {{ background-color: #e74c3c; color: white; padding: 8px 15px; text-decoration: none; border-radius: 3px; }}
+                .coverage {{ color: #7f8c8d; font-size: 13px; }}
+                .startup {{ color: #27ae60; font-size: 13px; font-weight: bold; }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>🚀 African Startup Daily Digest</h1>
+                <p><strong>Date:</strong> {today}</p>
+                <p>Latest Product &amp; Service Launches from African Startups</p>
+            </div>
+            
+            <div style="padding: 20px;">
+                <p><strong>Found {count} new startup launches today!</strong></p>
+        """
+
+DIGEST_FOOTER = """
+            </div>
+            
+            <div style="background-color: #ecf0f1; padding: 20px; text-align: center; margin-top: 40px;">
+                <p><em>This digest is automatically generated. Stay updated with the latest African startup ecosystem!</em></p>
+            </div>
+        </body>
+        </html>
+        """
+
+EMPTY_DIGEST_TEMPLATE = """
+            <html>
+            <body>
+                <h2>🚀 African Startup Daily Digest</h2>
+                <p><strong>Date:</strong> {today}</p>
+                <p>No new startup launches found today. Check back tomorrow!</p>
+            </body>
+            </html>
+            """
+
+def digest_key(article: StartupNews, coverage: List[StartupNews] = ()) -> Tuple:
+    """Cache key of a digest entry: every field its fragments show"""
+    return (article.title, article.url, article.description, article.source, article.date,
+            article.startup_name, article.category,
+            tuple([(other.url, other.source) for other in coverage]) if coverage else ())
+
+class DigestRenderer:
+    """Precompiled digest templates with an LRU cache of rendered entry fragments"""
+    def __init__(self, cache_size: int = DIGEST_FRAGMENT_CACHE_SIZE):
+        self._article = DIGEST_ARTICLE_TEMPLATE.format
+        self._coverage = DIGEST_COVERAGE_TEMPLATE.format
+        self._startup = DIGEST_STARTUP_TEMPLATE.format
+        self._header = DIGEST_HEADER_TEMPLATE.format
+        self._empty = EMPTY_DIGEST_TEMPLATE.format
+        self.article_html = lru_cache(maxsize=cache_size)(self._render_html)
+        self.article_text = lru_cache(maxsize=cache_size)(self._render_text)
+
+    def _render_html(self, key: Tuple) -> str:
+        title, url, description, source, date, startup_name, category, coverage = key
+        escape = html.escape
+        label = ' · '.join(part for part in (startup_name, category) if part)
+        links = ', '.join(f'<a href="{escape(other_url)}" target="_blank">{escape(other_source)}</a>'
+                          for other_url, other_source in coverage)
+        return self._article(
+            title=escape(title),
+            source=escape(source),
+            date=escape(date),
+            description=escape(description),
+            url=escape(url),
+            startup=self._startup(label=escape(label)) if label else "",
+            coverage=self._coverage(links=links) if coverage else ""
+        )
+
+    def _render_text(self, key: Tuple) -> str:
+        title, url, description, source, date, startup_name, category, coverage = key
+        label = ' · '.join(part for part in (startup_name, category) if part)
+        lines = [title, f"{source} | {date}" + (f" | {label}" if label else "")]
+        if description:
+            lines.append(description)
+        if coverage:
+            lines.append("Also covered by: " + ', '.join(f"{other_source} ({other_url})"
+                                                        for other_url, other_source in coverage))
+        lines.append(url)
+        return '\n'.join(lines)
+
+    def html(self, fragments: List[str], today: Optional[str] = None) -> str:
+        """Join rendered entry fragments into the full HTML digest"""
+        today = today or datetime.now().strftime('%B %d, %Y')
+        if not fragments:
+            return self._empty(today=today)
+        return ''.join([self._header(today=today, count=len(fragments)), *fragments, DIGEST_FOOTER])
+
+    def text(self, fragments: List[str], today: Optional[str] = None) -> str:
+        """Join rendered entry fragments into the plain-text digest"""
+        today = today or datetime.now().strftime('%B %d, %Y')
+        if not fragments:
+            return f"African Startup Daily Digest - {today}\n\nNo new startup launches found today. Check back tomorrow!\n"
+        header = f"African Startup Daily Digest - {today}\nFound {len(fragments)} new startup launches today!"
+        return '\n\n'.join([header, *fragments]) + '\n'
+
+class DigestBuilder:
+    """Pipeline consumer that clusters articles into digest entries as they arrive"""
+    def __init__(self, scraper: 'AfricanStartupScraper'):
+        self.scraper = scraper
+        self.renderer = scraper.digest_renderer
+        self.articles: List[StartupNews] = []
+        # One digest entry per story; near-duplicates join their entry's coverage
+        self.entries: List[StartupNews] = []
+        self._coverage: List[List[StartupNews]] = []
+        self._positions: Dict[str, int] = {}
+
+    def add(self, article: StartupNews):
+        self.articles.append(article)
+        position = self._positions.get(article.duplicate_of) if article.duplicate_of else None
+        if position is not None:
+            self._coverage[position].append(article)
+            return
+        self._positions[article.url] = len(self.entries)
+        self.entries.append(article)
+        self._coverage.append([])
+
+    def close(self):
+        pass
+
+    def _keys(self) -> List[Tuple]:
+        """Entry cache keys in arrival order, except that stories about the
+        same startup follow its first one"""
+        first: Dict[str, int] = {}
+        groups = [first.setdefault(entry.startup_name or entry.url, position)
+                  for position, entry in enumerate(self.entries)]
+        return [digest_key(self.entries[position], self._coverage[position])
+                for position in sorted(range(len(self.entries)), key=groups.__getitem__)]
+
+    def html(self) -> str:
+        """Render the full HTML digest"""
+        return self.renderer.html(list(map(self.renderer.article_html, self._keys())))
+
+    def text(self) -> str:
+        """Render the plain-text digest"""
+        return self.renderer.text(list(map(self.renderer.article_text, self._keys())))
+
+    def build(self) -> Tuple[str, str]:
+        """Render the HTML and plain-text digest, each entry once"""
+        keys = self._keys()
+        return (self.renderer.html(list(map(self.renderer.article_html, keys))),
+                self.renderer.text(list(map(self.renderer.article_text, keys))))
+
+class WebhookConsumer:
+    """Pipeline consumer that posts each new article to a webhook as JSON"""
+    def __init__(self, url: str, session: 'requests.Session'):
+        self.url = url
+        self.session = session
+
+    def add(self, article: StartupNews):
+        try:
+            self.session.post(self.url, json=asdict(article), timeout=10).raise_for_status()
+        except Exception as e:
+            logging.error(f"Error posting article to webhook: {e}")
+
+    def close(self):
+        pass
+
+class PendingQueue:
+    """Pipeline consumer that parks new articles until the next digest"""
+    def __init__(self, store: 'ArticleStore'):
+        self.store = store
+        self.articles: List[StartupNews] = []
+
+    def add(self, article: StartupNews):
+        self.articles.append(article)
+
+    def close(self):
+        self.store.add_pending(self.articles)
+
+class JobManager:
+    """Run scrape-and-send jobs on a background thread, one at a time"""
+    def __init__(self, history_size: int = JOB_HISTORY_SIZE):
+        self.history_size = history_size
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Dict]" = OrderedDict()
+        self._active_id: Optional[str] = None
+        self._queued_id: Optional[str] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='job')
+
+    def submit(self, func: Callable, *args, trigger: str = 'manual') -> Tuple[Dict, bool]:
+        """Queue a job unless one that covers it is already in flight"""
+        with self._lock:
+            if self._queued_id is not None:
+                return dict(self._jobs[self._queued_id]), False
+            active = self._jobs.get(self._active_id) if self._active_id is not None else None
+            # A scheduled run has duties a manual one skips (marking its shards
+            # polled, claiming the digest), so it waits behind a manual job
+            if active is not None and (trigger != 'schedule' or active['trigger'] == 'schedule'):
+                return dict(active), False
+            job_id = uuid.uuid4().hex
+            job = {
+                'id': job_id,
+                'trigger': trigger,
+                'status': 'queued',
+                'created_at': datetime.now().isoformat(),
+                'started_at': None,
+                'finished_at': None,
+                'progress': {},
+                'result': None,
+                'error': None
+            }
+            self._jobs[job_id] = job
+            if active is None:
+                self._active_id = job_id
+            else:
+                self._queued_id = job_id
+            while len(self._jobs) > self.history_size:
+                self._jobs.popitem(last=False)
+        self._executor.submit(self._run, job_id, func, args)
+        return dict(job), True
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def _run(self, job_id: str, func: Callable, args: Tuple):
+        with self._lock:
+            if self._queued_id == job_id:
+                self._queued_id = None
+            self._active_id = job_id
+        self._update(job_id, status='running', started_at=datetime.now().isoformat())
+
+        def progress(**values):
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    job['progress'] = dict(job['progress'], **values)
+
+        try:
+            result = func(*args, progress=progress)
+            self._update(job_id, status='succeeded', result=result)
+        except Exception as e:
+            logging.error(f"Job {job_id} failed: {e}")
+            self._update(job_id, status='failed', error=f"{type(e).__name__}: {e}")
+        finally:
+            with self._lock:
+                if job_id in self._jobs:
+                    self._jobs[job_id]['finished_at'] = datetime.now().isoformat()
+                if self._active_id == job_id:
+                    self._active_id = None
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return a snapshot of a job"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job, progress=dict(job['progress'])) if job else None
+
+    def recent(self) -> List[Dict]:
+        """Return snapshots of the retained jobs, newest first"""
+        with self._lock:
+            return [dict(job, progress=dict(job['progress'])) for job in reversed(self._jobs.values())]
+
+class ArticleStore:
+    """Long-lived, thread-safe SQLite connection for the article database"""
+    # Schema migrations, applied in order and tracked with PRAGMA user_version
+    MIGRATIONS = [
+        [
+            '''
+            CREATE TABLE IF NOT EXISTS sent_articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT UNIQUE,
+                title TEXT,
+                sent_date DATE,
+                source TEXT
+            )
+            '''
+        ],
+        [
+            'CREATE INDEX IF NOT EXISTS idx_sent_articles_url ON sent_articles (url)',
+            'CREATE INDEX IF NOT EXISTS idx_sent_articles_sent_date ON sent_articles (sent_date)'
+        ],
+        [
+            '''
+            CREATE TABLE IF NOT EXISTS selector_profiles (
+                source TEXT PRIMARY KEY,
+                profile TEXT,
+                updated_at TIMESTAMP
+            )
+            '''
+        ],
+        [
+            '''
+            CREATE TABLE IF NOT EXISTS source_feeds (
+                source TEXT PRIMARY KEY,
+                feed_url TEXT,
+                feed_type TEXT,
+                checked_at TIMESTAMP
+            )
+            '''
+        ],
+        [
+            '''
+            CREATE TABLE IF NOT EXISTS source_watermarks (
+                source TEXT PRIMARY KEY,
+                urls TEXT,
+                newest TEXT,
+                updated_at TIMESTAMP
+            )
+            '''
+        ],
+        [
+            'ALTER TABLE sent_articles ADD COLUMN minhash BLOB',
+            'UPDATE OR IGNORE sent_articles SET url = canonical_url(url)'
+        ],
+        [
+            '''
+            CREATE TABLE IF NOT EXISTS article_archive (
+                id INTEGER PRIMARY KEY,
+                url TEXT UNIQUE NOT NULL,
+                title TEXT,
+                description TEXT,
+                source TEXT,
+                date TEXT,
+                matched_signal TEXT,
+                first_seen TIMESTAMP,
+                last_seen TIMESTAMP
+            )
+            ''',
+            'CREATE INDEX IF NOT EXISTS idx_article_archive_source ON article_archive (source)',
+            '''
+            CREATE VIRTUAL TABLE IF NOT EXISTS article_archive_fts USING fts5(
+                title, description, content='article_archive', content_rowid='id'
+            )
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS article_archive_ai AFTER INSERT ON article_archive BEGIN
+                INSERT INTO article_archive_fts (rowid, title, description)
+                VALUES (new.id, new.title, new.description);
+            END
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS article_archive_ad AFTER DELETE ON article_archive BEGIN
+                INSERT INTO article_archive_fts (article_archive_fts, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+            END
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS article_archive_au AFTER UPDATE OF title, description ON article_archive BEGIN
+                INSERT INTO article_archive_fts (article_archive_fts, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+                INSERT INTO article_archive_fts (rowid, title, description)
+                VALUES (new.id, new.title, new.description);
+            END
+            ''',
+            # Seed the archive with what little is known about past digests
+            '''
+            INSERT OR IGNORE INTO article_archive (url, title, description, source, date, matched_signal, first_seen, last_seen)
+            SELECT url, title, '', source, sent_date, '', sent_date, sent_date FROM sent_articles
+            '''
+        ],
+        [
+            '''
+            CREATE TABLE IF NOT EXISTS source_poll_state (
+                source TEXT PRIMARY KEY,
+                interval_s REAL,
+                next_due REAL,
+                last_polled REAL,
+                item_rate REAL,
+                launch_rate REAL,
+                polls INTEGER
+            )
+            ''',
+            '''
+            CREATE TABLE IF NOT EXISTS pending_articles (
+                id INTEGER PRIMARY KEY,
+                url TEXT UNIQUE NOT NULL,
+                article TEXT,
+                queued_at TIMESTAMP
+            )
+            '''
+        ],
+        [
+            '''
+            CREATE TABLE IF NOT EXISTS source_health (
+                source TEXT PRIMARY KEY,
+                latencies TEXT,
+                error_streak INTEGER,
+                last_success REAL,
+                last_failure REAL,
+                last_error TEXT,
+                open_until REAL
+            )
+            '''
+        ],
+        [
+            '''
+            CREATE TABLE IF NOT EXISTS response_archive (
+                id INTEGER PRIMARY KEY,
+                source TEXT NOT NULL,
+                url TEXT NOT NULL,
+                kind TEXT,
+                fetched_at REAL NOT NULL,
+                segment TEXT NOT NULL,
+                record_offset INTEGER NOT NULL,
+                record_length INTEGER NOT NULL
+            )
+            ''',
+            'CREATE INDEX IF NOT EXISTS idx_response_archive_source ON response_archive (source, fetched_at)',
+            'CREATE INDEX IF NOT EXISTS idx_response_archive_fetched ON response_archive (fetched_at)',
+            'CREATE INDEX IF NOT EXISTS idx_response_archive_url ON response_archive (url, fetched_at)'
+        ],
+        [
+            # NULL until the gazetteer has looked at the article, '' when it found nothing
+            'ALTER TABLE article_archive ADD COLUMN startup_name TEXT',
+            'ALTER TABLE article_archive ADD COLUMN category TEXT',
+            'CREATE INDEX IF NOT EXISTS idx_article_archive_startup ON article_archive (startup_name)',
+            'CREATE INDEX IF NOT EXISTS idx_article_archive_category ON article_archive (category)'
+        ],
+        [
+            'ALTER TABLE sent_articles ADD COLUMN startup_name TEXT',
+            # Signatures are over word pairs now; re-sign sent titles, which
+            # are mostly too short to be matched again
+            'UPDATE sent_articles SET minhash = title_minhash(title) WHERE minhash IS NOT NULL'
+        ]
+    ]
+    # Stay well below SQLITE_MAX_VARIABLE_NUMBER on older builds
+    BATCH_SIZE = 500
+
+    def __init__(self, path: str = DATABASE_PATH, seen_index: bool = True):
+        self.path = path
+        self.lock = threading.RLock()
+        # Other workers may share the file; wait out their write locks
+        self.conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        # Lets migrations rewrite stored urls into their canonical form
+        self.conn.create_function('canonical_url', 1, canonicalize_url, deterministic=True)
+        self.conn.create_function(
+            'title_minhash', 1, lambda title: signature_blob(minhash_signature(title or '')), deterministic=True
+        )
+        self.migrate()
+        # Bloom filter over every sent url; a miss means "never sent" without
+        # touching SQLite, a hit is confirmed with an exact query
+        self.seen_index: Optional[BloomFilter] = None
+        # Signatures of recently sent articles for near-duplicate lookups
+        self.near_duplicates: Optional[MinHashIndex] = None
+        if seen_index:
+            self.load_seen_index()
+            self.load_near_duplicate_index()
+
+    def migrate(self):
+        """Apply any schema migrations the database has not seen yet"""
+        with self.lock:
+            version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+            while version < len(self.MIGRATIONS):
+                with self.conn:
+                    # Take the write lock before re-reading the version, so a
+                    # worker starting alongside never applies a migration twice
+                    self.conn.execute('BEGIN IMMEDIATE')
+                    version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+                    if version == len(self.MIGRATIONS):
+                        break
+                    for statement in self.MIGRATIONS[version]:
+                        self.conn.execute(statement)
+                    version += 1
+                    self.conn.execute(f'PRAGMA user_version = {version}')
+                logging.info(f"Applied database migration {version}")
+
+    def load_seen_index(self):
+        """(Re)build the in-memory seen-url index from the database"""
+        with self.lock:
+            count = self.conn.execute('SELECT COUNT(*) FROM sent_articles').fetchone()[0]
+            index = BloomFilter(capacity=max(100_000, count * 2))
+            for (url,) in self.conn.execute('SELECT url FROM sent_articles'):
+                index.add(url)
+            self.seen_index = index
+        logging.info(f"Loaded seen-url index with {count} urls ({len(index.bits) // 1024} KiB)")
+
+    def load_near_duplicate_index(self):
+        """(Re)build the signature index from articles sent in the last NEAR_DUP_DAYS"""
+        since = (datetime.now() - timedelta(days=NEAR_DUP_DAYS)).date().isoformat()
+        index = MinHashIndex()
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT url, minhash, startup_name FROM sent_articles WHERE minhash IS NOT NULL AND sent_date >= ?',
+                (since,)
+            )
+            for url, blob, startup_name in rows:
+                index.add(url, tuple(array('Q', blob)), startup_name or '')
+            self.near_duplicates = index
+        logging.info(f"Loaded near-duplicate index with {len(index)} recent articles")
+
+    def find_near_duplicate(self, signature: Tuple[int, ...], entity: str = '') -> Optional[Tuple[str, float]]:
+        """Return a recently sent article similar to signature, as (url, similarity)"""
+        if self.near_duplicates is None:
+            return None
+        with self.lock:
+            return self.near_duplicates.find(signature, entity)
+
+    def filter_sent(self, urls: List[str]) -> set:
+        """Return the subset of urls that were already sent"""
+        urls = list(dict.fromkeys(urls))
+        sent = set()
+        with self.lock:
+            if self.seen_index is not None:
+                urls = [url for url in urls if url in self.seen_index]
+            for start in range(0, len(urls), self.BATCH_SIZE):
+                chunk = urls[start:start + self.BATCH_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f'SELECT url FROM sent_articles WHERE url IN ({placeholders})', chunk
+                ).fetchall()
+                sent.update(row[0] for row in rows)
+        return sent
+
+    def mark_sent(self, articles: List['StartupNews']):
+        """Record a batch of sent articles in a single transaction"""
+        sent_date = datetime.now().date().isoformat()
+        signatures = [article_signature(article) for article in articles]
+        rows = [
+            (article.url, article.title, sent_date, article.source, signature_blob(signature), article.startup_name)
+            for article, signature in zip(articles, signatures)
+        ]
+        with self.lock:
+            with self.conn:
+                self.conn.executemany('''
+                    INSERT OR IGNORE INTO sent_articles (url, title, sent_date, source, minhash, startup_name)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
+                self.conn.executemany(
+                    'DELETE FROM pending_articles WHERE url = ?', [(article.url,) for article in articles]
+                )
+            if self.near_duplicates is not None:
+                for article, signature in zip(articles, signatures):
+                    self.near_duplicates.add(article.url, signature, article.startup_name)
+            if self.seen_index is not None:
+                for article in articles:
+                    self.seen_index.add(article.url)
+                # Rebuild at a larger size before the false-positive rate degrades
+                if self.seen_index.count > self.seen_index.capacity:
+                    self.load_seen_index()
+
+    def archive(self, articles: List['StartupNews']):
+        """Upsert parsed articles, matched or not, into the searchable archive"""
+        if not articles:
+            return
+        now = datetime.now().isoformat()
+        rows = [
+            (article.url, article.title, article.description, article.source, article.date,
+             article.matched_signal, article.startup_name, article.category, now, now)
+            for article in articles
+        ]
+        with self.lock, self.conn:
+            # Only last_seen and the tags change on a revisit, so the FTS
+            # update trigger doesn't fire for unchanged text
+            self.conn.executemany('''
+                INSERT INTO article_archive
+                    (url, title, description, source, date, matched_signal, startup_name, category,
+                     first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    last_seen = excluded.last_seen,
+                    matched_signal = excluded.matched_signal,
+                    startup_name = excluded.startup_name,
+                    category = excluded.category
+            ''', rows)
+
+    def annotate_archive(self, gazetteer: 'StartupGazetteer') -> int:
+        """Name the startups of articles archived before the gazetteer existed"""
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT id, title, description FROM article_archive WHERE startup_name IS NULL'
+            ).fetchall()
+        if not rows:
+            return 0
+        updates = [(*gazetteer.extract(title or '', description or ''), row_id) for row_id, title, description in rows]
+        with self.lock, self.conn:
+            self.conn.executemany('UPDATE article_archive SET startup_name = ?, category = ? WHERE id = ?', updates)
+        logging.info(f"Named startups in {len(updates)} archived articles")
+        return len(updates)
+
+    def search_archive(self, query: Optional[str] = None, source: Optional[str] = None, matched_only: bool = False,
+                       limit: int = SEARCH_PAGE_SIZE, after: Optional[Tuple[float, int]] = None,
+                       startup: Optional[str] = None, category: Optional[str] = None) -> List[Dict]:
+        """Search the archive with keyset pagination"""
+        columns = ('a.id, a.url, a.title, a.description, a.source, a.date, a.matched_signal, '
+                   'a.startup_name, a.category, a.first_seen, a.last_seen')
+        conditions, params = [], []
+        if source:
+            conditions.append('a.source = ?')
+            params.append(source)
+        if startup:
+            conditions.append('a.startup_name = ?')
+            params.append(startup)
+        if category:
+            conditions.append('a.category = ?')
+            params.append(category)
+        if matched_only:
+            conditions.append("a.matched_signal != ''")
+        if query:
+            conditions.insert(0, 'article_archive_fts MATCH ?')
+            params.insert(0, query)
+            if after:
+                conditions.append('(f.rank, a.id) > (?, ?)')
+                params.extend(after)
+            sql = (f'SELECT {columns}, f.rank FROM article_archive_fts f '
+                   f'JOIN article_archive a ON a.id = f.rowid '
+                   f'WHERE {" AND ".join(conditions)} ORDER BY f.rank, a.id LIMIT ?')
+        else:
+            if after:
+                conditions.append('a.id < ?')
+                params.append(after[1])
+            where = f'WHERE {" AND ".join(conditions)} ' if conditions else ''
+            sql = f'SELECT {columns}, NULL FROM article_archive a {where}ORDER BY a.id DESC LIMIT ?'
+        params.append(limit)
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        keys = ('id', 'url', 'title', 'description', 'source', 'date', 'matched_signal',
+                'startup_name', 'category', 'first_seen', 'last_seen', 'rank')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def archive_startups(self, category: Optional[str] = None, since: Optional[str] = None,
+                         limit: int = SEARCH_PAGE_SIZE) -> List[Dict]:
+        """Archived coverage grouped by startup, most covered first"""
+        conditions, params = ["startup_name != ''"], []
+        if category:
+            conditions.append('category = ?')
+            params.append(category)
+        if since:
+            conditions.append('last_seen >= ?')
+            params.append(since)
+        params.append(limit)
+        with self.lock:
+            rows = self.conn.execute(f'''
+                SELECT startup_name, category, COUNT(*), SUM(matched_signal != ''), MAX(last_seen)
+                FROM article_archive WHERE {" AND ".join(conditions)}
+                GROUP BY startup_name ORDER BY COUNT(*) DESC, startup_name LIMIT ?
+            ''', params).fetchall()
+        keys = ('startup_name', 'category', 'articles', 'launches', 'last_seen')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def load_selector_profiles(self) -> Dict[str, Dict[str, str]]:
+        """Return the learned selector profile of every source"""
+        with self.lock:
+            rows = self.conn.execute('SELECT source, profile FROM selector_profiles').fetchall()
+        return {source: json.loads(profile) for source, profile in rows}
+
+    def save_selector_profile(self, source: str, profile: Dict[str, str]):
+        """Persist a source's learned selector profile"""
+        with self.lock, self.conn:
+            self.conn.execute('''
+                INSERT OR REPLACE INTO selector_profiles (source, profile, updated_at)
+                VALUES (?, ?, ?)
+            ''', (source, json.dumps(profile), datetime.now().isoformat()))
+
+    def load_source_feeds(self) -> Dict[str, Dict]:
+        """Return the discovered feed (or lack of one) for every probed source"""
+        with self.lock:
+            rows = self.conn.execute('SELECT source, feed_url, feed_type, checked_at FROM source_feeds').fetchall()
+        return {
+            source: {'url': feed_url, 'type': feed_type, 'checked_at': checked_at}
+            for source, feed_url, feed_type, checked_at in rows
+        }
 
-@dataclass
-class StartupNews:
-    title: str
-    url: str
-    description: str
-    source: str
-    date: str
-    startup_name: str = ""
-    category: str = ""
+    def save_source_feed(self, source: str, feed_url: Optional[str], feed_type: Optional[str]):
+        """Remember a source's feed discovery result"""
+        with self.lock, self.conn:
+            self.conn.execute('''
+                INSERT OR REPLACE INTO source_feeds (source, feed_url, feed_type, checked_at)
+                VALUES (?, ?, ?, ?)
+            ''', (source, feed_url, feed_type, datetime.now().isoformat()))
+
+    def load_watermarks(self) -> Dict[str, Watermark]:
+        """Return every source's listing watermark"""
+        with self.lock:
+            rows = self.conn.execute('SELECT source, urls, newest FROM source_watermarks').fetchall()
+        return {source: Watermark(json.loads(urls), newest) for source, urls, newest in rows}
+
+    def save_watermarks(self, watermarks: Dict[str, Watermark]):
+        """Persist watermarks for the given sources in one transaction"""
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO source_watermarks (source, urls, newest, updated_at)
+                VALUES (?, ?, ?, ?)
+            ''', [
+                (source, json.dumps(watermark.urls), watermark.newest, now)
+                for source, watermark in watermarks.items()
+            ])
+
+    def load_poll_states(self) -> Dict[str, SourcePollState]:
+        """Return every source's adaptive poll schedule"""
+        with self.lock:
+            rows = self.conn.execute('''
+                SELECT source, interval_s, next_due, last_polled, item_rate, launch_rate, polls
+                FROM source_poll_state
+            ''').fetchall()
+        return {row[0]: SourcePollState(*row) for row in rows}
+
+    def save_poll_states(self, states: List[SourcePollState]):
+        """Persist poll schedules in one transaction"""
+        with self.lock, self.conn:
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO source_poll_state
+                    (source, interval_s, next_due, last_polled, item_rate, launch_rate, polls)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [astuple(state) for state in states])
+
+    def add_pending(self, articles: List['StartupNews']):
+        """Queue articles for the next digest"""
+        if not articles:
+            return
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            self.conn.executemany('''
+                INSERT OR IGNORE INTO pending_articles (url, article, queued_at)
+                SELECT ?, ?, ? WHERE NOT EXISTS (SELECT 1 FROM sent_articles WHERE url = ?)
+            ''', [
+                (article.url, json.dumps(asdict(article), ensure_ascii=False), now, article.url)
+                for article in articles
+            ])
+
+    def load_pending(self) -> List['StartupNews']:
+        """Articles waiting for the next digest, in the order they were found"""
+        with self.lock:
+            rows = self.conn.execute('SELECT article FROM pending_articles ORDER BY id').fetchall()
+        return [StartupNews(**json.loads(article)) for (article,) in rows]
+
+    def load_source_health(self) -> Dict[str, SourceHealth]:
+        """Return every source's saved health"""
+        with self.lock:
+            rows = self.conn.execute('''
+                SELECT source, latencies, error_streak, last_success, last_failure, last_error, open_until
+                FROM source_health
+            ''').fetchall()
+        return {row[0]: SourceHealth(row[0], json.loads(row[1]), *row[2:]) for row in rows}
+
+    def save_source_health(self, states: List[SourceHealth]):
+        """Persist source health in one transaction"""
+        with self.lock, self.conn:
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO source_health
+                    (source, latencies, error_streak, last_success, last_failure, last_error, open_until)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (state.source, json.dumps(state.latencies), state.error_streak, state.last_success,
+                 state.last_failure, state.last_error, state.open_until)
+                for state in states
+            ])
+
+    def add_archive_entry(self, source: str, url: str, kind: str, fetched_at: float, segment: str,
+                          offset: int, length: int):
+        """Index an archived response"""
+        with self.lock, self.conn:
+            self.conn.execute('''
+                INSERT INTO response_archive (source, url, kind, fetched_at, segment, record_offset, record_length)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (source, url, kind, fetched_at, segment, offset, length))
+
+    def last_archive_entry(self, url: str) -> Optional[Tuple[str, int, int]]:
+        """(segment, offset, length) of the url's latest archived response"""
+        with self.lock:
+            return self.conn.execute('''
+                SELECT segment, record_offset, record_length FROM response_archive
+                WHERE url = ? ORDER BY fetched_at DESC LIMIT 1
+            ''', (url,)).fetchone()
+
+    def archive_entries(self, since: float, until: float, sources: Optional[List[str]] = None) -> List[Tuple]:
+        """Archived responses fetched in [since, until), oldest first"""
+        query = '''
+            SELECT fetched_at, source, url, kind, segment, record_offset, record_length FROM response_archive
+            WHERE fetched_at >= ? AND fetched_at < ?
+        '''
+        params = [since, until]
+        if sources:
+            query += f" AND source IN ({','.join('?' * len(sources))})"
+            params.extend(sources)
+        with self.lock:
+            return self.conn.execute(query + ' ORDER BY fetched_at', params).fetchall()
+
+def shard_of(source_name: str, shards: int = SOURCE_SHARDS) -> int:
+    """Stable shard number of a source, the same in every worker"""
+    return zlib.crc32(source_name.encode('utf-8')) % shards
+
+class LocalLeaseBackend:
+    """In-process lease table, the stand-in when there is a single worker"""
+    shared = False
 
-class AfricanStartupScraper:
     def __init__(self):
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, name: str, owner: str, ttl: float) -> bool:
+        """Take or renew a lease; fails while another owner holds it"""
+        now = time.time()
+        with self._lock:
+            holder = self._leases.get(name)
+            if holder and holder[0] != owner and holder[1] > now:
+                return False
+            self._leases[name] = (owner, now + ttl)
+            return True
+
+    def release(self, name: str, owner: str):
+        with self._lock:
+            if self._leases.get(name, (None,))[0] == owner:
+                del self._leases[name]
+
+    def holders(self, prefix: str) -> Dict[str, str]:
+        """Live leases whose name starts with prefix, mapped to their owners"""
+        now = time.time()
+        with self._lock:
+            return {
+                name: owner for name, (owner, expires_at) in self._leases.items()
+                if name.startswith(prefix) and expires_at > now
+            }
+
+    def prune(self, before: float):
+        with self._lock:
+            for name in [name for name, (_, expires_at) in self._leases.items() if expires_at < before]:
+                del self._leases[name]
+
+class SQLiteLeaseBackend:
+    """Lease table in a SQLite database shared by every worker on the host"""
+    shared = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS leases (
+                name TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        ''')
+
+    def acquire(self, name: str, owner: str, ttl: float) -> bool:
+        """Take or renew a lease; fails while another owner holds it"""
+        now = time.time()
+        with self.lock:
+            cursor = self.conn.execute('''
+                INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE leases.owner = excluded.owner OR leases.expires_at <= ?
+            ''', (name, owner, now + ttl, now))
+            return cursor.rowcount == 1
+
+    def release(self, name: str, owner: str):
+        with self.lock:
+            self.conn.execute('DELETE FROM leases WHERE name = ? AND owner = ?', (name, owner))
+
+    def holders(self, prefix: str) -> Dict[str, str]:
+        """Live leases whose name starts with prefix, mapped to their owners"""
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT name, owner FROM leases WHERE substr(name, 1, ?) = ? AND expires_at > ?',
+                (len(prefix), prefix, time.time())
+            ).fetchall()
+        return dict(rows)
+
+    def prune(self, before: float):
+        with self.lock:
+            self.conn.execute('DELETE FROM leases WHERE expires_at < ?', (before,))
+
+class Coordinator:
+    """Lease-based sharding of the sources across workers"""
+    def __init__(self, backend, worker_id: Optional[str] = None, shards: int = SOURCE_SHARDS,
+                 ttl: float = LEASE_TTL):
+        self.backend = backend
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.shards = max(1, shards)
+        self.ttl = ttl
+        self.owned: set = set()
+        self.workers = 1
+        # Shards taken over since the scraper last reloaded their state
+        self._gained: set = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def heartbeat(self) -> set:
+        """Renew this worker's leases and rebalance shards; returns the owned shards"""
+        with self._lock:
+            self.backend.acquire(f'worker:{self.worker_id}', self.worker_id, self.ttl)
+            self.workers = max(1, len(self.backend.holders('worker:')))
+            share = -(-self.shards // self.workers)
+            owned = {
+                shard for shard in self.owned
+                if self.backend.acquire(f'shard:{shard}', self.worker_id, self.ttl)
+            }
+            for shard in sorted(owned, reverse=True)[:max(0, len(owned) - share)]:
+                self.backend.release(f'shard:{shard}', self.worker_id)
+                owned.discard(shard)
+            for shard in range(self.shards):
+                if len(owned) >= share:
+                    break
+                if shard not in owned and self.backend.acquire(f'shard:{shard}', self.worker_id, self.ttl):
+                    owned.add(shard)
+            self._gained |= owned - self.owned
+            self.owned = owned
+            return set(owned)
+
+    def take_gained(self) -> set:
+        """Shards taken over since the last call"""
+        with self._lock:
+            gained, self._gained = self._gained, set()
+            return gained
+
+    def owns(self, source_name: str) -> bool:
+        return shard_of(source_name, self.shards) in self.owned
+
+    def start(self):
+        """Keep the leases renewed from a background thread"""
+        self.heartbeat()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._renew, name='lease-renewal', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop renewing and hand this worker's shards back"""
+        self._stop.set()
+        with self._lock:
+            for shard in self.owned:
+                self.backend.release(f'shard:{shard}', self.worker_id)
+            self.backend.release(f'worker:{self.worker_id}', self.worker_id)
+            self.owned = set()
+
+    def _renew(self):
+        while not self._stop.wait(self.ttl / 3):
+            try:
+                self.heartbeat()
+                self.backend.prune(time.time() - DIGEST_LEASE_TTL)
+            except Exception as e:
+                logging.error(f"Error renewing leases: {e}")
+
+    def mark_polled(self, day: str, shards: Optional[List[int]] = None):
+        """Record that shards have been polled for day's digest"""
+        for shard in self.owned if shards is None else shards:
+            self.backend.acquire(f'polled:{day}:{shard}', self.worker_id, DIGEST_LEASE_TTL)
+
+    def claim_digest(self, day: str) -> bool:
+        """Take day's digest lease; only one worker gets it"""
+        return self.backend.acquire(f'digest:{day}', self.worker_id, DIGEST_LEASE_TTL)
+
+    def unpolled_shards(self, day: str) -> Tuple[List[int], List[int]]:
+        """Shards not yet polled for day's digest, split into owned and orphaned"""
+        polled = {int(name.rsplit(':', 1)[1]) for name in self.backend.holders(f'polled:{day}:')}
+        owners = {int(name.rsplit(':', 1)[1]) for name in self.backend.holders('shard:')}
+        missing = [shard for shard in range(self.shards) if shard not in polled]
+        return [shard for shard in missing if shard in owners], [shard for shard in missing if shard not in owners]
+
+    def snapshot(self) -> Dict:
+        """This worker's view of the coordination state, for /status"""
+        with self._lock:
+            return {
+                'worker_id': self.worker_id,
+                'shared': self.backend.shared,
+                'workers': self.workers,
+                'shards': self.shards,
+                'owned_shards': sorted(self.owned)
+            }
+
+# Comprehensive list of African startup news sources, all parsed as WordPress
+NEWS_SOURCES = {
+    'techcabal': 'https://techcabal.com',
+    'techpoint_africa': 'https://techpoint.africa',
+    'benjamindada': 'https://www.benjamindada.com',
+    'disrupt_africa': 'https://disrupt-africa.com',
+    'technext': 'https://technext24.com',
+    'techtrendske': 'https://techtrendske.co.ke',
+    'digest_africa': 'https://digestafrica.com',
+    'tech_moran': 'https://techmoran.com',
+    'innovation_village': 'https://innovation-village.com',
+    'startup_nigeria': 'https://startupnigeria.org',
+    'the_flip_africa': 'https://theflip.africa',
+    'tech_safari': 'https://www.techsafari.africa',
+    'ventureburn': 'https://ventureburn.com',
+    'wamda': 'https://www.wamda.com',
+    'startupbrics': 'https://startupbrics.com',
+    'tech_in_africa': 'https://techinafrica.com',
+    'baobab_insights': 'https://baobabinsights.com',
+    'weetracker': 'https://weetracker.com',
+    'techbuild_africa': 'https://techbuild.africa',
+    'founders_africa': 'https://foundersafrica.com',
+    'techeconomy': 'https://techeconomy.ng',
+    'techgh24': 'https://techgh24.com',
+    'technova_ghana': 'https://technovagh.com',
+    'african_business': 'https://african.business',
+    'iafrikan': 'https://www.iafrikan.com',
+    'zikoko_tech': 'https://www.zikoko.com'
+}
+
+class AfricanStartupScraper:
+    def __init__(self, max_workers: int = MAX_CONCURRENT_FETCHES, per_host_delay: float = PER_HOST_DELAY,
+                 parser_backend: str = HTML_PARSER_BACKEND, parse_workers: int = PARSE_WORKERS,
+                 lease_backend=None):
+        if parser_backend not in PARSER_BACKENDS:
+            raise ValueError(f"Unknown parser backend: {parser_backend}")
+        self.parser_backend = parser_backend
+        import requests
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
+        # Concurrent fetching: size the connection pool to the worker count
+        # and rate-limit per host instead of sleeping between every source
+        self.max_workers = max(1, max_workers)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.rate_limiter = HostRateLimiter(per_host_delay)
+        
+        # Conditional-GET cache; parsed results are kept per url so a 304
+        # skips both the download and the parse
+        self.response_cache = ResponseCache()
+        self._parsed_pages: Dict[str, List[StartupNews]] = {}
+        
+        # Optional process pool for CPU-bound parsing, started on first use
+        self.parse_workers = max(0, parse_workers)
+        self._parse_pool: Optional['ProcessPoolExecutor'] = None
+        self._parse_pool_lock = threading.Lock()
+        
+        # Compiled digest templates and cached entry fragments
+        self.digest_renderer = DigestRenderer()
+        
+        # Extra pipeline consumers fed alongside the digest on every run
+        self.consumers = []
+        if WEBHOOK_URL:
+            self.consumers.append(WebhookConsumer(WEBHOOK_URL, self.session))
+        
+        # Per-source breakdown of the scrape in progress, the last finished
+        # one, and the scrape of the last digest run
+        self._stats_lock = threading.Lock()
+        self._current_run: Optional[Dict] = None
+        self.last_poll: Optional[Dict] = None
+        self.last_run: Optional[Dict] = None
+        
         # Initialize database
         self.init_database()
+        self.selector_profiles = self.store.load_selector_profiles()
+        self.source_feeds = self.store.load_source_feeds()
+        # Watermarks advance only once a run's articles have been sent, so a
+        # failed send re-scans the same items next time
+        self.watermarks = self.store.load_watermarks()
+        self._pending_watermarks: Dict[str, Watermark] = {}
+        # Latency, error streaks and circuit breaker state per source
+        self.source_health = SourceHealthMonitor(self.store.load_source_health())
+        # Raw responses kept for replaying past days
+        self.response_archive = ResponseArchive(RESPONSE_ARCHIVE_DIR, self.store) if RESPONSE_ARCHIVE_DIR else None
         
-        # Expanded comprehensive launch signals regex pattern
-        self.LAUNCH_SIGNALS = re.compile(
-            r"""
-            \b(
-                # core launch verbs
-                launch(?:es|ed|ing)? |
-                ship(?:s|ped|ping)? |
-                release(?:s|d|ing)? |
-                roll(?:s|ed)?\s*out |
-                debut(?:s|ed|ing)? |
-                unveil(?:s|ed|ing)? |
-                introduce(?:s|d|ing)? |
-                # "go live" family
-                go(?:es)?\s*live |
-                we'?re\s+live |
-                now\s*live |
-                now\s+available |
-                # beta / early-access
-                public\s+beta |
-                private\s+beta |
-                early\s+access |
-                soft\s+launch |
-                MVP\s+live |
-                v(?:\d+\.)?\d+\s*release |        # v1.0, v2.3.1, etc.
-                # stealth exits
-                out\s+of\s+stealth |
-                emerges?\s+from\s+stealth |
-                exits?\s+stealth\s*mode |
-                breaks?\s+cover |
-                # wait-list / sign-up
-                waitlist\s+open |
-                sign[-\s]*ups?\s+open |
-                open\s*for\s*signups? |
-                # funding-tied cues
-                secures?\s+pre[-\s]*seed |
-                raises?\s+angel\s+round |
-                funded\s+to\s+launch |
-                # accelerator / demo-day
-                joins?\s+.*\baccelerator\b |
-                graduates?\s+from\s+accelerator |
-                demo\s*day\s*debut |
-                # market / product expansion
-                enters?\s+new\s+market |
-                expands?\s+to |
-                opens?\s+operations\s+in |
-                adds?\s+new\s+platform |
-                launches?\s+in |
-                # additional signals
-                new\s+product |
-                new\s+service |
-                new\s+platform |
-                new\s+app |
-                new\s+feature |
-                announce(?:s|d|ing)? |
-                reveal(?:s|ed|ing)? |
-                present(?:s|ed|ing)? |
-                showcase(?:s|d|ing)? |
-                expansion |
-                milestone |
-                breakthrough |
-                innovation |
-                partnership |
-                collaboration |
-                integration |
-                upgrade(?:s|d|ing)? |
-                enhancement(?:s)? |
-                improvement(?:s)? |
-                beta\s+test |
-                pilot\s+program |
-                pre[-\s]*launch |
-                coming\s+soon |
-                available\s+now
-            )\b
-            """, 
-            re.VERBOSE | re.IGNORECASE
-        )
+        # Launch signal matcher; the original regex (LAUNCH_SIGNALS, compiled
+        # on first access) is kept as the reference the engine is checked against
+        self.keyword_engine = LaunchSignalClassifier()
+        # Startup and sector tagging; archived articles from before it
+        # existed are tagged once
+        self.gazetteer = StartupGazetteer.load()
+        self.store.annotate_archive(self.gazetteer)
         
         # Comprehensive list of African startup news sources
         self.sources = {
-            'techcabal': {
-                'url': 'https://techcabal.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'techpoint_africa': {
-                'url': 'https://techpoint.africa',
-                'parser': self.parse_generic_wordpress
-            },
-            'benjamindada': {
-                'url': 'https://www.benjamindada.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'disrupt_africa': {
-                'url': 'https://disrupt-africa.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'technext': {
-                'url': 'https://technext24.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'techtrendske': {
-                'url': 'https://techtrendske.co.ke',
-                'parser': self.parse_generic_wordpress
-            },
-            'digest_africa': {
-                'url': 'https://digestafrica.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'tech_moran': {
-                'url': 'https://techmoran.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'innovation_village': {
-                'url': 'https://innovation-village.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'startup_nigeria': {
-                'url': 'https://startupnigeria.org',
-                'parser': self.parse_generic_wordpress
-            },
-            'the_flip_africa': {
-                'url': 'https://theflip.africa',
-                'parser': self.parse_generic_wordpress
-            },
-            'tech_safari': {
-                'url': 'https://www.techsafari.africa',
-                'parser': self.parse_generic_wordpress
-            },
-            'ventureburn': {
-                'url': 'https://ventureburn.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'wamda': {
-                'url': 'https://www.wamda.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'startupbrics': {
-                'url': 'https://startupbrics.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'tech_in_africa': {
-                'url': 'https://techinafrica.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'baobab_insights': {
-                'url': 'https://baobabinsights.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'weetracker': {
-                'url': 'https://weetracker.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'techbuild_africa': {
-                'url': 'https://techbuild.africa',
-                'parser': self.parse_generic_wordpress
-            },
-            'founders_africa': {
-                'url': 'https://foundersafrica.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'techeconomy': {
-                'url': 'https://techeconomy.ng',
-                'parser': self.parse_generic_wordpress
-            },
-            'techgh24': {
-                'url': 'https://techgh24.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'technova_ghana': {
-                'url': 'https://technovagh.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'african_business': {
-                'url': 'https://african.business',
-                'parser': self.parse_generic_wordpress
-            },
-            'iafrikan': {
-                'url': 'https://www.iafrikan.com',
-                'parser': self.parse_generic_wordpress
-            },
-            'zikoko_tech': {
-                'url': 'https://www.zikoko.com',
-                'parser': self.parse_generic_wordpress
-            }
+            name: {'url': url, 'parser': self.parse_generic_wordpress}
+            for name, url in NEWS_SOURCES.items()
         }
+        
+        # Adaptive per-source polling. Polls and digest runs take the run
+        # lock in turn; what a poll finds waits in the pending queue, and
+        # later polls cluster against it as a digest run would
+        self._run_lock = threading.RLock()
+        self.poll_scheduler = PollScheduler(self.store.load_poll_states(), list(self.sources))
+        self.pending_index = self.load_pending_index()
+        
+        # Workers sharing a lease database split the sources by shard; on
+        # its own this worker owns them all
+        if lease_backend is None:
+            lease_backend = SQLiteLeaseBackend(COORDINATION_DATABASE) if COORDINATION_DATABASE else LocalLeaseBackend()
+        self.coordinator = Coordinator(lease_backend)
+        if lease_backend.shared:
+            self.coordinator.start()
+        else:
+            self.coordinator.heartbeat()
+        # State for the initial shards was loaded above
+        self.coordinator.take_gained()
+
+    @cached_property
+    def LAUNCH_SIGNALS(self) -> re.Pattern:
+        """Reference launch signal regex"""
+        return re.compile(LAUNCH_SIGNALS_PATTERN, re.VERBOSE | re.IGNORECASE)
 
     def init_database(self):
-        """Initialize SQLite database to track sent articles"""
-        conn = sqlite3.connect('sent_articles.db')
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sent_articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                url TEXT UNIQUE,
-                title TEXT,
-                sent_date DATE,
-                source TEXT
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        """Open the shared article database connection"""
+        self.store = ArticleStore()
 
     def is_article_sent(self, url: str) -> bool:
         """Check if article was already sent"""
-        conn = sqlite3.connect('sent_articles.db')
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM sent_articles WHERE url = ?', (url,))
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count > 0
+        return url in self.store.filter_sent([url])
 
     def mark_article_sent(self, article: StartupNews):
         """Mark article as sent"""
-        conn = sqlite3.connect('sent_articles.db')
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-                INSERT INTO sent_articles (url, title, sent_date, source)
-                VALUES (?, ?, ?, ?)
-            ''', (article.url, article.title, datetime.now().date(), article.source))
-            conn.commit()
-        except sqlite3.IntegrityError:
-            pass  # Article already exists
-        conn.close()
+        self.store.mark_sent([article])
+
+    def mark_articles_sent(self, articles: List[StartupNews]):
+        """Mark a batch of articles as sent in one transaction"""
+        self.store.mark_sent(articles)
+        self.pending_index = self.load_pending_index()
+
+    def load_pending_index(self) -> MinHashIndex:
+        """Signature index of the stories waiting in the pending queue"""
+        index = MinHashIndex()
+        for article in self.store.load_pending():
+            if not article.duplicate_of:
+                index.add(article.url, article_signature(article), article.startup_name)
+        return index
 
     def contains_launch_keywords(self, text: str) -> bool:
-        """Check if text contains launch-related keywords using advanced regex"""
-        return bool(self.LAUNCH_SIGNALS.search(text))
+        """Check if text contains launch-related keywords"""
+        return self.keyword_engine.classify(text) is not None
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a webpage"""
+    def match_launch_signal(self, text: str) -> Optional[str]:
+        """Return the launch signal matched in text, or None"""
+        return self.keyword_engine.classify(text)
+
+    def record_stats(self, source_name: str, **values):
+        """Accumulate per-source measurements for the run in progress"""
+        with self._stats_lock:
+            if self._current_run is None:
+                return
+            stats = self._current_run['sources'].setdefault(source_name, {})
+            for key, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    stats[key] = stats.get(key, 0) + value
+                else:
+                    stats[key] = value
+
+    def fetch_response(self, url: str, source_name: str = 'unknown', trim: bool = False,
+                       kind: Optional[str] = None) -> Optional[FetchResult]:
+        """Fetch a url, revalidating against the response cache"""
+        start = time.perf_counter()
+        status = 'error'
+        error = None
+        response = None
         try:
-            response = self.session.get(url, timeout=15)
+            timeout = self.source_health.timeout(source_name)
+            self.rate_limiter.wait(url)
+            start = time.perf_counter()
+            # A trimmed page is cached apart from the full one; both carry the
+            # server's validators for the whole page
+            cache_key = f'{url} trimmed' if trim else url
+            headers = self.response_cache.conditional_headers(cache_key)
+            response = self.session.get(url, timeout=timeout, headers=headers, stream=STREAM_FETCH)
+            status = response.status_code
+            if response.status_code == 304:
+                body = self.response_cache.load(cache_key)
+                if body is not None:
+                    # A trimmed cache entry is not what the server sent, so
+                    # it can only point at an earlier archive record
+                    self.archive_response(source_name, url, kind, None if trim else body, response, revisit=True)
+                    return FetchResult(url=url, content=body, status_code=304, not_modified=True)
+                # Cache entry was evicted since the validators were read
+                response.close()
+                response = self.session.get(url, timeout=timeout, stream=STREAM_FETCH)
+                status = response.status_code
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            if STREAM_FETCH:
+                keep_raw = kind is not None and self.response_archive is not None
+                raw, body = self.read_body(response, source_name, trim, keep_raw)
+            else:
+                raw = body = response.content
+            # A full page cut off at STREAM_MAX_BYTES is not the page the validators describe
+            complete = trim or not STREAM_FETCH or len(raw) < STREAM_MAX_BYTES
+            self.response_cache.store(cache_key, response, body, complete)
+            self.archive_response(source_name, url, kind, raw, response)
+            METRICS.inc('scraper_fetch_bytes_total', len(body), source=source_name)
+            self.record_stats(source_name, fetch_bytes=len(body))
+            return FetchResult(url=url, content=body, status_code=response.status_code)
         except Exception as e:
             logging.error(f"Error fetching {url}: {e}")
+            error = str(e) or type(e).__name__
             return None
+        finally:
+            if response is not None:
+                # Hands a streamed connection back to the pool, read or not
+                response.close()
+            elapsed = time.perf_counter() - start
+            if source_name != 'unknown':
+                self.source_health.observe_fetch(source_name, elapsed, error)
+            METRICS.observe('scraper_fetch_seconds', elapsed, source=source_name)
+            METRICS.inc('scraper_fetch_responses_total', source=source_name, status=str(status))
+            self.record_stats(source_name, fetch_s=elapsed, http_status=str(status))
 
-    def parse_generic_wordpress(self, soup: BeautifulSoup, source_name: str) -> List[StartupNews]:
-        """Generic parser for WordPress-based sites"""
-        articles = []
+    def archive_response(self, source_name: str, url: str, kind: Optional[str], body: Optional[bytes],
+                         response: 'requests.Response', revisit: bool = False):
+        """Add a source's raw response to the replay archive"""
+        if self.response_archive is None or kind is None:
+            return
         try:
-            # Try multiple common WordPress article selectors
-            article_selectors = [
-                'article',
-                '.post',
-                '.entry',
-                '.content-item',
-                '.post-item',
-                '.article-item',
-                '.blog-post',
-                '[class*="post"]',
-                '[class*="article"]'
-            ]
-            
-            found_articles = []
-            for selector in article_selectors:
-                found_articles = soup.select(selector)[:15]
-                if found_articles:
-                    break
-            
-            for article in found_articles:
-                # Try to find title
-                title_elem = None
-                title_selectors = ['h1', 'h2', 'h3', '.entry-title', '.post-title', '.article-title', '.title']
-                for t_sel in title_selectors:
-                    title_elem = article.select_one(t_sel)
-                    if title_elem:
-                        break
-                
-                if not title_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                
-                # Try to find URL
-                url = None
-                link_elem = title_elem.find('a') or article.find('a')
-                if link_elem and link_elem.get('href'):
-                    url = link_elem['href']
-                    # Handle relative URLs
-                    if url.startswith('/'):
-                        from urllib.parse import urljoin, urlparse
-                        base_url = f"{urlparse(self.sources[source_name]['url']).scheme}://{urlparse(self.sources[source_name]['url']).netloc}"
-                        url = urljoin(base_url, url)
-                
-                if not url:
-                    continue
-                
-                # Try to find description
-                description = ""
-                desc_selectors = ['.entry-content', '.post-content', '.excerpt', '.summary', '.description', 'p']
-                for d_sel in desc_selectors:
-                    desc_elem = article.select_one(d_sel)
-                    if desc_elem:
-                        description = desc_elem.get_text(strip=True)[:300] + "..."
-                        break
-                
-                # Try to find date
-                date = datetime.now().strftime('%Y-%m-%d')
-                date_selectors = ['time', '.date', '.post-date', '.entry-date', '[datetime]']
-                for date_sel in date_selectors:
-                    date_elem = article.select_one(date_sel)
-                    if date_elem:
-                        date_text = date_elem.get('datetime') or date_elem.get_text(strip=True)
-                        if date_text:
-                            date = date_text
-                        break
-                
-                # Check if it's about product/service launch
-                full_text = title + " " + description
-                if self.contains_launch_keywords(full_text):
-                    articles.append(StartupNews(
-                        title=title,
-                        url=url,
-                        description=description,
-                        source=source_name.replace('_', ' ').title(),
-                        date=date
-                    ))
-                    
+            if (revisit and self.response_archive.revisit(source_name, url, kind)) or body is None:
+                return
+            content_type = response.headers.get('Content-Type') or 'application/octet-stream'
+            self.response_archive.append(source_name, url, kind, body, content_type)
         except Exception as e:
-            logging.error(f"Error parsing {source_name}: {e}")
+            logging.error(f"Error archiving {url}: {e}")
+
+    def read_body(self, response: 'requests.Response', source_name: str, trim: bool = False,
+                  keep_raw: bool = False) -> Tuple[bytes, bytes]:
+        """Read a streamed response, returning the raw bytes and the body for the parser"""
+        trimmer = None
+        if trim:
+            # Count what the parser will select: the learned selector if any
+            learned = self.selector_profiles.get(source_name, {}).get('article')
+            trimmer = PageTrimmer(selectors=[learned] if learned else TRIM_CONTAINER_SELECTORS)
+        raw, chunks = [], []
+        received = 0
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            received += len(chunk)
+            raw.append(chunk)
+            if trimmer and not trimmer.done:
+                chunks.append(trimmer.feed(chunk))
+            if received >= STREAM_MAX_BYTES or (trimmer and trimmer.done and not keep_raw):
+                break
+        raw = b''.join(raw)
+        if trimmer:
+            chunks.append(trimmer.close())
+        body = b''.join(chunks) if trimmer else raw
+        stripped = trimmer.stripped_bytes if trimmer else 0
+        # Content-Length and the raw position both count bytes on the wire
+        length = response.headers.get('Content-Length')
+        tell = getattr(response.raw, 'tell', None)
+        unread = max(0, int(length) - tell()) if length and length.isdigit() and tell else 0
+        if stripped:
+            METRICS.inc('scraper_fetch_skipped_bytes_total', stripped, source=source_name, reason='script_style')
+        if unread:
+            METRICS.inc('scraper_fetch_skipped_bytes_total', unread, source=source_name, reason='unread')
+        self.record_stats(source_name, stripped_bytes=stripped, unread_bytes=unread)
+        return raw, body
+
+    def fetch_page(self, url: str) -> Optional['BeautifulSoup']:
+        """Fetch and parse a webpage"""
+        result = self.fetch_response(url)
+        if result is None:
+            return None
+        return build_soup(result.content, self.parser_backend)
+
+    def _update_selector_profile(self, source_name: str, profile: Dict[str, str], winners: Dict[str, Counter]):
+        """Remember the most frequent winning selectors, persisting only on change"""
+        learned = dict(profile)
+        for field, counts in winners.items():
+            if counts:
+                learned[field] = counts.most_common(1)[0][0]
+        if learned != profile:
+            self.selector_profiles[source_name] = learned
+            self.store.save_selector_profile(source_name, learned)
+            logging.info(f"Learned selector profile for {source_name}: {learned}")
+
+    def record_candidates(self, source_name: str, candidates: int):
+        """Count the candidate entries found on a source's page or feed"""
+        METRICS.inc('scraper_candidates_total', candidates, source=source_name)
+        self.record_stats(source_name, candidates=candidates)
+
+    def parse_generic_wordpress(self, soup: 'BeautifulSoup', source_name: str) -> List[StartupNews]:
+        """Generic parser for WordPress-based sites"""
+        return self.parse_wordpress_soup(soup, source_name).articles
+
+    def parse_wordpress_soup(self, soup: 'BeautifulSoup', source_name: str,
+                             watermark: Optional[Watermark] = None) -> ParsedPage:
+        """Parse a WordPress listing, skipping entries the watermark has seen"""
+        profile = self.selector_profiles.get(source_name, {})
+        page, candidates, winners = extract_wordpress_articles(
+            soup, source_name, self.sources[source_name]['url'], profile, self.match_launch_signal, watermark
+        )
+        self.record_candidates(source_name, candidates)
+        self._update_selector_profile(source_name, profile, winners)
+        return page
+
+    def _get_parse_pool(self) -> 'ProcessPoolExecutor':
+        """Start the parse worker pool on first use"""
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                # spawn rather than fork: forking a process that already runs
+                # fetch threads can deadlock the children on inherited locks
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self.parse_workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._parse_pool
+
+    def parse_html(self, content: bytes, source_name: str, source_config: Dict,
+                   watermark: Optional[Watermark] = None) -> ParsedPage:
+        """Parse a source's HTML page, in a worker process when enabled"""
+        parser = source_config['parser']
+        if parser != self.parse_generic_wordpress:
+            # Custom parsers return plain article lists and scan the whole page
+            articles = parser(build_soup(content, self.parser_backend), source_name)
+            for article in articles:
+                article.url = canonicalize_url(article.url)
+            return ParsedPage(articles=articles, item_urls=[article.url for article in articles])
+        if not self.parse_workers:
+            return self.parse_wordpress_soup(build_soup(content, self.parser_backend), source_name, watermark)
         
+        # Only the raw bytes go out and compact records come back; the soup
+        # never crosses the process boundary
+        profile = self.selector_profiles.get(source_name, {})
+        try:
+            page, candidates, winners = self._get_parse_pool().submit(
+                parse_wordpress_page, content, self.parser_backend, source_name, source_config['url'], profile, watermark
+            ).result()
+        except Exception as e:
+            logging.error(f"Error parsing {source_name} in worker: {e}")
+            return ParsedPage(articles=[])
+        self.record_candidates(source_name, candidates)
+        self._update_selector_profile(source_name, profile, winners)
+        page.articles = [StartupNews(*record) for record in page.articles]
+        page.unmatched = [StartupNews(*record) for record in page.unmatched]
+        return page
+
+    def parse_feed(self, content: bytes, feed_type: str, source_name: str,
+                   watermark: Optional[Watermark] = None) -> Optional[ParsedPage]:
+        """Parse an RSS/Atom or WordPress REST feed up to the watermark; None if it is unusable"""
+        try:
+            page, candidates = extract_feed_articles(content, feed_type, source_name, self.match_launch_signal,
+                                                     watermark)
+        except FEED_ERRORS as e:
+            logging.warning(f"Unusable {feed_type} feed for {source_name}: {e}")
+            return None
+        self.record_candidates(source_name, candidates)
+        return page
+
+    def discover_feed(self, source_name: str, source_config: Dict) -> Optional[Dict]:
+        """Probe a source for a feed that lists at least one post"""
+        base_url = source_config['url'].rstrip('/')
+        for feed_url, feed_type in ((base_url + '/feed/', 'rss'), (base_url + WP_JSON_POSTS_PATH, 'wp-json')):
+            result = self.fetch_response(feed_url, source_name)
+            if result is None:
+                continue
+            try:
+                items = parse_feed_items(result.content, feed_type)
+            except FEED_ERRORS as e:
+                logging.info(f"No {feed_type} feed for {source_name} at {feed_url}: {e}")
+                continue
+            if items:
+                logging.info(f"Discovered {feed_type} feed for {source_name}: {feed_url}")
+                self.store.save_source_feed(source_name, feed_url, feed_type)
+                return {'url': feed_url, 'type': feed_type}
+        logging.info(f"No structured feed for {source_name}, using HTML parser")
+        self.store.save_source_feed(source_name, None, None)
+        return None
+
+    def resolve_feed(self, source_name: str, source_config: Dict) -> Optional[Dict]:
+        """Return the source's configured or previously discovered feed"""
+        if 'feed' in source_config:
+            # Explicit config wins; 'feed': None disables the fast path
+            if not source_config['feed']:
+                return None
+            return {'url': source_config['feed'], 'type': source_config.get('feed_type', 'rss')}
+        known = self.source_feeds.get(source_name)
+        if known:
+            if known['url']:
+                return known
+            checked_at = datetime.fromisoformat(known['checked_at'])
+            if datetime.now() - checked_at < timedelta(days=FEED_REDISCOVERY_DAYS):
+                return None
+        feed = self.discover_feed(source_name, source_config)
+        self.source_feeds[source_name] = {
+            'url': feed['url'] if feed else None,
+            'type': feed['type'] if feed else None,
+            'checked_at': datetime.now().isoformat()
+        }
+        return feed
+
+    def fetch_and_parse(self, url: str, parse, source_name: str = 'unknown', trim: bool = False,
+                        kind: Optional[str] = None, watermark: Optional[Watermark] = None) -> Optional[ParsedPage]:
+        """Fetch url and parse it, reusing the previous parse on a 304"""
+        result = self.fetch_response(url, source_name, trim, kind)
+        if result is None:
+            return None
+        page = self._parsed_pages.get(url) if result.not_modified else None
+        if page is not None:
+            logging.info(f"{url} not modified, reusing parsed articles")
+            # The watermark has moved past what an earlier scan passed on;
+            # nothing new can follow an unchanged page
+            articles = [article for article in page.articles
+                        if watermark is None or not watermark.is_seen(article.url)]
+            return replace(page, articles=articles, reached_watermark=True)
+        start = time.perf_counter()
+        page = parse(result.content)
+        elapsed = time.perf_counter() - start
+        METRICS.observe('scraper_parse_seconds', elapsed, source=source_name)
+        self.record_stats(source_name, parse_s=elapsed)
+        if page is not None:
+            METRICS.inc('scraper_matches_total', len(page.articles), source=source_name)
+            self.record_stats(source_name, matches=len(page.articles))
+            # Tag the whole page in one pass before the archive and digest see it
+            self.gazetteer.annotate(page.articles + page.unmatched)
+            self.store.archive(page.articles + page.unmatched)
+            # The archive has the unmatched items; a 304 only needs the matches
+            self._parsed_pages[url] = replace(page, unmatched=[])
+        return page
+
+    def fetch_and_parse_pages(self, source_name: str, url: str, kind: str,
+                              parse: Callable[[bytes, Watermark], Optional[ParsedPage]]) -> Optional[List[StartupNews]]:
+        """Walk a listing's pages until reaching the source's watermark"""
+        watermark = self.watermarks.get(source_name) or Watermark()
+        max_pages = max(1, MAX_PAGES) if watermark else 1
+        # Custom parsers may read the whole page; the generic one stops at
+        # the first few article containers
+        trim = kind == 'html' and self.sources.get(source_name, {}).get('parser') == self.parse_generic_wordpress
+        articles, item_urls, newest = [], [], None
+        for number in range(1, max_pages + 1):
+            page = self.fetch_and_parse(
+                page_url(url, number, kind), lambda content: parse(content, watermark), source_name, trim, kind,
+                watermark
+            )
+            if page is None:
+                if number == 1:
+                    return None
+                break
+            articles.extend(page.articles)
+            item_urls.extend(page.item_urls)
+            newest = newest or page.newest
+            if page.reached_watermark or not page.item_urls:
+                break
+        new_items = sum(1 for url in dict.fromkeys(item_urls) if not watermark.is_seen(url))
+        self.record_stats(source_name, pages=number, new_items=new_items)
+        self._pending_watermarks[source_name] = watermark.advance(item_urls, newest)
         return articles
 
-    def scrape_all_sources(self) -> List[StartupNews]:
-        """Scrape all configured news sources"""
-        all_articles = []
+    def commit_watermarks(self):
+        """Persist the watermarks of the last scrape once its articles are sent"""
+        pending, self._pending_watermarks = self._pending_watermarks, {}
+        if pending:
+            self.store.save_watermarks(pending)
+            self.watermarks.update(pending)
+
+    def scrape_source(self, source_name: str, source_config: Dict) -> List[StartupNews]:
+        """Scrape a single news source and return its unsent articles"""
+        _log_context.source = source_name
+        if not self.source_health.allow(source_name):
+            logging.info(f"Skipping {source_name}: circuit open")
+            METRICS.inc('scraper_circuit_skips_total', source=source_name)
+            self.record_stats(source_name, circuit='open')
+            _log_context.source = None
+            return []
+        logging.info(f"Scraping {source_name}...")
+        ok = False
+        try:
+            articles = None
+            # Fast path: structured feeds are smaller and carry real dates
+            feed = self.resolve_feed(source_name, source_config)
+            if feed:
+                articles = self.fetch_and_parse_pages(
+                    source_name, feed['url'], feed['type'],
+                    lambda content, watermark: self.parse_feed(content, feed['type'], source_name, watermark)
+                )
+                if articles is None:
+                    logging.warning(f"Feed failed for {source_name}, falling back to HTML")
+                    self.source_feeds.pop(source_name, None)
+            if articles is None:
+                articles = self.fetch_and_parse_pages(
+                    source_name, source_config['url'], 'html',
+                    lambda content, watermark: self.parse_html(content, source_name, source_config, watermark)
+                )
+            if articles is not None:
+                ok = True
+                # Filter out already sent articles
+                sent_urls = self.store.filter_sent([article.url for article in articles])
+                new_articles = [article for article in articles if article.url not in sent_urls]
+                dedup_hits = len(articles) - len(new_articles)
+                METRICS.inc('scraper_dedup_hits_total', dedup_hits, source=source_name)
+                self.record_stats(source_name, dedup_hits=dedup_hits, new_articles=len(new_articles))
+                logging.info(f"Found {len(new_articles)} new articles from {source_name}")
+                return new_articles
+            logging.warning(f"Failed to fetch {source_name}")
+        except Exception as e:
+            logging.error(f"Error scraping {source_name}: {e}")
+        finally:
+            self.source_health.record(source_name, ok)
+            _log_context.source = None
+        return []
+
+    def iter_source_articles(self, progress: Optional[Callable] = None,
+                             sources: Optional[Dict[str, Dict]] = None) -> Iterator[Tuple[str, List[StartupNews]]]:
+        """Yield (source, new articles) as each source finishes"""
+        started = time.perf_counter()
+        with self._stats_lock:
+            self._current_run = {'started_at': datetime.now().isoformat(), 'sources': {}}
+        
+        sources = self.sources if sources is None else sources
+        total = len(sources)
+        counts = {'sources_done': 0, 'articles_found': 0}
+        counts_lock = threading.Lock()
         
-        for source_name, source_config in self.sources.items():
-            logging.info(f"Scraping {source_name}...")
+        def report(future):
+            if future.cancelled() or future.exception():
+                return
+            with counts_lock:
+                counts['sources_done'] += 1
+                counts['articles_found'] += len(future.result())
+                snapshot = dict(counts)
+            if progress:
+                progress(stage='scraping', sources_total=total, **snapshot)
+        
+        if progress:
+            progress(stage='scraping', sources_total=total, **counts)
+        remaining = iter(sources.items())
+        pending = deque()
+        found = 0
+        # Stories already queued for the digest count as seen this run
+        run_index = self.pending_index
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scrape') as executor:
+            def fill():
+                # Keep a couple of sources queued per worker so a slow head
+                # of line does not leave the pool idle
+                while len(pending) < self.max_workers * 2:
+                    try:
+                        source_name, source_config = next(remaining)
+                    except StopIteration:
+                        return
+                    future = executor.submit(self.scrape_source, source_name, source_config)
+                    future.add_done_callback(report)
+                    pending.append((source_name, future))
+            
+            try:
+                fill()
+                # Yield in source order so the digest ordering stays deterministic
+                while pending:
+                    source_name, future = pending.popleft()
+                    articles = self.cluster_near_duplicates(source_name, future.result(), run_index)
+                    fill()
+                    found += len(articles)
+                    yield source_name, articles
+            finally:
+                for _, future in pending:
+                    future.cancel()
+                elapsed = time.perf_counter() - started
+                METRICS.observe('scraper_run_seconds', elapsed)
+                self.store.save_source_health(self.source_health.states_for(sources))
+                with self._stats_lock:
+                    run = self._current_run
+                    run['duration_s'] = elapsed
+                    run['articles'] = found
+                    self.last_poll = run
+                    self._current_run = None
+
+    def cluster_near_duplicates(self, source_name: str, articles: List[StartupNews],
+                                run_index: MinHashIndex) -> List[StartupNews]:
+        """Drop near-copies of sent articles and cluster this run's near-copies"""
+        kept = []
+        near_duplicates = clustered = 0
+        for article in articles:
+            signature = article_signature(article)
+            sent = self.store.find_near_duplicate(signature, article.startup_name)
+            if sent:
+                near_duplicates += 1
+                logging.info(f"Skipping {article.url}: near-copy of sent {sent[0]} ({sent[1]:.2f})")
+                continue
+            match = run_index.find(signature, article.startup_name)
+            if match and match[0] == article.url:
+                # Same story listed twice on one page
+                continue
+            if match:
+                article.duplicate_of = match[0]
+                clustered += 1
+            else:
+                run_index.add(article.url, signature, article.startup_name)
+            kept.append(article)
+        METRICS.inc('scraper_near_duplicates_total', near_duplicates, source=source_name)
+        METRICS.inc('scraper_clustered_total', clustered, source=source_name)
+        self.record_stats(source_name, near_duplicates=near_duplicates, clustered=clustered)
+        return kept
+
+    def iter_new_articles(self, progress: Optional[Callable] = None,
+                          sources: Optional[Dict[str, Dict]] = None) -> Iterator[StartupNews]:
+        """Stream new articles from all sources as they become available"""
+        for _, articles in self.iter_source_articles(progress=progress, sources=sources):
+            yield from articles
+
+    def scrape_all_sources(self, progress: Optional[Callable] = None) -> List[StartupNews]:
+        """Scrape all configured news sources concurrently"""
+        return list(self.iter_new_articles(progress=progress))
+
+    def run_pipeline(self, consumers: List, progress: Optional[Callable] = None,
+                     sources: Optional[Dict[str, Dict]] = None) -> int:
+        """Feed every new article to each consumer as soon as its source completes"""
+        count = 0
+        try:
+            for article in self.iter_new_articles(progress=progress, sources=sources):
+                for consumer in consumers:
+                    consumer.add(article)
+                count += 1
+        finally:
+            for consumer in consumers:
+                consumer.close()
+        return count
+
+    def poll_sources(self, source_names: List[str], progress: Optional[Callable] = None) -> int:
+        """Scrape the given sources and queue their new articles"""
+        sources = {name: self.sources[name] for name in source_names if name in self.sources}
+        with self._run_lock:
+            previous = self.last_poll
             try:
-                soup = self.fetch_page(source_config['url'])
-                if soup:
-                    articles = source_config['parser'](soup, source_name)
-                    # Filter out already sent articles
-                    new_articles = [article for article in articles if not self.is_article_sent(article.url)]
-                    all_articles.extend(new_articles)
-                    logging.info(f"Found {len(new_articles)} new articles from {source_name}")
+                self.reload_gained_shards()
+                count = self.run_pipeline([PendingQueue(self.store)] + self.consumers, progress, sources)
+                # The articles are queued, so the listings can move past them
+                self.commit_watermarks()
+            finally:
+                # Reschedule every source, even when the poll never started
+                polled = self.last_poll['sources'] if self.last_poll is not previous else {}
+                now = time.time()
+                states = []
+                for source_name in sources:
+                    stats = polled.get(source_name, {})
+                    # Listings that were never read say nothing about the rates
+                    states.append(self.poll_scheduler.record(
+                        source_name, stats.get('new_items'), stats.get('new_articles', 0), now
+                    ))
+                    METRICS.inc('scraper_polls_total', source=source_name)
+                self.store.save_poll_states(states)
+        return count
+
+    def reload_gained_shards(self):
+        """Load the saved state of shards this worker has taken over"""
+        gained = self.coordinator.take_gained()
+        if not gained:
+            return
+        names = [name for name in self.sources if shard_of(name, self.coordinator.shards) in gained]
+        states = self.store.load_poll_states()
+        watermarks = self.store.load_watermarks()
+        health = self.store.load_source_health()
+        self.poll_scheduler.update({name: states[name] for name in names if name in states})
+        self.watermarks.update({name: watermarks[name] for name in names if name in watermarks})
+        self.source_health.update({name: health[name] for name in names if name in health})
+        logging.info(f"Took over shards {sorted(gained)}: {', '.join(names)}")
+
+    def poll_due_sources(self) -> int:
+        """Poll the sources the adaptive schedule says are due in this worker's shards"""
+        # A digest run in progress covers them; try again on the next tick
+        if not self._run_lock.acquire(blocking=False):
+            return 0
+        try:
+            due = self.poll_scheduler.due(accept=self.coordinator.owns)
+            if not due:
+                return 0
+            logging.info(f"Polling {len(due)} due sources: {', '.join(due)}")
+            count = self.poll_sources(due)
+            logging.info(f"Queued {count} new articles for the next digest")
+            return count
+        except Exception as e:
+            logging.error(f"Error polling sources: {e}")
+            return 0
+        finally:
+            self._run_lock.release()
+
+    def wait_for_shards(self, day: str, progress: Optional[Callable] = None):
+        """Hold the digest until every shard has been polled for day"""
+        deadline = time.monotonic() + DIGEST_WAIT
+        while True:
+            waiting, orphaned = self.coordinator.unpolled_shards(day)
+            if orphaned:
+                logging.info(f"Polling orphaned shards {orphaned}")
+                self.poll_sources(
+                    [name for name in self.sources if shard_of(name, self.coordinator.shards) in orphaned], progress
+                )
+                self.coordinator.mark_polled(day, orphaned)
+            if not waiting:
+                return
+            if time.monotonic() > deadline:
+                logging.warning(f"Sending the digest without shards {waiting}")
+                return
+            if progress:
+                progress(stage='waiting', shards_waiting=len(waiting))
+            time.sleep(1)
+
+    def cluster_pending(self, articles: List[StartupNews]) -> Tuple[List[StartupNews], List[StartupNews]]:
+        """Cluster the pending queue as a single run would have"""
+        index = MinHashIndex()
+        kept, dropped = [], []
+        for article in articles:
+            signature = article_signature(article)
+            sent = self.store.find_near_duplicate(signature, article.startup_name)
+            if sent:
+                logging.info(f"Dropping queued {article.url}: near-copy of sent {sent[0]} ({sent[1]:.2f})")
+                dropped.append(article)
+                continue
+            if not article.duplicate_of:
+                match = index.find(signature, article.startup_name)
+                if match:
+                    article.duplicate_of = match[0]
                 else:
-                    logging.warning(f"Failed to fetch {source_name}")
-                    
-                # Add small delay between requests to be respectful
-                time.sleep(1)
-                
-            except Exception as e:
-                logging.error(f"Error scraping {source_name}: {e}")
-        
-        return all_articles
+                    index.add(article.url, signature, article.startup_name)
+            kept.append(article)
+        return kept, dropped
+
+    def render_article_html(self, article: StartupNews, coverage: List[StartupNews] = ()) -> str:
+        """Render one article's digest fragment, listing other outlets' coverage"""
+        return self.digest_renderer.article_html(digest_key(article, coverage))
+
+    def render_digest_html(self, articles: List[StartupNews], fragments: Optional[List[str]] = None) -> str:
+        """Wrap rendered article fragments in the digest layout"""
+        if fragments is None:
+            fragments = [self.render_article_html(article) for article in articles]
+        return self.digest_renderer.html(fragments)
+
+    def build_digest(self, articles: List[StartupNews]) -> DigestBuilder:
+        """Cluster articles into digest entries with their fragments rendered"""
+        digest = DigestBuilder(self)
+        for article in articles:
+            digest.add(article)
+        return digest
 
     def generate_email_content(self, articles: List[StartupNews]) -> str:
         """Generate HTML email content"""
-        if not articles:
-            return """
-            <html>
-            <body>
-                <h2>🚀 African Startup Daily Digest</h2>
-                <p><strong>Date:</strong> {}</p>
-                <p>No new startup launches found today. Check back tomorrow!</p>
-            </body>
-            </html>
-            """.format(datetime.now().strftime('%B %d, %Y'))
-        
-        html_content = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .header {{ background-color: #2c3e50; color: white; padding: 20px; text-align: center; }}
-                .article {{ border: 1px solid #ddd; margin: 20px 0; padding: 15px; border-radius: 5px; }}
-                .article h3 {{ color: #2c3e50; margin-top: 0; }}
-                .source {{ background-color: #3498db; color: white; padding: 5px 10px; border-radius: 3px; font-size: 12px; }}
-                .date {{ color: #7f8c8d; font-size: 14px; }}
-                .description {{ margin: 10px 0; }}
-                .read-more {{ background-color: #e74c3c; color: white; padding: 8px 15px; text-decoration: none; border-radius: 3px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🚀 African Startup Daily Digest</h1>
-                <p><strong>Date:</strong> {datetime.now().strftime('%B %d, %Y')}</p>
-                <p>Latest Product & Service Launches from African Startups</p>
-            </div>
-            
-            <div style="padding: 20px;">
-                <p><strong>Found {len(articles)} new startup launches today!</strong></p>
-        """
-        
-        for article in articles:
-            html_content += f"""
-                <div class="article">
-                    <h3>{article.title}</h3>
-                    <p><span class="source">{article.source}</span> <span class="date">{article.date}</span></p>
-                    <div class="description">{article.description}</div>
-                    <a href="{article.url}" class="read-more" target="_blank">Read Full Story</a>
-                </div>
-            """
-        
-        html_content += """
-            </div>
-            
-            <div style="background-color: #ecf0f1; padding: 20px; text-align: center; margin-top: 40px;">
-                <p><em>This digest is automatically generated. Stay updated with the latest African startup ecosystem!</em></p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html_content
+        return self.build_digest(articles).html()
 
-    def send_email(self, articles: List[StartupNews], email_config: Dict):
+    def generate_text_content(self, articles: List[StartupNews]) -> str:
+        """Generate the plain-text alternative of the email"""
+        return self.build_digest(articles).text()
+
+    def send_email(self, articles: List[StartupNews], email_config: Dict, html_content: Optional[str] = None,
+                   text_content: Optional[str] = None):
         """Send email with scraped articles"""
+        import smtplib
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
         try:
             msg = MIMEMultipart('alternative')
             msg['From'] = email_config['sender_email']
             msg['To'] = ', '.join(email_config['recipients'])
-            msg['Subject'] = f"🚀 African Startup Digest - {datetime.now().strftime('%B %d, %Y')} ({len(articles)} launches)"
+            launches = sum(1 for article in articles if not article.duplicate_of)
+            msg['Subject'] = f"🚀 African Startup Digest - {datetime.now().strftime('%B %d, %Y')} ({launches} launches)"
             
-            # Create HTML content
-            html_content = self.generate_email_content(articles)
-            html_part = MIMEText(html_content, 'html')
+            # Create the content unless the pipeline already rendered it
+            if html_content is None or text_content is None:
+                rendered_html, rendered_text = self.build_digest(articles).build()
+                html_content = rendered_html if html_content is None else html_content
+                text_content = rendered_text if text_content is None else text_content
+            # Plain text first: clients show the last alternative they support
+            msg.attach(MIMEText(text_content, 'plain', 'utf-8'))
+            html_part = MIMEText(html_content, 'html', 'utf-8')
             msg.attach(html_part)
             
             # Send email
+            start = time.perf_counter()
             with smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port']) as server:
                 server.starttls()
                 server.login(email_config['sender_email'], email_config['sender_password'])
                 server.send_message(msg)
+            elapsed = time.perf_counter() - start
+            METRICS.observe('scraper_email_send_seconds', elapsed)
+            if self.last_run is not None:
+                self.last_run['email_send_s'] = elapsed
             
             logging.info(f"Email sent successfully to {len(email_config['recipients'])} recipients")
             
             # Mark articles as sent
-            for article in articles:
-                self.mark_article_sent(article)
+            self.mark_articles_sent(articles)
+            self.commit_watermarks()
                 
         except Exception as e:
             logging.error(f"Error sending email: {e}")
 
-    def daily_scrape_and_send(self, email_config: Dict):
+    def daily_scrape_and_send(self, email_config: Dict, progress: Optional[Callable] = None,
+                              scheduled: bool = False):
         """Main function to scrape and send daily digest"""
         logging.info("Starting daily scrape and send...")
         
         try:
-            # Scrape all sources
-            articles = self.scrape_all_sources()
-            
-            # Send email regardless of whether we found articles
-            self.send_email(articles, email_config)
+            with self._run_lock:
+                if scheduled:
+                    owns = self.coordinator.owns
+                    sources = self.poll_scheduler.due(accept=owns) if ADAPTIVE_POLLING else list(filter(owns, self.sources))
+                else:
+                    sources = list(self.sources)
+                self.poll_sources(sources, progress)
+                # Adaptive polls between digests only update last_poll
+                self.last_run = dict(self.last_poll or {})
+                if scheduled:
+                    day = datetime.now().date().isoformat()
+                    self.coordinator.mark_polled(day)
+                    if not self.coordinator.claim_digest(day):
+                        logging.info("Another worker is sending today's digest")
+                        if progress:
+                            progress(stage='done')
+                        return 0
+                    self.wait_for_shards(day, progress)
+                if self.coordinator.backend.shared:
+                    # Another worker may have sent the last digest
+                    self.store.load_near_duplicate_index()
+                articles, dropped = self.cluster_pending(self.store.load_pending())
+                if dropped:
+                    # Already covered by a sent story; take them off the queue
+                    self.mark_articles_sent(dropped)
+                html_content, text_content = self.build_digest(articles).build()
+                
+                # Send email regardless of whether we found articles
+                if progress:
+                    progress(stage='sending')
+                self.send_email(articles, email_config, html_content=html_content, text_content=text_content)
+            if progress:
+                progress(stage='done')
             
             logging.info(f"Daily digest completed. Found {len(articles)} new articles.")
             return len(articles)
@@ -512,16 +3801,79 @@ EMAIL_CONFIG = {
    	 'smtp_port': 587
     }
     
-# Initialize scraper
-global scraper_instance, email_config_global
-scraper_instance = AfricanStartupScraper()
+# The shared scraper is built on first use rather than at import, so the
+# web process can serve / and /status before the database is opened
+scraper_instance: Optional[AfricanStartupScraper] = None
+_scraper_lock = threading.Lock()
 email_config_global = EMAIL_CONFIG
+job_manager = JobManager()
+
+def get_scraper() -> AfricanStartupScraper:
+    """Return the process-wide scraper, creating it on first call"""
+    global scraper_instance
+    if scraper_instance is None:
+        with _scraper_lock:
+            if scraper_instance is None:
+                scraper_instance = AfricanStartupScraper()
+    return scraper_instance
+
+def replay_archive(since: datetime, until: datetime, workers: Optional[int] = None,
+                   sources: Optional[List[str]] = None, output: Optional[str] = None) -> Dict:
+    """Run archived responses through the current parser and classifier"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    store = ArticleStore(seen_index=False)
+    entries = store.archive_entries(since.timestamp(), until.timestamp(), sources)
+    profiles = store.load_selector_profiles()
+    # Batches stay within one WARC file so each task maps a single file
+    by_segment: Dict[str, List[Tuple]] = {}
+    for fetched_at, source, url, kind, segment, offset, length in entries:
+        by_segment.setdefault(segment, []).append((fetched_at, source, url, kind, offset, length))
+    batches = [
+        (os.path.join(RESPONSE_ARCHIVE_DIR, segment), rows[start:start + REPLAY_BATCH_SIZE])
+        for segment, rows in by_segment.items()
+        for start in range(0, len(rows), REPLAY_BATCH_SIZE)
+    ]
+    logging.info(f"Replaying {len(entries)} archived responses in {len(batches)} batches")
+    
+    started = time.perf_counter()
+    days: Dict[str, Dict] = {}
+    seen = set()
+    out = open(output, 'w', encoding='utf-8') if output else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = [
+                pool.submit(replay_batch, path, rows, HTML_PARSER_BACKEND, profiles) for path, rows in batches
+            ]
+            for future in futures:
+                for fetched_at, source, candidates, articles in future.result():
+                    day = datetime.fromtimestamp(fetched_at).date().isoformat()
+                    totals = days.setdefault(day, {'responses': 0, 'candidates': 0, 'articles': 0})
+                    totals['responses'] += 1
+                    totals['candidates'] += candidates
+                    for record in articles:
+                        article = StartupNews(*record)
+                        if (day, article.url) in seen:
+                            continue
+                        seen.add((day, article.url))
+                        totals['articles'] += 1
+                        if out:
+                            out.write(json.dumps(dict(asdict(article), day=day), ensure_ascii=False) + '\n')
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - started
+    logging.info(f"Replayed {len(entries)} responses in {elapsed:.1f}s")
+    return {'responses': len(entries), 'seconds': elapsed, 'days': dict(sorted(days.items()))}
+
+def run_daily_digest(email_config: Dict, scheduled: bool = False, progress: Optional[Callable] = None):
+    """Job entry point: scrape and send with the shared scraper"""
+    return get_scraper().daily_scrape_and_send(email_config, progress, scheduled)
 
-# Add debug logging
-print(f"=== INITIALIZATION COMPLETE ===")
-print(f"scraper_instance: {scraper_instance}")
-print(f"email_config_global: {email_config_global}")
-print(f"=== END INITIALIZATION ===")
+def poll_due_sources():
+    """Scheduler tick: poll whichever sources are due with the shared scraper"""
+    get_scraper().poll_due_sources()
 
 # Flask web interface for manual triggers and cloud deployment
 app = Flask(__name__)
@@ -571,103 +3923,185 @@ def dashboard():
         </div>
     </body>
     </html>
-    """, sources_count=len(scraper_instance.sources) if scraper_instance else 0)
+    """, sources_count=len(scraper_instance.sources) if scraper_instance else len(NEWS_SOURCES))
 
 @app.route('/trigger')
 def trigger_scrape():
     """Manually trigger scraping"""
-    print("=== TRIGGER ENDPOINT CALLED ===")  # Debug log
+    # Run in the background so the request returns before the router timeout;
+    # the scraper itself is built by the job if this is the first use
+    job, created = job_manager.submit(run_daily_digest, email_config_global)
+    logging.info(f"Scrape job {job['id']} {'queued' if created else 'already in progress'}")
     
-    # Safely check if variables exist
-    try:
-        scraper_exists = scraper_instance is not None
-        print(f"scraper_instance exists: {scraper_exists}")
-    except NameError:
-        print("ERROR: scraper_instance is not defined at all!")
-        scraper_exists = False
-        
+    return jsonify({
+        'status': 'accepted',
+        'message': 'Manual scrape queued.' if created else 'A scrape is already in progress.',
+        'job_id': job['id'],
+        'coalesced': not created,
+        'status_url': f"/jobs/{job['id']}",
+        'job': job,
+        'timestamp': datetime.now().isoformat()
+    }), 202
+
+@app.route('/jobs')
+def list_jobs():
+    """List recent scrape jobs, newest first"""
+    return jsonify({'jobs': job_manager.recent(), 'timestamp': datetime.now().isoformat()})
+
+@app.route('/jobs/<job_id>')
+def get_job(job_id):
+    """Poll a scrape job's status and progress"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': f'Unknown job: {job_id}'}), 404
+    return jsonify(job)
+
+def build_fts_query(text: str) -> str:
+    """Quote each word of free text so FTS5 treats it as terms, not syntax"""
+    return ' '.join(f'"{word}"' for word in re.findall(r'\w+', text))
+
+@app.route('/search')
+def search_archive():
+    """Ranked full-text search over every archived article"""
+    text = request.args.get('q', '').strip()
+    query = text if request.args.get('raw') == '1' else build_fts_query(text)
+    if text and not query:
+        return jsonify({'status': 'error', 'message': 'Query has no searchable words'}), 400
     try:
-        email_exists = email_config_global is not None
-        print(f"email_config_global exists: {email_exists}")
-    except NameError:
-        print("ERROR: email_config_global is not defined at all!")
-        email_exists = False
+        limit = min(max(int(request.args.get('limit', SEARCH_PAGE_SIZE)), 1), SEARCH_MAX_PAGE_SIZE)
+        cursor = request.args.get('cursor')
+        after = None
+        if cursor:
+            rank, row_id = cursor.rsplit(':', 1)
+            after = (float(rank) if rank else None, int(row_id))
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'Invalid limit or cursor'}), 400
     
-    if scraper_exists and email_exists:
-        try:
-            print("Starting manual scrape...")  # Debug log
-            print(f"Scraper instance: {type(scraper_instance)}")  # Debug log
-            print(f"Email config: {email_config_global is not None}")  # Debug log
-            
-            # Call the scraping function with better error context
-            articles_count = scraper_instance.daily_scrape_and_send(email_config_global)
-            
-            print(f"Scrape completed successfully. Articles found: {articles_count}")  # Debug log
-            
-            return jsonify({
-                'status': 'success',
-                'message': f'Manual scrape completed. Found {articles_count} new articles.',
-                'articles_count': articles_count,
-                'timestamp': datetime.now().isoformat()
-            })
-            
-        except AttributeError as e:
-            error_msg = f"Scraper method error: {str(e)}"
-            print(f"ERROR - AttributeError: {error_msg}")
-            return jsonify({
-                'status': 'error',
-                'message': error_msg,
-                'error_type': 'AttributeError',
-                'timestamp': datetime.now().isoformat()
-            }), 500
-            
-        except Exception as e:
-            error_msg = f"Scraping failed: {str(e)}"
-            print(f"ERROR - General Exception: {error_msg}")
-            print(f"Exception type: {type(e)}")
-            return jsonify({
-                'status': 'error',
-                'message': error_msg,
-                'error_type': str(type(e).__name__),
-                'timestamp': datetime.now().isoformat()
-            }), 500
-    
-    # Handle missing components
-    missing_items = []
-    if not scraper_exists:
-        missing_items.append("scraper_instance")
-    if not email_exists:
-        missing_items.append("email_config_global")
-        
-    error_msg = f"Missing required components: {', '.join(missing_items)}"
-    print(f"ERROR - Missing components: {error_msg}")
+    try:
+        results = get_scraper().store.search_archive(
+            query or None,
+            source=request.args.get('source') or None,
+            matched_only=request.args.get('matched') == '1',
+            limit=limit,
+            after=after,
+            startup=request.args.get('startup') or None,
+            category=request.args.get('category') or None
+        )
+    except sqlite3.OperationalError as e:
+        return jsonify({'status': 'error', 'message': f'Invalid search query: {e}'}), 400
     
+    next_cursor = None
+    if len(results) == limit:
+        last = results[-1]
+        next_cursor = f"{last['rank']!r}:{last['id']}" if query else f":{last['id']}"
+    for result in results:
+        rank = result.pop('rank')
+        if rank is not None:
+            # bm25 is lower-is-better; expose a higher-is-better score
+            result['score'] = -rank
+    return jsonify({
+        'results': results,
+        'count': len(results),
+        'next_cursor': next_cursor,
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/startups')
+def list_startups():
+    """Archived coverage grouped by startup"""
+    try:
+        limit = min(max(int(request.args.get('limit', SEARCH_PAGE_SIZE)), 1), SEARCH_MAX_PAGE_SIZE)
+        days = request.args.get('days')
+        since = (datetime.now() - timedelta(days=int(days))).isoformat() if days else None
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'Invalid limit or days'}), 400
+    startups = get_scraper().store.archive_startups(request.args.get('category') or None, since, limit)
     return jsonify({
-        'status': 'error',
-        'message': error_msg,
-        'missing_components': missing_items,
+        'startups': startups,
+        'count': len(startups),
         'timestamp': datetime.now().isoformat()
-    }), 500
+    })
 
 @app.route('/status')
 def get_status():
     """Get current system status"""
     return jsonify({
         'status': 'running',
-        'sources_count': len(scraper_instance.sources) if scraper_instance else 0,
+        'sources_count': len(scraper_instance.sources) if scraper_instance else len(NEWS_SOURCES),
+        'scraper_initialized': scraper_instance is not None,
         'next_scheduled_run': '09:00 daily',
+        'http_cache': scraper_instance.response_cache.stats() if scraper_instance else None,
+        'last_run': scraper_instance.last_run if scraper_instance else None,
+        'last_poll': scraper_instance.last_poll if scraper_instance else None,
+        'adaptive_polling': ADAPTIVE_POLLING,
+        'poll_schedule': scraper_instance.poll_scheduler.snapshot() if scraper_instance else None,
+        'coordination': scraper_instance.coordinator.snapshot() if scraper_instance else None,
+        'source_health': scraper_instance.source_health.snapshot() if scraper_instance else None,
         'timestamp': datetime.now().isoformat()
     })
 
+@app.route('/metrics')
+def get_metrics():
+    """Expose scrape metrics in Prometheus text format"""
+    return METRICS.render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+def log_filters() -> Tuple[int, Optional[str]]:
+    """Read the level and source filters shared by the log endpoints"""
+    level = request.args.get('level', '').upper()
+    min_level = logging.getLevelName(level) if level else logging.NOTSET
+    if not isinstance(min_level, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return min_level, request.args.get('source') or None
+
 @app.route('/logs')
 def get_logs():
-    """Get recent logs"""
+    """Get recent logs, optionally filtered by level and source"""
+    try:
+        min_level, source = log_filters()
+        count = min(max(int(request.args.get('lines', LOG_TAIL_LINES)), 1), LOG_TAIL_MAX_LINES)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     try:
-        with open('startup_scraper.log', 'r') as f:
-            logs = f.readlines()[-50:]  # Last 50 lines
-        return '<pre>' + ''.join(logs) + '</pre>'
-    except:
+        entries = read_log_tail(count, min_level, source)
+    except OSError:
         return 'No logs available'
+    if request.args.get('format') == 'json':
+        return jsonify({'entries': entries, 'count': len(entries)})
+    lines = [
+        ' - '.join(part for part in (entry.get('ts'), entry.get('level'), entry.get('message')) if part)
+        for entry in entries
+    ]
+    return '<pre>' + html.escape('\n'.join(lines)) + '</pre>'
+
+@app.route('/logs/stream')
+def stream_logs():
+    """Follow the log live as Server-Sent Events; backlog=N replays recent entries first"""
+    try:
+        min_level, source = log_filters()
+        backlog = min(max(int(request.args.get('backlog', 0)), 0), LOG_TAIL_MAX_LINES)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    # Subscribe before replaying so nothing logged in between is missed
+    subscription = LOG_BROADCAST.subscribe(min_level, source)
+    
+    def events():
+        try:
+            if backlog:
+                for entry in read_log_tail(backlog, min_level, source):
+                    yield f"data: {json.dumps(entry, ensure_ascii=False)}\n\n"
+            while True:
+                try:
+                    entry = subscription.get(timeout=LOG_STREAM_HEARTBEAT)
+                except queue.Empty:
+                    # Comment lines keep proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {json.dumps(entry, ensure_ascii=False)}\n\n"
+        finally:
+            LOG_BROADCAST.unsubscribe(subscription)
+    
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 def run_scheduler():
     """Run the scheduler in a separate thread"""
@@ -677,25 +4111,40 @@ def run_scheduler():
 
 def main():
     """Main function with cloud deployment support"""
-    global scraper_instance, email_config_global
-    
     parser = argparse.ArgumentParser(description='African Startup News Scraper')
-    parser.add_argument('--mode', choices=['local', 'cloud'], default='local',
-                       help='Run mode: local (with scheduler) or cloud (web service)')
-    parser.add_argument('--port', type=int, default=5000,
+    parser.add_argument('--mode', choices=['local', 'cloud', 'replay'], default='local',
+                       help='Run mode: local (with scheduler), cloud (web service) or replay (archived days)')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 5000)),
                        help='Port for web service (cloud mode)')
+    parser.add_argument('--since', type=datetime.fromisoformat,
+                       help='First day to replay, YYYY-MM-DD (replay mode; default today)')
+    parser.add_argument('--until', type=datetime.fromisoformat,
+                       help='Last day to replay, YYYY-MM-DD (replay mode; default --since)')
+    parser.add_argument('--source', action='append', dest='sources',
+                       help='Replay only this source; may be repeated (replay mode)')
+    parser.add_argument('--workers', type=int, help='Replay worker processes (replay mode; default CPU count)')
+    parser.add_argument('--output', help='Write replayed launch articles here as JSON lines (replay mode)')
     
     args = parser.parse_args()
     
-    if args.mode == 'cloud':
+    if args.mode == 'replay':
+        if not RESPONSE_ARCHIVE_DIR:
+            parser.error('replay mode needs SCRAPER_RESPONSE_ARCHIVE set to the archive directory')
+        # Backtest the current parser and classifier against archived days
+        since = args.since or datetime.combine(datetime.now().date(), datetime.min.time())
+        until = (args.until or since) + timedelta(days=1)
+        print(json.dumps(replay_archive(since, until, args.workers, args.sources, args.output), indent=2))
+        
+    elif args.mode == 'cloud':
         # Cloud mode - run as web service (for deployment on Heroku, Railway, etc.)
         logging.info("Starting in CLOUD mode - web service")
         
         # Schedule daily execution
         schedule.every().day.at("09:00").do(
-            scraper_instance.daily_scrape_and_send, 
-            email_config=EMAIL_CONFIG
+            job_manager.submit, run_daily_digest, EMAIL_CONFIG, True, trigger='schedule'
         )
+        if ADAPTIVE_POLLING:
+            schedule.every(POLL_CHECK_SECONDS).seconds.do(poll_due_sources)
         
         # Start scheduler in background thread
         scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
@@ -710,16 +4159,17 @@ def main():
         
         # Schedule daily execution at 9:00 AM
         schedule.every().day.at("09:00").do(
-            scraper_instance.daily_scrape_and_send, 
-            email_config=EMAIL_CONFIG
+            job_manager.submit, run_daily_digest, EMAIL_CONFIG, True, trigger='schedule'
         )
+        if ADAPTIVE_POLLING:
+            schedule.every(POLL_CHECK_SECONDS).seconds.do(poll_due_sources)
         
         logging.info("African Startup Scraper started. Scheduled to run daily at 9:00 AM")
         logging.info("Press Ctrl+C to stop the scheduler")
         
         # Run once immediately for testing
-        print("Running initial scrape...")
-        scraper_instance.daily_scrape_and_send(EMAIL_CONFIG)
+        logging.info("Running initial scrape...")
+        run_daily_digest(EMAIL_CONFIG)
         
         # Keep the script running
         try:
@@ -730,15 +4180,4 @@ def main():
             logging.info("Scheduler stopped by user")
 
 if __name__ == "__main__":
-    import sys
-    import os
-    
-    # Check if running in cloud mode
-    if '--mode' in sys.argv and 'cloud' in sys.argv:
-        port = int(os.environ.get("PORT", 5000))
-        # Initialize scraper in cloud mode
-        scraper = AfricanStartupScraper()
-        app.run(host="0.0.0.0", port=port)
-    else:
-        # Local mode
-        main()
+    main()
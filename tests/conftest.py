@@ -0,0 +1,23 @@
+"""Shared fixtures: the scraper module, imported once, and a scratch working
+directory per test so databases and caches never leak between tests"""
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='session')
+def ss(tmp_path_factory):
+    os.chdir(tmp_path_factory.mktemp('import'))
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    import startup_scraper
+    return startup_scraper
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch, ss):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,21 @@
+"""A stand-in for the requests responses fetch_response reads"""
+import io
+
+
+class Response:
+    """A streamed response with the interface fetch_response reads"""
+    def __init__(self, status_code, body=b'', headers=None):
+        self.status_code = status_code
+        self.headers = {'Content-Type': 'text/html; charset=UTF-8', 'Content-Length': str(len(body)),
+                        **(headers or {})}
+        self.raw = io.BytesIO(body)
+        self.content = body
+
+    def iter_content(self, chunk_size):
+        return iter(lambda: self.raw.read(chunk_size), b'')
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,55 @@
+"""Source circuit breaker: closed, open after a streak of failures, then one
+probe at a time with a backoff that doubles per failed probe"""
+import pytest
+
+
+@pytest.fixture
+def monitor(ss):
+    return ss.SourceHealthMonitor({})
+
+
+def fail(monitor, times, now):
+    for _ in range(times):
+        state = monitor.record('techcabal', False, now=now)
+    return state
+
+
+def test_circuit_opens_after_the_threshold(ss, monitor):
+    fail(monitor, ss.BREAKER_THRESHOLD - 1, now=0)
+    assert monitor.allow('techcabal', now=1)
+    state = fail(monitor, 1, now=10)
+    assert state.open_until == 10 + ss.BREAKER_BASE_BACKOFF
+    assert not monitor.allow('techcabal', now=11)
+    assert monitor.allow('wamda', now=11)
+
+
+def test_one_probe_at_a_time_and_backoff_doubles(ss, monitor):
+    fail(monitor, ss.BREAKER_THRESHOLD, now=0)
+    probe_at = ss.BREAKER_BASE_BACKOFF
+    assert monitor.allow('techcabal', now=probe_at)
+    # While the probe is in flight other scrapes stay out
+    assert not monitor.allow('techcabal', now=probe_at + 1)
+    state = fail(monitor, 1, now=probe_at + 5)
+    assert state.open_until == probe_at + 5 + 2 * ss.BREAKER_BASE_BACKOFF
+
+
+def test_successful_probe_closes_the_circuit(ss, monitor):
+    fail(monitor, ss.BREAKER_THRESHOLD + 2, now=0)
+    state = monitor.record('techcabal', True, now=100)
+    assert state.error_streak == 0 and state.open_until == 0.0
+    assert monitor.allow('techcabal', now=101)
+    assert monitor.snapshot()[0]['circuit'] == 'closed'
+
+
+def test_backoff_is_capped(ss, monitor):
+    state = fail(monitor, ss.BREAKER_THRESHOLD + 100, now=0)
+    assert monitor.backoff(state) == ss.BREAKER_MAX_BACKOFF
+
+
+def test_timeout_follows_recent_latency(ss, monitor):
+    assert monitor.timeout('techcabal') == ss.FETCH_TIMEOUT
+    for _ in range(ss.LATENCY_MIN_SAMPLES):
+        monitor.observe_fetch('techcabal', 2.0)
+    assert monitor.timeout('techcabal') == 2.0 * ss.TIMEOUT_P95_MULTIPLIER
+    monitor.record('techcabal', False)
+    assert monitor.timeout('techcabal') == ss.FETCH_TIMEOUT
@@ -0,0 +1,81 @@
+"""Lease sharding: workers on one lease table split the shards between them,
+and a worker that dies or stops has its shards taken over"""
+import pytest
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(ss, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ss.time, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def workers(ss, workdir, clock):
+    def make(*names):
+        return [ss.Coordinator(ss.SQLiteLeaseBackend('leases.db'), worker_id=name, shards=8, ttl=60)
+                for name in names]
+    return make
+
+
+def heartbeat(*coordinators, rounds=3):
+    for _ in range(rounds):
+        for coordinator in coordinators:
+            coordinator.heartbeat()
+
+
+def test_workers_split_the_shards(ss, workers):
+    a, b, c = workers('a', 'b', 'c')
+    heartbeat(a, b)
+    assert a.owned | b.owned == set(range(8)) and not a.owned & b.owned
+    assert len(a.owned) == len(b.owned) == 4
+    for name in ss.NEWS_SOURCES:
+        assert a.owns(name) != b.owns(name)
+    # A joining worker gets a share as the others give theirs up
+    heartbeat(a, b, c)
+    assert a.owned | b.owned | c.owned == set(range(8))
+    assert not (a.owned & b.owned or a.owned & c.owned or b.owned & c.owned)
+    assert max(len(a.owned), len(b.owned), len(c.owned)) == 3
+
+
+def test_a_dead_workers_shards_are_taken_over(workers, clock):
+    a, b = workers('a', 'b')
+    heartbeat(a, b)
+    a.take_gained()
+    lost = set(b.owned)
+    # b stops renewing; its leases hold until they expire
+    clock.now += 30
+    heartbeat(a)
+    assert a.owned.isdisjoint(lost) and not a.take_gained()
+    clock.now += 31
+    heartbeat(a)
+    assert a.owned == set(range(8)) and a.take_gained() == lost
+
+
+def test_a_stopped_worker_hands_its_shards_back(workers):
+    a, b = workers('a', 'b')
+    heartbeat(a, b)
+    b.stop()
+    heartbeat(a, rounds=1)
+    assert a.owned == set(range(8)) and a.workers == 1
+
+
+def test_one_digest_per_day_and_unpolled_shards(workers, clock):
+    a, b = workers('a', 'b')
+    heartbeat(a, b)
+    a.mark_polled('2026-10-17')
+    unpolled = sorted(b.owned)
+    assert a.unpolled_shards('2026-10-17') == (unpolled, [])
+    # Once b lets go, its unpolled shards have no owner to poll them
+    b.stop()
+    assert a.unpolled_shards('2026-10-17') == ([], unpolled)
+    assert a.claim_digest('2026-10-17') and not b.claim_digest('2026-10-17')
+    assert b.claim_digest('2026-10-18')
@@ -0,0 +1,61 @@
+"""Digest rendering: article fields are html-escaped, coverage folds into its
+entry, and the plain-text part carries the same entries"""
+
+
+def article(ss, n, **fields):
+    values = dict(title=f'Startup {n} launches <Pay> & more', url=f'https://news.example/{n}?a=1&b=2',
+                  description='Built for "small" merchants', source='Techcabal', date='2026-10-17')
+    values.update(fields)
+    return ss.StartupNews(**values)
+
+
+def test_article_fields_are_escaped(ss, workdir):
+    scraper = ss.AfricanStartupScraper()
+    content = scraper.generate_email_content([article(ss, 1)])
+    assert '<h3>Startup 1 launches &lt;Pay&gt; &amp; more</h3>' in content
+    assert 'href="https://news.example/1?a=1&amp;b=2"' in content
+    assert '&quot;small&quot;' in content
+    assert 'Found 1 new startup launches today!' in content
+
+
+def test_coverage_joins_its_entry(ss, workdir):
+    scraper = ss.AfricanStartupScraper()
+    first = article(ss, 1, startup_name='Paystack', category='Fintech')
+    other = article(ss, 2, source='Disrupt Africa', duplicate_of=first.url)
+    digest = scraper.build_digest([first, other])
+    content = digest.html()
+    assert content.count('class="article"') == 1
+    assert 'Also covered by: <a href="https://news.example/2?a=1&amp;b=2" target="_blank">Disrupt Africa</a>' in content
+    assert '<span class="startup">Paystack · Fintech</span>' in content
+    text = digest.text()
+    assert 'Techcabal | 2026-10-17 | Paystack · Fintech' in text
+    assert 'Also covered by: Disrupt Africa (https://news.example/2?a=1&b=2)' in text
+    assert text.count('https://news.example/1?a=1&b=2') == 1
+
+
+def test_empty_digest(ss, workdir):
+    scraper = ss.AfricanStartupScraper()
+    assert 'No new startup launches found today' in scraper.generate_email_content([])
+    assert 'No new startup launches found today' in scraper.generate_text_content([])
+
+
+def test_entries_render_once_and_are_cached(ss, workdir):
+    scraper = ss.AfricanStartupScraper()
+    renderer = scraper.digest_renderer
+    first = article(ss, 1)
+    digest = scraper.build_digest([first, article(ss, 2, source='Disrupt Africa', duplicate_of=first.url),
+                                   article(ss, 3, source='Ventureburn', duplicate_of=first.url)])
+    # Coverage joining an entry does not render it; build renders it once
+    assert renderer.article_html.cache_info().currsize == 0
+    html_content, text_content = digest.build()
+    assert renderer.article_html.cache_info().misses == renderer.article_text.cache_info().misses == 1
+    assert scraper.generate_email_content(digest.articles) == html_content
+    assert renderer.article_html.cache_info().hits == 1
+
+
+def test_edited_entries_render_afresh(ss, workdir):
+    scraper = ss.AfricanStartupScraper()
+    entry = article(ss, 1)
+    before = scraper.generate_email_content([entry])
+    entry.title = 'Startup 1 launches in Ghana'
+    assert 'launches in Ghana' in scraper.generate_email_content([entry]) != before
@@ -0,0 +1,53 @@
+"""Feed discovery only settles on a real RSS/Atom document or REST listing
+that has posts in it"""
+import json
+
+import pytest
+
+from wordpress import SITE, wp_page, wp_post
+
+RSS = ('<?xml version="1.0"?><rss version="2.0"><channel><title>News</title>{items}</channel></rss>')
+ITEM = '<item><title>Startup launches app</title><link>{site}/2026/10/10/post-1/</link></item>'.format(site=SITE)
+SITEMAP = '<?xml version="1.0"?><urlset><url><loc>https://news.example/</loc></url></urlset>'
+
+
+def test_parse_xml_feed_rejects_other_xml(ss):
+    with pytest.raises(ValueError):
+        ss.parse_xml_feed(SITEMAP.encode())
+    assert len(ss.parse_xml_feed(RSS.format(items=ITEM).encode())) == 1
+
+
+@pytest.fixture
+def scraper(ss, workdir, monkeypatch):
+    scraper = ss.AfricanStartupScraper()
+    scraper.responses = {}
+    scraper.fetched = []
+
+    def fetch_response(url, source_name='unknown', trim=False, kind=None):
+        scraper.fetched.append((url, source_name))
+        content = scraper.responses.get(url)
+        return None if content is None else ss.FetchResult(url=url, content=content, status_code=200)
+
+    monkeypatch.setattr(scraper, 'fetch_response', fetch_response)
+    return scraper
+
+
+def probe(ss, scraper, rss=None, posts=None):
+    scraper.responses = {SITE + '/feed/': rss, SITE + ss.WP_JSON_POSTS_PATH: posts}
+    return scraper.discover_feed('news', {'url': SITE})
+
+
+@pytest.mark.parametrize('rss, posts', [
+    (RSS.format(items='').encode(), b'[]'),
+    (SITEMAP.encode(), None),
+    (wp_page([wp_post(1, 'Startup launches app')]), b'{"code": "rest_no_route"}')
+])
+def test_documents_without_posts_are_not_feeds(ss, scraper, rss, posts):
+    assert probe(ss, scraper, rss, posts) is None
+    assert all(source == 'news' for _, source in scraper.fetched)
+
+
+def test_feed_with_posts_is_discovered(ss, scraper):
+    assert probe(ss, scraper, RSS.format(items=ITEM).encode()) == {'url': SITE + '/feed/', 'type': 'rss'}
+    posts = json.dumps([{'title': {'rendered': 'Startup launches app'}, 'link': SITE + '/post-1/'}]).encode()
+    assert probe(ss, scraper, RSS.format(items='').encode(), posts)['type'] == 'wp-json'
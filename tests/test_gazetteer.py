@@ -0,0 +1,37 @@
+"""Startup tagging: names that are also common words need a sentence-case
+mention before they count"""
+import pytest
+
+
+@pytest.fixture(scope='module')
+def gazetteer(ss):
+    return ss.StartupGazetteer.load(index_path=None)
+
+
+@pytest.mark.parametrize('title, description, expected', [
+    ('Wave Of Layoffs Hits Kenyan Startups', 'Several startups in Nairobi cut staff this week.', ''),
+    ('The Roam Of Tech: Paystack unveils new product', '', 'Paystack'),
+    ('Stitch Raises Series A To Expand Payments API', 'The round was led by a US investor.', ''),
+    ('Field Intelligence Expands Across Nigeria', 'Field intelligence teams report...', ''),
+    ('Wave launches debit card in Senegal', '', ''),
+    ('Wave launches debit card in Senegal',
+     'Senegalese fintech Wave has launched a debit card for its mobile money users.', 'Wave'),
+    ("Senegal's Wave raises $200m", '', 'Wave'),
+    ('Wave Mobile Money Launches In Uganda', '', 'Wave'),
+    ('Paystack launches in Ghana', 'Paystack has launched in Ghana.', 'Paystack')
+])
+def test_startup_names(gazetteer, title, description, expected):
+    assert gazetteer.extract(title, description)[0] == expected
+
+
+def test_unconfirmed_name_leaves_the_sector(gazetteer):
+    assert gazetteer.extract('Bamboo Launches New Savings Product', 'A fintech savings app for investors.') == (
+        '', 'Fintech'
+    )
+
+
+def test_ambiguity_marks_survive_the_compiled_index(ss, workdir):
+    ss.StartupGazetteer.load(index_path='index.bin')
+    loaded = ss.StartupGazetteer.load(index_path='index.bin')
+    assert loaded.extract('Roam Of The Year', '') == ('', '')
+    assert loaded.extract('Kenyan startup Roam unveils an electric bus', '')[0] == 'Roam'
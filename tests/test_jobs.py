@@ -0,0 +1,69 @@
+"""Background jobs: triggers coalesce into a job in flight, except that the
+scheduled digest never folds into a manual run"""
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def jobs(ss):
+    manager = ss.JobManager()
+    manager.release = threading.Event()
+    manager.calls = []
+
+    def work(name, progress=None):
+        manager.calls.append(name)
+        progress(stage=name)
+        assert manager.release.wait(timeout=10)
+        return name
+
+    manager.work = work
+    yield manager
+    manager.release.set()
+    manager._executor.shutdown(wait=True)
+
+
+def wait(jobs, job):
+    jobs._executor.submit(lambda: None).result(timeout=10)
+    return jobs.get(job['id'])
+
+
+def test_manual_triggers_coalesce_into_the_running_job(jobs):
+    first, created = jobs.submit(jobs.work, 'manual')
+    second, created_again = jobs.submit(jobs.work, 'manual again')
+    assert created and not created_again and second['id'] == first['id']
+    jobs.release.set()
+    assert wait(jobs, first)['status'] == 'succeeded'
+    assert jobs.calls == ['manual']
+
+
+def test_scheduled_trigger_waits_behind_a_manual_job(jobs):
+    manual, _ = jobs.submit(jobs.work, 'manual')
+    scheduled, created = jobs.submit(jobs.work, 'schedule', trigger='schedule')
+    assert created and scheduled['status'] == 'queued' and scheduled['id'] != manual['id']
+    # Later triggers of either kind are covered by the queued run
+    assert jobs.submit(jobs.work, 'again', trigger='schedule')[0]['id'] == scheduled['id']
+    assert jobs.submit(jobs.work, 'again')[0]['id'] == scheduled['id']
+    jobs.release.set()
+    done = wait(jobs, scheduled)
+    assert done['status'] == 'succeeded' and done['result'] == 'schedule'
+    assert jobs.calls == ['manual', 'schedule']
+    assert jobs.get(manual['id'])['status'] == 'succeeded'
+
+
+def test_scheduled_trigger_coalesces_into_a_scheduled_job(jobs):
+    first, _ = jobs.submit(jobs.work, 'schedule', trigger='schedule')
+    second, created = jobs.submit(jobs.work, 'schedule again', trigger='schedule')
+    assert not created and second['id'] == first['id']
+
+
+def test_failed_jobs_record_the_error(ss):
+    manager = ss.JobManager()
+
+    def fail(progress=None):
+        raise ValueError('no sources')
+
+    job, _ = manager.submit(fail)
+    manager._executor.shutdown(wait=True)
+    assert manager.get(job['id'])['status'] == 'failed'
+    assert manager.get(job['id'])['error'] == 'ValueError: no sources'
@@ -0,0 +1,101 @@
+"""LaunchSignalClassifier must agree with LAUNCH_SIGNALS_PATTERN: same
+match/no-match answer and same match start on every text"""
+import random
+import re
+
+import pytest
+
+EDGE_CASES = [
+    'Startup launches app', 'LAUNCHED', 'relaunch', 'launchpad', 'launchesin', 'the launch',
+    'rollout', 'roll   out', 'rolls\tout', 'rolledout plan', 'roll-out', 'go live', 'golive', 'goeslive',
+    "we're live", 'were live', 'we re live', 'now\nlive', 'nowlive', 'now available', 'nowavailable',
+    'MVP live', 'mvplive', 'v1.0 release', 'v2.3.1 release', 'v10release', 'version 2 release',
+    'out of stealth', 'outof stealth', 'emerge from stealth', 'exits stealthmode', 'exit stealth  mode',
+    'breaks cover', 'sign-ups open', 'sign - - ups open', 'signup open', 'signups  open', 'open for signups',
+    'openforsignup', 'secures pre-seed', 'secure preseed', 'secures pre - seed', 'raises angel round',
+    'Kuda joins the Google accelerator', 'joins\n accelerator', 'joins x\naccelerator', 'join accelerators',
+    'joins the accelerator programme', 'rejoins accelerator', 'joinsaccelerator', 'joins  Y Combinator accelerator.',
+    'graduates from accelerator', 'demo day debut', 'demodaydebut', 'enters new market', 'expands to Kenya',
+    'expands toward', 'opens operations in Ghana', 'adds new platform', 'new product', 'new apps',
+    'announceing', 'announced', 'reveal', 'presentation', 'showcased', 'expansion', 'milestones',
+    'breakthrough', 'innovation', 'partnerships', 'collaboration', 'integration', 'upgradeing', 'upgrades',
+    'enhancements', 'improvement', 'beta test', 'beta tester', 'pilot program', 'pre-launch', 'prelaunch',
+    'pre - launch', 'coming soon', 'available now', 'shipper', 'shipping', 'un-veiled', 'unveiled',
+    'café launches', 'Naïve launch_', '_launch', 'launch_', '2launch', 'ſhip', 'İntroduce', 'KELVIN',
+    'JOINS the Techstars ACCELERATOR', 'joins accelerator', 'launch in', '', ' ', '\n'
+]
+
+WORDS = ['the', 'startup', 'Lagos', 'fintech', 'users', 'market', 'new', 'now', 'open', 'for', 'sign',
+         'ups', 'pre', 'seed', 'join', 'joins', 'accelerator', 'launch', 'launches', 'roll', 'out',
+         'go', 'live', 'v1', 'v2.0', 'release', 'beta', 'public', 'stealth', 'mode', 'exit', 'demo',
+         'day', 'debut', 'expands', 'to', 'toward', 'app', 'apps', 'were', "we're", 'secures', 'angel',
+         'round', 'raises', 'coming', 'soon', 'available', 'innovations', 'partner', 'x', '-', '_']
+SEPARATORS = [' ', ' ', ' ', '', '  ', '\n', '\t', '-', ', ', '. ', ' \n ', ' ']
+
+
+def random_text(rng, max_words=30):
+    """Assemble text from signal fragments with awkward spacing and casing"""
+    parts = []
+    for _ in range(rng.randint(0, max_words)):
+        word = rng.choice(WORDS)
+        roll = rng.random()
+        if roll < 0.1:
+            word = word.upper()
+        elif roll < 0.2:
+            word = word.title()
+        parts.append(word)
+        parts.append(rng.choice(SEPARATORS))
+    return ''.join(parts)
+
+
+@pytest.fixture(scope='module')
+def reference(ss):
+    return re.compile(ss.LAUNCH_SIGNALS_PATTERN, re.VERBOSE | re.IGNORECASE)
+
+
+@pytest.fixture(scope='module')
+def engine(ss):
+    return ss.LaunchSignalClassifier()
+
+
+def mismatches(reference, engine, texts):
+    """Texts where the classifier and the reference regex disagree"""
+    found = []
+    for text in texts:
+        expected = reference.search(text)
+        match = engine.match(text)
+        if (expected.start() if expected else None) != (match[0] if match else None):
+            found.append(text)
+    return found
+
+
+def spellings(phrase):
+    """Texts a LAUNCH_SIGNAL_PHRASES entry stands for: ' ' is \\s+, '_' is \\s*"""
+    yield phrase.replace('_', ' ')
+    yield phrase.replace('_', '')
+    yield phrase.replace(' ', '\n  ').replace('_', '\t').upper()
+
+
+def test_every_phrase_matches_both_ways(ss, reference, engine):
+    for signal, phrases in ss.LAUNCH_SIGNAL_PHRASES.items():
+        for phrase in phrases:
+            for text in spellings(phrase):
+                sentence = f'Kuda {text} today'
+                assert reference.search(sentence).start() == 5, sentence
+                assert engine.match(sentence)[0] == 5, sentence
+                assert engine.classify(sentence) == signal, sentence
+
+
+def test_edge_cases_agree(reference, engine):
+    assert mismatches(reference, engine, EDGE_CASES) == []
+
+
+def test_random_texts_agree(reference, engine):
+    rng = random.Random(1234)
+    assert mismatches(reference, engine, [random_text(rng) for _ in range(20000)]) == []
+
+
+def test_batches_agree_with_single_texts(engine):
+    rng = random.Random(99)
+    texts = EDGE_CASES + [random_text(rng) for _ in range(2000)]
+    assert engine.classify_batch(texts) == [engine.classify(text) for text in texts]
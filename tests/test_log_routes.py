@@ -0,0 +1,40 @@
+"""/logs and /logs/stream filtering over a log that still holds plain-text
+lines from before logs were structured"""
+import json
+
+import pytest
+
+LEGACY = '2024-05-01 09:00:00,123 - ERROR - Error scraping techcabal: timeout'
+
+
+@pytest.fixture
+def client(ss, workdir):
+    entries = [
+        {'ts': '2026-10-17T09:00:00.000', 'level': 'INFO', 'message': 'Scraping techcabal', 'source': 'techcabal'},
+        {'ts': '2026-10-17T09:00:01.000', 'level': 'ERROR', 'message': 'Error parsing techcabal: bad markup',
+         'source': 'techcabal'},
+        {'ts': '2026-10-17T09:00:02.000', 'level': 'Level 7', 'message': 'Custom level', 'source': None}
+    ]
+    with open(ss.LOG_PATH, 'w', encoding='utf-8') as f:
+        f.write(LEGACY + '\n' + ''.join(json.dumps(entry) + '\n' for entry in entries))
+    return ss.app.test_client()
+
+
+def test_level_filter_skips_legacy_lines(client):
+    response = client.get('/logs?level=error&format=json')
+    assert response.status_code == 200
+    assert [entry['message'] for entry in response.get_json()['entries']] == ['Error parsing techcabal: bad markup']
+
+
+def test_unfiltered_logs_keep_legacy_lines(client):
+    response = client.get('/logs?format=json')
+    assert response.status_code == 200
+    assert response.get_json()['entries'][0]['message'] == LEGACY
+
+
+def test_stream_backlog_skips_legacy_lines(client):
+    response = client.get('/logs/stream?level=error&backlog=10')
+    assert response.status_code == 200
+    first = next(response.response).decode()
+    response.close()
+    assert json.loads(first.removeprefix('data: '))['level'] == 'ERROR'
@@ -0,0 +1,57 @@
+"""Processes append to the log file and leave rotation to the host unless
+in-process rotation is asked for; spawned parse and replay workers that
+import the module log to the console alone"""
+import ast
+import json
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from conftest import REPO_ROOT
+
+
+def root_handler_types():
+    import startup_scraper  # noqa: F401 - configures logging on import
+    return [type(handler).__name__ for handler in logging.getLogger().handlers]
+
+
+def run(workdir, script, **env):
+    # pytest has handlers on the root logger already, so import in a clean interpreter
+    return subprocess.Popen([sys.executable, '-c', script], cwd=workdir, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, env=dict(os.environ, PYTHONPATH=REPO_ROOT, **env), text=True)
+
+
+def handler_types(workdir, **env):
+    script = 'import logging, startup_scraper; print([type(h).__name__ for h in logging.getLogger().handlers])'
+    return ast.literal_eval(run(workdir, script, **env).communicate()[0])
+
+
+def test_main_process_writes_the_log_file(ss, workdir):
+    assert handler_types(workdir) == ['WatchedFileHandler', 'StreamHandler', 'LogBroadcaster']
+    assert handler_types(workdir, SCRAPER_LOG_MAX_BYTES='1000000') == [
+        'RotatingFileHandler', 'StreamHandler', 'LogBroadcaster'
+    ]
+
+
+def test_processes_share_the_log_file_across_rotation(ss, workdir):
+    script = ('import logging, os, startup_scraper\n'
+              'for i in range(300):\n'
+              '    logging.info("record %d from %d", i, os.getpid())\n'
+              '    if i == 150 and os.environ["ROTATE"] == "1":\n'
+              '        os.rename(startup_scraper.LOG_PATH, startup_scraper.LOG_PATH + ".1")\n')
+    for process in [run(workdir, script, ROTATE=str(int(i == 0))) for i in range(4)]:
+        assert process.wait(timeout=60) == 0
+    lines = []
+    for name in ('startup_scraper.log', 'startup_scraper.log.1'):
+        with open(workdir / name, encoding='utf-8') as f:
+            lines += [json.loads(line) for line in f]
+    assert sum(1 for entry in lines if entry['message'].startswith('record ')) == 4 * 300
+
+
+def test_spawned_workers_attach_no_file_handler(ss):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        handlers = pool.submit(root_handler_types).result(timeout=60)
+    assert handlers == ['StreamHandler']
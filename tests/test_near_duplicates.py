@@ -0,0 +1,91 @@
+"""Near-duplicate matching: rewrites of one story match, different stories
+written from the same template or sharing a short headline do not"""
+import logging
+
+PAYSTACK = ('Paystack launches in Ghana with mobile money payments',
+            'Nigerian payments company Paystack has launched in Ghana, letting merchants accept mobile money '
+            'and card payments after receiving a licence from the Bank of Ghana last month.')
+PAYSTACK_SYNDICATED = ('Paystack expands to Ghana, adds mobile money payments',
+                       'Payments company Paystack has launched in Ghana, letting merchants accept mobile money '
+                       'and card payments after it received a licence from the Bank of Ghana.')
+KUDA = ('Kuda expands to Ghana after raising new funding',
+        'Digital bank Kuda is expanding to Ghana, offering free transfers and savings accounts to customers '
+        'after raising new funding from investors in London and Lagos.')
+KUDA_RETITLED = ('Kuda enters Ghana market with free transfers',
+                 'Digital bank Kuda is expanding to Ghana, offering free transfers and savings accounts to '
+                 'customers after raising funding from investors in London and Lagos.')
+TEMPLATE = ('{name} launches in Ghana',
+            '{name} has launched in Ghana, the company said on Tuesday, bringing its product to merchants '
+            'in Accra and Kumasi as competition among African startups grows.')
+
+
+def article(ss, title, description, url, startup_name=''):
+    return ss.StartupNews(title=title, url=url, description=description, source='Test',
+                          date='2026-10-01', startup_name=startup_name)
+
+
+def match(ss, first, second):
+    index = ss.MinHashIndex()
+    index.add(first.url, ss.article_signature(first), first.startup_name)
+    return index.find(ss.article_signature(second), second.startup_name)
+
+
+def test_rewrites_of_one_story_match(ss):
+    for (title, description), (other_title, other_description), name in (
+        (PAYSTACK, PAYSTACK_SYNDICATED, 'Paystack'),
+        (KUDA, KUDA_RETITLED, 'Kuda')
+    ):
+        first = article(ss, title, description, 'https://a.example/1', name)
+        second = article(ss, other_title, other_description, 'https://b.example/1', name)
+        assert match(ss, first, second)[0] == first.url
+
+
+def test_headlines_alone_never_match(ss):
+    for title, other in (('Paystack launches in Ghana', 'Flutterwave launches in Ghana'),
+                         ('Kuda expands to Ghana', 'Moniepoint expands to Ghana')):
+        assert ss.article_signature(article(ss, title, '', 'https://a.example/1')) == ()
+        assert match(ss, article(ss, title, '', 'https://a.example/1'),
+                     article(ss, other, '', 'https://b.example/1')) is None
+
+
+def test_template_stories_about_different_startups_do_not_match(ss):
+    title, description = TEMPLATE
+    first = article(ss, title.format(name='Paystack'), description.format(name='Paystack'),
+                    'https://a.example/1', 'Paystack')
+    second = article(ss, title.format(name='Flutterwave'), description.format(name='Flutterwave'),
+                     'https://b.example/1', 'Flutterwave')
+    assert match(ss, first, second) is None
+    first.startup_name = second.startup_name = ''
+    assert match(ss, first, second) is None
+
+
+def test_different_stories_about_one_startup_do_not_match(ss):
+    first = article(ss, *PAYSTACK, 'https://a.example/1', 'Paystack')
+    second = article(ss, 'Paystack lays off staff in Kenya',
+                     'Paystack has cut a third of its Kenyan team as the company refocuses on Nigeria and '
+                     'Ghana, according to people familiar with the matter.',
+                     'https://b.example/1', 'Paystack')
+    assert match(ss, first, second) is None
+
+
+def test_unknown_startups_need_a_closer_match(ss):
+    first = article(ss, *KUDA, 'https://a.example/1')
+    second = article(ss, *KUDA_RETITLED, 'https://b.example/1')
+    score = ss.MinHashIndex.similarity(ss.article_signature(first), ss.article_signature(second))
+    assert ss.NEAR_DUP_THRESHOLD <= score < ss.NEAR_DUP_UNNAMED_THRESHOLD
+    assert match(ss, first, second) is None
+    exact = article(ss, *KUDA, 'https://b.example/1')
+    assert match(ss, first, exact)[0] == first.url
+
+
+def test_sent_history_matches_are_logged(ss, workdir, caplog):
+    scraper = ss.AfricanStartupScraper()
+    sent = article(ss, *PAYSTACK, 'https://a.example/1', 'Paystack')
+    scraper.store.mark_sent([sent])
+    rewrite = article(ss, *PAYSTACK_SYNDICATED, 'https://b.example/1', 'Paystack')
+    other = article(ss, TEMPLATE[0].format(name='Flutterwave'), TEMPLATE[1].format(name='Flutterwave'),
+                    'https://c.example/1', 'Flutterwave')
+    with caplog.at_level(logging.INFO):
+        kept = scraper.cluster_near_duplicates('Test', [rewrite, other], ss.MinHashIndex())
+    assert kept == [other]
+    assert 'https://b.example/1' in caplog.text and 'https://a.example/1' in caplog.text
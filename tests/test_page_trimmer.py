@@ -0,0 +1,63 @@
+from wordpress import wp_page, wp_post
+
+
+def trim(ss, page, chunk_size=1024, **kwargs):
+    """Stream page through a trimmer the way read_body does"""
+    trimmer = ss.PageTrimmer(**kwargs)
+    kept = []
+    for start in range(0, len(page), chunk_size):
+        kept.append(trimmer.feed(page[start:start + chunk_size]))
+        if trimmer.done:
+            break
+    kept.append(trimmer.close())
+    return b''.join(kept), trimmer
+
+
+def parse(ss, page):
+    soup = ss.build_soup(page)
+    found, _, _ = ss.extract_wordpress_articles(soup, 'news', 'https://news.example', {}, lambda text: 'launch')
+    return [article.url for article in found.articles]
+
+
+def test_menu_items_do_not_count_as_articles(ss):
+    page = wp_page([wp_post(i, f'Startup {i} launches app') for i in range(15)], menu_items=35)
+    body, trimmer = trim(ss, page, limit=10)
+    assert trimmer.done
+    assert parse(ss, body) == parse(ss, page)[:len(parse(ss, body))]
+    assert len(parse(ss, body)) >= 10
+
+
+def test_trimmed_page_keeps_every_listed_article(ss):
+    page = wp_page([wp_post(i, f'Startup {i} launches app') for i in range(15)], menu_items=35, script_kb=64)
+    body, trimmer = trim(ss, page)
+    assert not trimmer.done
+    assert parse(ss, body) == parse(ss, page)
+    assert len(parse(ss, body)) == 15
+    assert trimmer.stripped_bytes > 64 * 1024
+
+
+def test_counting_starts_at_the_best_selector(ss):
+    widgets = ''.join(f'<div class="entry">Widget {i}</div>' for i in range(20))
+    page = wp_page([widgets] + [wp_post(i, f'Startup {i} launches app') for i in range(6)], menu_items=0)
+    body, trimmer = trim(ss, page, limit=5)
+    # Twenty .entry widgets come first, but <article> outranks them
+    assert trimmer.done
+    assert len(parse(ss, body)) == 5
+
+
+def test_learned_selector_is_counted(ss):
+    posts = ''.join(f'<div class="story-card"><h2><a href="https://news.example/s{i}/">Story {i}</a></h2></div>'
+                    for i in range(12))
+    page = wp_page([posts], menu_items=35)
+    _, trimmer = trim(ss, page, limit=5, selectors=['.story-card'])
+    assert trimmer.done
+    _, trimmer = trim(ss, page, limit=5, selectors=['main > div.story-card'])
+    assert not trimmer.done
+
+
+def test_empty_class_attributes_are_skipped(ss):
+    page = wp_page(['<a href="#" class="">Load more</a><div class=\'\'></div>'] +
+                   [wp_post(i, f'Startup {i} launches app') for i in range(15)])
+    body, trimmer = trim(ss, page, limit=10)
+    assert trimmer.done
+    assert len(parse(ss, body)) >= 10
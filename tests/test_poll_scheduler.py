@@ -0,0 +1,48 @@
+"""Adaptive polling: due sources stay scheduled until a poll is recorded,
+and polls between digests leave the digest run's stats alone"""
+import pytest
+
+from fake_http import Response
+from wordpress import SITE, wp_page, wp_post
+
+
+def test_due_sources_stay_queued_until_recorded(ss):
+    scheduler = ss.PollScheduler({}, ['a', 'b'])
+    now = scheduler.states['a'].next_due + 1
+    assert sorted(scheduler.due(now)) == ['a', 'b']
+    assert sorted(scheduler.due(now)) == ['a', 'b']
+    scheduler.record('a', 3, 1, now)
+    assert scheduler.due(now) == ['b']
+    assert scheduler.due(now, accept=lambda source: source != 'b') == []
+    assert scheduler.due(now) == ['b']
+
+
+@pytest.fixture
+def scraper(ss, workdir, monkeypatch):
+    scraper = ss.AfricanStartupScraper(per_host_delay=0)
+    scraper.sources = {'news': {'url': SITE + '/', 'feed': None, 'parser': scraper.parse_generic_wordpress}}
+    page = wp_page([wp_post(n, f'Startup {n} launches app', day=12) for n in range(1, 4)])
+    monkeypatch.setattr(scraper.session, 'get', lambda url, **kwargs: Response(200, page))
+    return scraper
+
+
+def test_a_poll_failing_before_it_starts_reschedules_its_sources(ss, scraper, monkeypatch):
+    def fail():
+        raise RuntimeError('lease database unavailable')
+
+    monkeypatch.setattr(scraper, 'reload_gained_shards', fail)
+    with pytest.raises(RuntimeError):
+        scraper.poll_sources(['news'])
+    state = scraper.poll_scheduler.states['news']
+    assert state.polls == 1 and state.item_rate is None
+    assert 'news' in scraper.poll_scheduler.due(state.next_due + 1)
+
+
+def test_polls_do_not_replace_the_digest_run(ss, scraper, monkeypatch):
+    monkeypatch.setattr(scraper, 'send_email', lambda *args, **kwargs: None)
+    scraper.daily_scrape_and_send({})
+    digest_run = scraper.last_run
+    assert digest_run['sources']['news']['new_articles'] == 3
+    assert scraper.poll_sources(['news']) == 0
+    assert scraper.last_run is digest_run
+    assert scraper.last_poll['sources']['news']['new_articles'] == 0
@@ -0,0 +1,74 @@
+"""The replay archive keeps the response as served while the parser gets
+the trimmed page"""
+import io
+
+import pytest
+
+from wordpress import SITE, wp_page, wp_post
+
+
+class FakeResponse:
+    """A streamed 200 response with the interface fetch_response reads"""
+    def __init__(self, body):
+        self.status_code = 200
+        self.headers = {'Content-Type': 'text/html; charset=UTF-8', 'Content-Length': str(len(body))}
+        self.raw = io.BytesIO(body)
+
+    def iter_content(self, chunk_size):
+        while True:
+            chunk = self.raw.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def make_scraper(ss, monkeypatch):
+    scraper = ss.AfricanStartupScraper(per_host_delay=0)
+    scraper.responses = []
+
+    def get(url, **kwargs):
+        scraper.responses.append(FakeResponse(scraper.page))
+        return scraper.responses[-1]
+
+    monkeypatch.setattr(scraper.session, 'get', get)
+    return scraper
+
+
+@pytest.fixture
+def scraper(ss, workdir, monkeypatch):
+    monkeypatch.setattr(ss, 'RESPONSE_ARCHIVE_DIR', 'response_archive')
+    return make_scraper(ss, monkeypatch)
+
+
+def archived(ss, scraper, url):
+    segment, offset, length = scraper.store.last_archive_entry(url)
+    with open(scraper.response_archive.path(segment), 'rb') as f:
+        return ss.read_warc_record(f.read(), offset, length)[1]
+
+
+def test_archive_keeps_the_untrimmed_response(ss, scraper):
+    scraper.page = wp_page([wp_post(i, f'Startup {i} launches app') for i in range(60)], script_kb=64)
+    result = scraper.fetch_response(SITE + '/', 'news', trim=True, kind='html')
+    assert len(result.content) < len(scraper.page) and b'<script>' not in result.content
+    assert archived(ss, scraper, SITE + '/') == scraper.page
+
+
+def test_untrimmed_fetch_archives_the_same_bytes(ss, scraper):
+    scraper.page = wp_page([wp_post(1, 'Startup launches app')])
+    result = scraper.fetch_response(SITE + '/feed/', 'news', kind='rss')
+    assert result.content == archived(ss, scraper, SITE + '/feed/') == scraper.page
+
+
+def test_archive_is_off_by_default_and_trimming_stops_early(ss, workdir, monkeypatch):
+    scraper = make_scraper(ss, monkeypatch)
+    assert scraper.response_archive is None
+    scraper.page = wp_page([wp_post(i, f'Startup {i} launches app') for i in range(200)], script_kb=64)
+    scraper.fetch_response(SITE + '/', 'news', trim=True, kind='html')
+    assert scraper.responses[0].raw.tell() < len(scraper.page)
+    assert not ss.os.path.exists('response_archive')
@@ -0,0 +1,45 @@
+"""The conditional-GET cache: validators in, least recently used out"""
+import itertools
+
+import pytest
+
+
+class Stored:
+    def __init__(self, body, etag):
+        self.headers = {'ETag': etag}
+        self.content = body
+
+
+@pytest.fixture
+def clock(ss, monkeypatch):
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(ss.time, 'time', lambda: float(next(ticks)))
+
+
+def test_least_recently_used_entries_are_evicted(ss, workdir, clock):
+    cache = ss.ResponseCache('cache.db', max_bytes=250)
+    for name in 'abc':
+        cache.store(f'https://news.example/{name}', Stored(b'x' * 100, f'"{name}"'))
+    # Storing c pushed the total past the cap, evicting a
+    assert cache.conditional_headers('https://news.example/a') == {}
+    assert cache.load('https://news.example/b') == b'x' * 100
+    cache.store('https://news.example/d', Stored(b'x' * 100, '"d"'))
+    assert cache.conditional_headers('https://news.example/c') == {}
+    assert cache.conditional_headers('https://news.example/b') == {'If-None-Match': '"b"'}
+    assert cache.stats()['size_bytes'] == 200
+
+
+def test_responses_without_validators_or_read_in_part_are_not_kept(ss, workdir):
+    cache = ss.ResponseCache('cache.db')
+    cache.store('https://news.example/a', Stored(b'page', '"a"'))
+    cache.store('https://news.example/a', Stored(b'page', '"a2"'), complete=False)
+    assert cache.conditional_headers('https://news.example/a') == {}
+    response = Stored(b'page', None)
+    response.headers = {}
+    cache.store('https://news.example/b', response)
+    assert cache.stats()['entries'] == 0
+
+
+def test_cache_database_allows_concurrent_workers(ss, workdir):
+    cache = ss.ResponseCache('cache.db')
+    assert cache.conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
@@ -0,0 +1,56 @@
+"""An unchanged listing (304) hands consumers nothing they already got"""
+import pytest
+
+from fake_http import Response
+from wordpress import SITE, wp_page, wp_post
+
+
+class Recorder:
+    def __init__(self):
+        self.added = []
+
+    def add(self, article):
+        self.added.append(article.url)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def scraper(ss, workdir, monkeypatch):
+    scraper = ss.AfricanStartupScraper(per_host_delay=0)
+    scraper.sources = {'news': {'url': SITE + '/', 'feed': None, 'parser': scraper.parse_generic_wordpress}}
+    page = wp_page([wp_post(n, f'Startup {n} launches app', day=12) for n in range(1, 6)])
+
+    def get(url, headers=None, **kwargs):
+        if (headers or {}).get('If-None-Match') == '"v1"':
+            return Response(304)
+        return Response(200, page, {'ETag': '"v1"'})
+
+    monkeypatch.setattr(scraper.session, 'get', get)
+    scraper.recorder = Recorder()
+    scraper.consumers = [scraper.recorder]
+    return scraper
+
+
+def test_unchanged_listing_adds_nothing_new(scraper):
+    assert scraper.poll_sources(['news']) == 5
+    assert scraper.poll_sources(['news']) == 0
+    assert len(scraper.recorder.added) == len(set(scraper.recorder.added)) == 5
+    assert len(scraper.store.load_pending()) == 5
+
+
+def test_trimmed_cache_entries_never_answer_a_full_fetch(ss, scraper):
+    url = SITE + '/'
+    trimmed = scraper.fetch_response(url, 'news', trim=True)
+    assert b'<script' not in trimmed.content
+    full = scraper.fetch_response(url, 'news')
+    assert full.status_code == 200 and b'<script' in full.content
+    again = scraper.fetch_response(url, 'news')
+    assert again.not_modified and again.content == full.content
+
+
+def test_pages_cut_off_at_the_byte_cap_are_not_cached(ss, scraper, monkeypatch):
+    monkeypatch.setattr(ss, 'STREAM_MAX_BYTES', 1024)
+    scraper.fetch_response(SITE + '/', 'news')
+    assert scraper.response_cache.conditional_headers(SITE + '/') == {}
@@ -0,0 +1,54 @@
+"""/search: keyset pages cover every match exactly once, and malformed input
+is a 400 rather than a server error"""
+import pytest
+
+
+@pytest.fixture
+def client(ss, workdir, monkeypatch):
+    scraper = ss.AfricanStartupScraper()
+    scraper.store.archive([
+        ss.StartupNews(title=f'Startup {n} launches {"payments" if n % 2 else "logistics"} app',
+                       url=f'https://news.example/{n}', description='Lagos ' * (n % 4 + 1),
+                       source='Techcabal' if n % 3 else 'Disrupt Africa', date='2026-10-17')
+        for n in range(1, 24)
+    ])
+    monkeypatch.setattr(ss, 'scraper_instance', scraper)
+    return ss.app.test_client()
+
+
+def collect(client, url):
+    urls, pages = [], 0
+    while url:
+        body = client.get(url).get_json()
+        urls.extend(result['url'] for result in body['results'])
+        pages += 1
+        url = body['next_cursor'] and f"{url.split('&cursor=')[0]}&cursor={body['next_cursor']}"
+    return urls, pages
+
+
+@pytest.mark.parametrize('query', ['q=lagos', 'q=payments', 'q=', 'q=lagos&source=Techcabal'])
+def test_pages_cover_every_match_once(client, query):
+    everything = client.get(f'/search?{query}&limit=100').get_json()['results']
+    urls, pages = collect(client, f'/search?{query}&limit=5')
+    assert sorted(urls) == sorted(result['url'] for result in everything)
+    assert len(urls) == len(set(urls)) and pages == len(everything) // 5 + 1
+
+
+def test_ranked_results_carry_a_descending_score(client):
+    results = client.get('/search?q=lagos&limit=100').get_json()['results']
+    scores = [result['score'] for result in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_free_text_is_not_fts_syntax(client):
+    response = client.get('/search?q=payments%20OR%20"app')
+    assert response.status_code == 200
+    assert response.get_json()['count'] == 0
+
+
+@pytest.mark.parametrize('query', ['q=%2A%2A', 'q=lagos&limit=ten', 'q=lagos&cursor=1.5',
+                                   'q=lagos&cursor=x:1', 'q=%22app&raw=1'])
+def test_bad_input_is_a_400(client, query):
+    response = client.get(f'/search?{query}')
+    assert response.status_code == 400
+    assert response.get_json()['status'] == 'error'
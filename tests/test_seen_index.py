@@ -0,0 +1,42 @@
+"""The Bloom filter in front of sent-url lookups: sized for its false-positive
+target, never a false negative, and rebuilt larger before it fills up"""
+import math
+
+import pytest
+
+
+@pytest.mark.parametrize('capacity, error_rate', [(1000, 0.01), (20000, 0.01), (20000, 0.001)])
+def test_false_positive_rate_meets_the_target(ss, capacity, error_rate):
+    index = ss.BloomFilter(capacity, error_rate)
+    assert index.num_hashes == round(-math.log2(error_rate))
+    assert len(index.bits) * 8 >= capacity * -math.log(error_rate) / math.log(2) ** 2
+    for n in range(capacity):
+        index.add(f'https://news.example/{n}')
+    assert all(f'https://news.example/{n}' in index for n in range(capacity))
+    probes = 50000
+    false_positives = sum(f'https://other.example/{n}' in index for n in range(probes))
+    assert false_positives / probes < 1.5 * error_rate
+
+
+def article(ss, n):
+    return ss.StartupNews(title=f'Startup {n} launches app', url=f'https://news.example/{n}',
+                          description='', source='Techcabal', date='2026-10-17')
+
+
+def test_filter_sent_answers_exactly(ss, workdir):
+    store = ss.ArticleStore('sent.db')
+    store.mark_sent([article(ss, n) for n in range(0, 100, 2)])
+    urls = [f'https://news.example/{n}' for n in range(100)]
+    assert store.filter_sent(urls) == set(urls[::2])
+    # A restart rebuilds the index from the database
+    assert ss.ArticleStore('sent.db').filter_sent(urls) == set(urls[::2])
+
+
+def test_full_index_is_rebuilt_larger(ss, workdir):
+    store = ss.ArticleStore('sent.db')
+    store.seen_index = ss.BloomFilter(capacity=10)
+    store.mark_sent([article(ss, n) for n in range(20)])
+    assert store.seen_index.capacity >= 100_000 and store.seen_index.count == 20
+    assert store.filter_sent([f'https://news.example/{n}' for n in range(25)]) == {
+        f'https://news.example/{n}' for n in range(20)
+    }
@@ -0,0 +1,52 @@
+"""Learned selector profiles: a source's winning selectors are remembered
+across restarts, tried first, and relearned when the markup changes"""
+import pytest
+
+from wordpress import SITE, wp_page, wp_post
+
+PAGE = wp_page([wp_post(n, f'Startup {n} launches app', day=12) for n in range(1, 6)])
+
+
+def make_scraper(ss):
+    scraper = ss.AfricanStartupScraper(per_host_delay=0)
+    scraper.sources = {'news': {'url': SITE + '/', 'feed': None, 'parser': scraper.parse_generic_wordpress}}
+    return scraper
+
+
+def parse(ss, scraper, page=PAGE):
+    return scraper.parse_generic_wordpress(ss.build_soup(page), 'news')
+
+
+@pytest.fixture
+def scraper(ss, workdir):
+    return make_scraper(ss)
+
+
+def test_profile_is_learned_and_survives_a_restart(ss, scraper):
+    assert len(parse(ss, scraper)) == 5
+    learned = {'article': 'article', 'title': 'h2', 'description': 'p', 'date': 'time'}
+    assert scraper.selector_profiles['news'] == learned
+    assert make_scraper(ss).selector_profiles['news'] == learned
+
+
+def test_unchanged_profile_is_not_rewritten(ss, scraper, monkeypatch):
+    parse(ss, scraper)
+    saved = []
+    monkeypatch.setattr(scraper.store, 'save_selector_profile', lambda *args: saved.append(args))
+    parse(ss, scraper)
+    assert saved == []
+
+
+def test_remembered_selector_is_tried_first(ss, scraper):
+    teaser = '<div class="post-item"><h3><a href="/2026/10/12/teaser/">Startup 9 launches wallet</a></h3></div>'
+    page = PAGE.replace(b'</main>', teaser.encode() + b'</main>')
+    scraper.selector_profiles['news'] = {'article': '.post-item'}
+    assert [article.title for article in parse(ss, scraper, page)] == ['Startup 9 launches wallet']
+
+
+def test_stale_selector_falls_back_and_is_relearned(ss, scraper):
+    scraper.selector_profiles['news'] = {'article': '.blog-post', 'title': '.headline'}
+    assert len(parse(ss, scraper)) == 5
+    assert scraper.selector_profiles['news']['article'] == 'article'
+    assert scraper.selector_profiles['news']['title'] == 'h2'
+    assert make_scraper(ss).selector_profiles['news']['article'] == 'article'
@@ -0,0 +1,68 @@
+"""The generic parser on the hand-built theme pages in
+benchmarks/fixtures/synthetic: what it extracts from each theme's markup, and
+that trimming a page never changes it. The pages are synthetic, so these pin
+down the parser's handling of known markup, not the live sites'"""
+import os
+import re
+
+import pytest
+
+from conftest import REPO_ROOT
+from test_page_trimmer import trim
+
+THEME_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'fixtures', 'synthetic')
+PAGES = sorted(name[:-5] for name in os.listdir(THEME_DIR) if name.endswith('.html'))
+
+
+def load(name):
+    with open(os.path.join(THEME_DIR, f'{name}.html'), 'rb') as f:
+        return f.read()
+
+
+def extract(ss, name, page):
+    site = ss.NEWS_SOURCES[name]
+    found, _, _ = ss.extract_wordpress_articles(ss.build_soup(page), name, site, {}, lambda text: 'launch')
+    return found.articles
+
+
+@pytest.mark.parametrize('name', PAGES)
+@pytest.mark.parametrize('limit', [5, 30])
+def test_trimming_keeps_what_the_parser_reads(ss, name, limit):
+    page = load(name)
+    body, _ = trim(ss, page, limit=limit)
+    assert b'<script>' not in body
+    full = [article.url for article in extract(ss, name, page)]
+    trimmed = [article.url for article in extract(ss, name, body)]
+    assert trimmed == full[:len(trimmed)]
+    assert len(trimmed) >= min(limit, len(full))
+
+
+@pytest.mark.parametrize('name, first_title', [
+    # A sticky post from two weeks ago leads the Genesis listing
+    ('disrupt_africa', 'South Africa’s Yoco cuts 20% of staff in restructuring'),
+    ('techcabal', 'Kuda expands to Ghana after receiving regulatory approval'),
+    ('ventureburn', 'Stitch Raises Series A Extension To Build Payments In South Africa')
+])
+def test_listing_entries(ss, name, first_title):
+    articles = extract(ss, name, load(name))
+    assert len(articles) == ss.MAX_ARTICLES_PER_PAGE
+    assert articles[0].title == first_title
+    site = ss.NEWS_SOURCES[name]
+    for article in articles:
+        # Relative links resolved, entities decoded, dates from <time datetime>
+        assert article.url.startswith(site + '/')
+        assert '&#' not in article.title and '&amp;' not in article.title
+        assert re.match(r'2026-10-\d\dT', article.date)
+        assert article.description
+    assert len({article.url for article in articles}) == len(articles)
+
+
+def test_launch_signals_on_theme_page_texts(ss):
+    reference = re.compile(ss.LAUNCH_SIGNALS_PATTERN, re.VERBOSE | re.IGNORECASE)
+    engine = ss.LaunchSignalClassifier()
+    for name in PAGES:
+        for article in ss.build_soup(load(name)).select('article, .td_module_flex'):
+            text = article.get_text(' ', strip=True)[:400]
+            expected = reference.search(text)
+            match = engine.match(text)
+            assert (expected.start() if expected else None) == (match[0] if match else None), text
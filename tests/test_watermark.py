@@ -0,0 +1,45 @@
+"""Watermarks: feeds stop at the previous run's items, HTML listings with
+sticky posts are read in full and only gate pagination"""
+import json
+
+from wordpress import SITE, wp_page, wp_post
+
+
+def url(number, day=10):
+    """Canonical url of wp_post(number, day=day)"""
+    return f'{SITE}/2026/10/{day:02d}/post-{number}'
+
+
+def extract(ss, page, watermark):
+    found, _, _ = ss.extract_wordpress_articles(ss.build_soup(page), 'news', SITE, {}, lambda text: 'launch',
+                                                watermark)
+    return found
+
+
+def test_sticky_posts_do_not_hide_new_entries(ss):
+    # Two old sticky posts lead the page, then today's news, then last run's
+    sticky = [wp_post(1, 'Old pinned story', day=1, sticky=True), wp_post(2, 'Old featured story', day=2, sticky=True)]
+    new = [wp_post(n, f'Startup {n} launches app', day=12) for n in range(10, 14)]
+    old = [wp_post(n, f'Startup {n} launches app', day=9) for n in range(5, 8)]
+    watermark = ss.Watermark([url(1, 1), url(2, 2)] + [url(n, 9) for n in range(5, 8)])
+    found = extract(ss, wp_page(sticky + new + old), watermark)
+    assert found.item_urls == [url(n, 12) for n in range(10, 14)]
+    assert found.reached_watermark
+
+
+def test_listing_ending_in_new_entries_asks_for_the_next_page(ss):
+    sticky = [wp_post(1, 'Old pinned story', day=1, sticky=True), wp_post(2, 'Old featured story', day=2, sticky=True)]
+    new = [wp_post(n, f'Startup {n} launches app', day=12) for n in range(10, 20)]
+    watermark = ss.Watermark([url(1, 1), url(2, 2)])
+    found = extract(ss, wp_page(sticky + new), watermark)
+    assert len(found.item_urls) == 10
+    assert not found.reached_watermark
+
+
+def test_feeds_stop_at_the_previous_run(ss):
+    items = [{'title': {'rendered': f'Startup {n} launches app'}, 'link': url(n), 'date': f'2026-10-{20 - n:02d}T08:00:00'}
+             for n in range(1, 8)]
+    watermark = ss.Watermark([url(3), url(4)])
+    found, _ = ss.extract_feed_articles(json.dumps(items).encode(), 'wp-json', 'news', lambda text: 'launch', watermark)
+    assert found.item_urls == [url(1), url(2)]
+    assert found.reached_watermark
@@ -0,0 +1,39 @@
+"""Builders for WordPress-style listing pages used across the tests"""
+
+SITE = 'https://news.example'
+
+
+def wp_menu(items=35):
+    """A primary navigation menu as WordPress renders it"""
+    kinds = ['menu-item-type-post_type menu-item-object-page', 'menu-item-type-taxonomy menu-item-object-category',
+             'menu-item-type-custom menu-item-object-custom']
+    entries = ''.join(
+        f'<li id="menu-item-{100 + i}" class="menu-item {kinds[i % 3]} menu-item-{100 + i}">'
+        f'<a href="{SITE}/section-{i}/">Section {i}</a></li>'
+        for i in range(items)
+    )
+    return f'<nav id="site-navigation" class="main-navigation"><ul id="primary-menu" class="menu">{entries}</ul></nav>'
+
+
+def wp_post(number, title, day=10, excerpt='', sticky=False):
+    """One listing entry of a WordPress theme's index loop"""
+    classes = f'post-{number} post type-post status-publish format-standard hentry' + (' sticky' if sticky else '')
+    return (
+        f'<article id="post-{number}" class="{classes}">'
+        f'<header class="entry-header"><h2 class="entry-title"><a href="{SITE}/2026/10/{day:02d}/post-{number}/">'
+        f'{title}</a></h2><time class="entry-date published" datetime="2026-10-{day:02d}T08:00:00+00:00">'
+        f'October {day}, 2026</time></header>'
+        f'<div class="entry-summary"><p>{excerpt or title}</p></div></article>'
+    )
+
+
+def wp_page(posts, menu_items=35, script_kb=0):
+    """A full homepage: head scripts, menu, the posts, then a footer"""
+    script = '<script>var s="' + 'x' * (script_kb * 1024) + '";</script>' if script_kb else ''
+    return (
+        '<!DOCTYPE html><html lang="en-US"><head><meta charset="UTF-8">'
+        '<script type="application/ld+json">{"@type": "WebSite"}</script>' + script +
+        '</head><body class="home blog"><header id="masthead" class="site-header">' + wp_menu(menu_items) +
+        '</header><main id="main" class="site-main">' + ''.join(posts) +
+        '</main><footer class="site-footer">' + wp_menu(8) + '</footer></body></html>'
+    ).encode('utf-8')